@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: conversão de linhas em migrate_table_data
+
+Compara o laço antigo (isinstance + upper() + teste em tupla por célula)
+com o conversor de linha compilado uma vez por tabela
+(MigrationTool.build_row_converter) em uma tabela larga.
+
+Uso:
+    python benchmarks/bench_row_converter.py [linhas] [colunas]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# A conversão não acessa o Oracle: o driver só é importado ao conectar
+from sqlite_oracle_migration import MigrationTool
+
+
+def legacy_convert(tool, rows, column_types):
+    """Laço de conversão original (por célula)"""
+    batch = []
+    for row in rows:
+        converted_row = []
+        for idx, val in enumerate(row):
+            if val is None:
+                converted_row.append(None)
+            elif isinstance(val, bytes):
+                converted_row.append(val)
+            elif column_types[idx].upper() in ('DATE', 'TIMESTAMP'):
+                if isinstance(val, str):
+                    converted_row.append(tool.parse_date(val))
+                else:
+                    converted_row.append(val)
+            else:
+                converted_row.append(val)
+        batch.append(converted_row)
+    return batch
+
+
+def compiled_convert(tool, rows, column_types):
+    """Conversor compilado por tabela"""
+    convert_row = tool.build_row_converter(tool.build_column_converters(column_types, rows))
+    if convert_row is None:
+        return rows
+    return [convert_row(row) for row in rows]
+
+
+def make_rows(num_rows, num_cols, date_cols):
+    """Gera linhas sintéticas: inteiros, reais, textos, NULLs e datas"""
+    column_types = []
+    for col in range(num_cols):
+        if col in date_cols:
+            column_types.append('DATE')
+        else:
+            column_types.append(('NUMBER', 'NUMBER', 'VARCHAR2(4000)')[col % 3])
+    
+    rows = []
+    for i in range(num_rows):
+        row = []
+        for col, col_type in enumerate(column_types):
+            if col_type == 'DATE':
+                row.append('2024-01-%02d' % (i % 28 + 1))
+            elif (i + col) % 17 == 0:
+                row.append(None)
+            elif col % 3 == 0:
+                row.append(i * col)
+            elif col % 3 == 1:
+                row.append(i * 1.5)
+            else:
+                row.append(f'texto {i} {col}')
+        rows.append(tuple(row))
+    return column_types, rows
+
+
+def bench(label, func, tool, rows, column_types):
+    start = time.perf_counter()
+    func(tool, rows, column_types)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<12} {elapsed:8.3f}s  {len(rows)/elapsed:>14,.0f} linhas/s")
+    return elapsed
+
+
+def main():
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    num_cols = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    tool = MigrationTool()
+    
+    scenarios = [
+        ('sem colunas de data', set()),
+        ('2 colunas de data', {num_cols // 3, 2 * num_cols // 3}),
+    ]
+    
+    print(f"Tabela larga: {num_rows:,} linhas x {num_cols} colunas")
+    for label, date_cols in scenarios:
+        column_types, rows = make_rows(num_rows, num_cols, date_cols)
+        print(f"\n• {label}")
+        legacy = bench('original', legacy_convert, tool, rows, column_types)
+        compiled = bench('compilado', compiled_convert, tool, rows, column_types)
+        print(f"  ganho: {legacy/compiled:,.1f}x")
+
+
+if __name__ == "__main__":
+    main()
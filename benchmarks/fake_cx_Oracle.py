@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Substituto em processo do cx_Oracle (e do python-oracledb) para os benchmarks
+
+Implementa apenas o que sqlite_oracle_migration.py usa (connect, SessionPool,
+makedsn, DatabaseError, constantes de tipo, cursores, LOBs e commit, além do
+pool assíncrono de create_pool_async usado com async_depth). Nada é
+gravado e nenhum registro é rejeitado: cada executemany é registrado em CALLS (SQL, linhas, bytes),
+cada LOB.write soma em LOB_BYTES, e ambos podem simular a latência de rede:
+
+    LATENCY  - segundos por ida e volta (execute, executemany, LOB.write, commit)
+    ROW_COST - segundos adicionais por linha enviada em executemany
+
+Uso:
+    import fake_cx_Oracle
+    fake_cx_Oracle.install(latency=0.002)   # antes de importar a ferramenta
+
+O módulo é registrado como cx_Oracle e como oracledb: [ORACLE] driver escolhe
+qual nome a ferramenta importa (a API assíncrona só é usada com oracledb).
+"""
+import asyncio
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager
+
+# Tipos de bind usados por setinputsizes/cursor.var
+STRING = 'STRING'
+NUMBER = 'NUMBER'
+DATETIME = 'DATETIME'
+TIMESTAMP = 'TIMESTAMP'
+BLOB = 'BLOB'
+CLOB = 'CLOB'
+BINARY = 'BINARY'
+NATIVE_FLOAT = 'NATIVE_FLOAT'
+
+LATENCY = 0.0
+ROW_COST = 0.0
+
+# Estado registrado (protegido por _lock)
+CALLS = []        # (sql, linhas, bytes) de cada executemany
+STATEMENTS = []   # SQL de cada execute
+TABLES = set()    # tabelas criadas
+COMMITS = 0
+LOB_BYTES = 0
+_lock = threading.Lock()
+
+
+class _Error:
+    def __init__(self, message: str, code: int = 0):
+        self.message = message
+        self.code = code
+        self.offset = 0
+
+
+class DatabaseError(Exception):
+    pass
+
+
+def makedsn(host, port, sid=None, service_name=None):
+    return f"{host}:{port}/{service_name or sid}"
+
+
+def _round_trip(rows: int = 0):
+    delay = LATENCY + ROW_COST * rows
+    if delay > 0:
+        time.sleep(delay)
+
+
+async def _round_trip_async(rows: int = 0):
+    delay = LATENCY + ROW_COST * rows
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+def _row_bytes(row) -> int:
+    total = 0
+    for value in row:
+        if value is None:
+            continue
+        if isinstance(value, (bytes, str)):
+            total += len(value)
+        else:
+            total += 8
+    return total
+
+
+class _Lob:
+    """Localizador de LOB devolvido pelo RETURNING: write apenas contabiliza"""
+
+    def write(self, data, offset=1):
+        global LOB_BYTES
+        _round_trip()
+        with _lock:
+            LOB_BYTES += len(data)
+
+
+class _Variable:
+    def __init__(self, arraysize: int):
+        self.arraysize = arraysize
+
+    def getvalue(self, pos: int = 0):
+        return [_Lob()]
+
+
+class Cursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.arraysize = 100
+        self._result = []
+
+    def execute(self, sql, params=None, **kwargs):
+        _round_trip()
+        upper = sql.strip().upper()
+        with _lock:
+            STATEMENTS.append(sql)
+
+        if upper.startswith('CREATE TABLE'):
+            with _lock:
+                TABLES.add(sql.split()[2])
+            self._result = []
+        elif upper.startswith('DROP TABLE'):
+            name = sql.split()[2]
+            with _lock:
+                if name not in TABLES:
+                    raise DatabaseError(_Error(f"ORA-00942: table or view does not exist ({name})", 942))
+                TABLES.discard(name)
+            self._result = []
+        elif 'FROM USER_TABLES' in upper:
+            self._result = [(1 if params and params[0] in TABLES else 0,)]
+        elif upper.startswith('SELECT'):
+            # Consultas de conferência (MIN/MAX, hashes por bloco): tabela vazia no Oracle
+            self._result = [] if 'GROUP BY' in upper else [(None, None)]
+        else:
+            self._result = []
+        return self
+
+    def executemany(self, sql, rows, **kwargs):
+        rows = list(rows)
+        _round_trip(len(rows))
+        size = sum(_row_bytes(row) for row in rows)
+        with _lock:
+            CALLS.append((sql, len(rows), size))
+
+    def getbatcherrors(self):
+        return []
+
+    def setinputsizes(self, *args, **kwargs):
+        pass
+
+    def var(self, type_, size=0, arraysize=1, **kwargs):
+        return _Variable(arraysize)
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        result, self._result = self._result, []
+        return result
+
+    def close(self):
+        pass
+
+
+class Connection:
+    def __init__(self, *args, **kwargs):
+        self.kwargs = kwargs
+
+    def cursor(self):
+        return Cursor(self)
+
+    def commit(self):
+        global COMMITS
+        _round_trip()
+        with _lock:
+            COMMITS += 1
+
+    def rollback(self):
+        _round_trip()
+
+    def close(self):
+        pass
+
+
+def connect(*args, **kwargs):
+    return Connection(*args, **kwargs)
+
+
+class SessionPool:
+    def __init__(self, *args, **kwargs):
+        self.kwargs = kwargs
+
+    def acquire(self):
+        return Connection()
+
+    def release(self, connection):
+        pass
+
+    def close(self, force=False):
+        pass
+
+
+def create_pool(*args, **kwargs):
+    return SessionPool(*args, **kwargs)
+
+
+def is_thin_mode() -> bool:
+    return True
+
+
+class AsyncCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    async def executemany(self, sql, rows, **kwargs):
+        rows = list(rows)
+        await _round_trip_async(len(rows))
+        size = sum(_row_bytes(row) for row in rows)
+        with _lock:
+            CALLS.append((sql, len(rows), size))
+
+    def getbatcherrors(self):
+        return []
+
+    def setinputsizes(self, *args, **kwargs):
+        pass
+
+
+class AsyncConnection:
+    def cursor(self):
+        return AsyncCursor(self)
+
+    async def commit(self):
+        global COMMITS
+        await _round_trip_async()
+        with _lock:
+            COMMITS += 1
+
+    async def rollback(self):
+        await _round_trip_async()
+
+
+class AsyncConnectionPool:
+    """Pool assíncrono: no máximo `max` conexões em uso ao mesmo tempo"""
+
+    def __init__(self, *args, **kwargs):
+        self.kwargs = kwargs
+        self._slots = asyncio.Semaphore(kwargs.get('max', 1))
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self._slots:
+            yield AsyncConnection()
+
+    async def close(self, force=False):
+        pass
+
+
+def create_pool_async(*args, **kwargs):
+    return AsyncConnectionPool(*args, **kwargs)
+
+
+def reset():
+    """Limpa o estado registrado entre cenários"""
+    global COMMITS, LOB_BYTES
+    with _lock:
+        CALLS.clear()
+        STATEMENTS.clear()
+        TABLES.clear()
+        COMMITS = 0
+        LOB_BYTES = 0
+
+
+def summary() -> dict:
+    """Totais registrados: chamadas executemany, linhas, bytes (lotes + LOBs) e commits"""
+    with _lock:
+        return {
+            'executemany_calls': len(CALLS),
+            'rows': sum(rows for _, rows, _ in CALLS),
+            'bytes': sum(size for _, _, size in CALLS) + LOB_BYTES,
+            'commits': COMMITS,
+        }
+
+
+def install(latency: float = 0.0, row_cost: float = 0.0):
+    """Registra este módulo como cx_Oracle e oracledb (chamar antes de importar a ferramenta)"""
+    global LATENCY, ROW_COST
+    LATENCY = latency
+    ROW_COST = row_cost
+    module = sys.modules[__name__]
+    sys.modules['cx_Oracle'] = module
+    sys.modules['oracledb'] = module
+    return module
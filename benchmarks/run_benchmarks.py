@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Suíte de benchmarks offline (sem Oracle)
+
+Cada cenário roda em um processo próprio, com o cx_Oracle substituído por
+benchmarks/fake_cx_Oracle.py e um banco gerado por benchmarks/synthetic_db.py,
+para que o pico de memória (RSS) seja medido isoladamente:
+
+    get_table_info       análise do esquema (catálogo sem cache) de muitas tabelas
+    map_type             map_sqlite_to_oracle_type sobre tipos variados
+    parse_date           DateColumnParser (formato inferido, cache e caminho rápido, como na
+                         carga) sobre datas em --date-format, ao lado da busca completa
+                         antiga (parse_date) nos mesmos valores
+    migrate_table_data   carga ponta a ponta (leitura, conversão e executemany)
+    sqlite_read          leitura pura do SQLite (SELECT * em lotes) com o perfil de [SQLITE]
+    export               --export ponta a ponta (arquivos delimitados, .ctl e tabela externa)
+
+O resultado pode ser gravado em JSON (--output) e comparado com o de outro
+commit (--compare).
+
+Uso:
+    python benchmarks/run_benchmarks.py [--scenarios a,b] [--rows N]
+           [--columns SPEC] [--date-format FMT] [--blob-size N]
+           [--latency MS] [--row-cost US] [--set chave=valor ...]
+           [--output resultado.json] [--compare anterior.json]
+
+--set grava opções extras na seção [MIGRATION] do arquivo de configuração
+usado em migrate_table_data, sqlite_read e export (ex: --set batch_size=5000 --set
+pipeline=true); SECAO.chave grava em outra seção (ex: --set SQLITE.mmap_size=0,
+--set ORACLE.driver=oracledb --set async_depth=4 para a escrita assíncrona).
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+
+from synthetic_db import DEFAULT_COLUMNS  # noqa: E402
+
+SCENARIOS = ('get_table_info', 'map_type', 'parse_date', 'migrate_table_data', 'sqlite_read', 'export')
+
+SAMPLE_TYPES = [
+    'INTEGER', 'INT', 'BIGINT', 'NUMBER(11,2)', 'DECIMAL(10,2)', 'REAL', 'DOUBLE PRECISION',
+    'VARCHAR(100)', 'NVARCHAR(50)', 'CHAR(1)', 'TEXT', 'CLOB', 'DATE', 'DATETIME',
+    'TIMESTAMP', 'BLOB', 'BOOLEAN', 'UNSIGNED BIG INT', '',
+]
+
+# Passo entre datas consecutivas: valores quase todos distintos (o cache só acerta
+# quando o formato descarta a hora)
+DATE_STEP = timedelta(seconds=3607)
+
+
+def peak_rss_mb() -> float:
+    """Pico de memória residente do processo atual (None se indisponível)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB; macOS reporta bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def write_config(path: str, database: str, options: dict):
+    sections = {
+        'SQLITE': {'database': database},
+        'ORACLE': {'user': 'bench', 'password': 'bench', 'host': 'localhost', 'port': '1521',
+                   'service_name': 'BENCH'},
+        'MIGRATION': {'mode': 'truncate', 'batch_size': '1000', 'schema_cache': '', 'create_indexes': 'false'},
+    }
+    for key, value in options.items():
+        section, _, name = key.rpartition('.')
+        sections.setdefault(section.upper() or 'MIGRATION', {})[name] = value
+    with open(path, 'w', encoding='utf-8') as cfg:
+        for section, values in sections.items():
+            cfg.write(f"[{section}]\n")
+            for key, value in values.items():
+                cfg.write(f"{key} = {value}\n")
+            cfg.write("\n")
+
+
+def open_tool(config_path: str):
+    """MigrationTool configurado e conectado (SQLite real, Oracle simulado)"""
+    from sqlite_oracle_migration import MigrationTool
+    tool = MigrationTool(config_path)
+    if not (tool.load_config() and tool.connect_sqlite() and tool.connect_oracle()
+            and tool.create_async_writer()):
+        raise RuntimeError(f"falha ao preparar a ferramenta com '{config_path}'")
+    return tool
+
+
+# ---------------------------------------------------------------------------
+# Cenários (executados no processo filho)
+# ---------------------------------------------------------------------------
+
+def bench_get_table_info(args, workdir):
+    tool = open_tool(os.path.join(workdir, 'bench.cfg'))
+    start = time.perf_counter()
+    tool.load_catalog()
+    tables = tool.catalog.table_names()
+    for table in tables:
+        tool.get_table_info(table)
+    elapsed = time.perf_counter() - start
+    tool.close_connections()
+    return {'items': len(tables), 'unit': 'tabelas', 'elapsed': elapsed}
+
+
+def bench_map_type(args, workdir):
+    from sqlite_oracle_migration import MigrationTool
+    tool = MigrationTool()
+    calls = args.iterations
+    types = SAMPLE_TYPES * (calls // len(SAMPLE_TYPES) + 1)
+    start = time.perf_counter()
+    for sqlite_type in types[:calls]:
+        tool.map_sqlite_to_oracle_type(sqlite_type)
+    return {'items': calls, 'unit': 'chamadas', 'elapsed': time.perf_counter() - start}
+
+
+def bench_parse_date(args, workdir):
+    from sqlite_oracle_migration import DateColumnParser, MigrationTool
+    tool = MigrationTool()
+    calls = args.iterations
+    base = datetime(2020, 1, 1)
+    values = [(base + DATE_STEP * i).strftime(args.date_format) for i in range(calls)]
+    
+    # Caminho da carga: um parser por coluna, formato inferido da amostra
+    parser = DateColumnParser(values[:100], tool.date_cache_size)
+    start = time.perf_counter()
+    for value in values:
+        parser(value)
+    elapsed = time.perf_counter() - start
+    
+    # Busca completa entre todos os formatos (parse_date), para comparação
+    start = time.perf_counter()
+    for value in values:
+        tool.parse_date(value)
+    legacy_elapsed = time.perf_counter() - start
+    return {'items': calls, 'unit': 'chamadas', 'elapsed': elapsed, 'legacy_elapsed': legacy_elapsed,
+            'date_format': parser.date_format, 'failures': parser.failures}
+
+
+def bench_migrate_table_data(args, workdir):
+    import fake_cx_Oracle
+    tool = open_tool(os.path.join(workdir, 'bench.cfg'))
+    tables = tool.get_sqlite_tables()
+    prepared = []
+    for table in tables:
+        columns, _ = tool.get_table_info(table)
+        oracle_types = [tool.map_sqlite_to_oracle_type(col[2] if col[2] else 'TEXT') for col in columns]
+        tool.create_oracle_table(table, columns, oracle_types)
+        tool.table_results[table] = {'rows': 0, 'elapsed': 0.0, 'ok': None}
+        prepared.append((table, oracle_types))
+    fake_cx_Oracle.reset()
+
+    start = time.perf_counter()
+    for table, oracle_types in prepared:
+        if not tool.migrate_table_data(table, oracle_types):
+            raise RuntimeError(f"migrate_table_data falhou em '{table}'")
+    elapsed = time.perf_counter() - start
+    tool.close_connections()
+
+    totals = fake_cx_Oracle.summary()
+    return {'items': totals['rows'], 'unit': 'linhas', 'elapsed': elapsed,
+            'bytes': totals['bytes'], 'batches': totals['executemany_calls'], 'commits': totals['commits']}
+
+
+def bench_sqlite_read(args, workdir):
+    tool = open_tool(os.path.join(workdir, 'bench.cfg'))
+    database = tool.config['SQLITE']['database']
+    rows = 0
+    start = time.perf_counter()
+    for table in tool.get_sqlite_tables():
+        cursor = tool.sqlite_conn.execute(f'SELECT * FROM "{table}"')
+        while True:
+            batch = cursor.fetchmany(tool.batch_size)
+            if not batch:
+                break
+            rows += len(batch)
+    elapsed = time.perf_counter() - start
+    tool.close_connections()
+    return {'items': rows, 'unit': 'linhas', 'elapsed': elapsed, 'read_bytes': os.path.getsize(database)}
+
+
+def bench_export(args, workdir):
+    from sqlite_oracle_migration import MigrationTool
+    tool = MigrationTool(os.path.join(workdir, 'bench.cfg'), export_only=True)
+    if not (tool.load_config() and tool.connect_sqlite()):
+        raise RuntimeError("falha ao preparar a exportação")
+    start = time.perf_counter()
+    if not tool.export():
+        raise RuntimeError("exportação com falhas")
+    elapsed = time.perf_counter() - start
+    rows = sum(stats['rows'] for stats in tool.table_results.values())
+    tool.close_connections()
+    written = sum(entry.stat().st_size for entry in os.scandir(tool.export_dir))
+    return {'items': rows, 'unit': 'linhas', 'elapsed': elapsed, 'written_bytes': written}
+
+
+SCENARIO_FUNCS = {
+    'get_table_info': bench_get_table_info,
+    'map_type': bench_map_type,
+    'parse_date': bench_parse_date,
+    'migrate_table_data': bench_migrate_table_data,
+    'sqlite_read': bench_sqlite_read,
+    'export': bench_export,
+}
+
+
+def run_worker(args):
+    """Processo filho: executa um cenário e imprime o resultado em JSON"""
+    import fake_cx_Oracle
+    fake_cx_Oracle.install(latency=args.latency / 1000.0, row_cost=args.row_cost / 1e6)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        result = SCENARIO_FUNCS[args.worker](args, args.workdir)
+    result['peak_rss_mb'] = peak_rss_mb()
+    print(json.dumps(result))
+
+
+# ---------------------------------------------------------------------------
+# Orquestração (processo principal)
+# ---------------------------------------------------------------------------
+
+def prepare_database(scenario, args, workdir):
+    db_path = os.path.join(workdir, 'bench.db')
+    command = [sys.executable, os.path.join(BENCH_DIR, 'synthetic_db.py'), db_path, '--seed', str(args.seed)]
+    if scenario == 'get_table_info':
+        command += ['--tables', str(args.meta_tables), '--rows', '10', '--columns', args.meta_columns]
+    elif scenario in ('migrate_table_data', 'sqlite_read', 'export'):
+        command += ['--tables', str(args.tables), '--rows', str(args.rows), '--columns', args.columns,
+                    '--date-format', args.date_format, '--blob-size', str(args.blob_size)]
+    else:
+        return
+    # Gerado em outro processo: no Linux o filho herda o pico de RSS do pai, e
+    # gerar BLOBs grandes aqui contaminaria a medição do cenário
+    subprocess.run(command, check=True, capture_output=True)
+    options = dict(option.split('=', 1) for option in args.set)
+    if scenario == 'export':
+        options.setdefault('export_dir', os.path.join(workdir, 'export'))
+    write_config(os.path.join(workdir, 'bench.cfg'), db_path, options)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_scenario(scenario, args, workdir):
+    prepare_database(scenario, args, workdir)
+    command = [sys.executable, os.path.abspath(__file__), '--worker', scenario, '--workdir', workdir]
+    command += ['--iterations', str(args.iterations), '--latency', str(args.latency),
+                '--row-cost', str(args.row_cost), '--date-format', args.date_format]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"cenário '{scenario}' falhou:\n{completed.stderr}")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result['rate'] = result['items'] / result['elapsed'] if result['elapsed'] > 0 else 0.0
+    return result
+
+
+def print_results(results, baseline=None):
+    print(f"\n  {'cenário':<20} {'itens':>12} {'tempo':>9} {'taxa':>24} {'pico RSS':>10}"
+          + ("  vs. anterior" if baseline else ''))
+    for scenario, result in results.items():
+        rss = f"{result['peak_rss_mb']:,.1f} MB" if result['peak_rss_mb'] is not None else '-'
+        line = (f"  {scenario:<20} {result['items']:>12,} {result['elapsed']:>8.3f}s "
+                f"{result['rate']:>12,.0f} {result['unit'] + '/s':<11} {rss:>10}")
+        previous = (baseline or {}).get(scenario)
+        if previous and previous.get('rate'):
+            line += f"  {(result['rate'] / previous['rate'] - 1) * 100:+6.1f}% taxa"
+            if previous.get('peak_rss_mb') and result['peak_rss_mb']:
+                line += f", {result['peak_rss_mb'] - previous['peak_rss_mb']:+,.1f} MB"
+        print(line)
+        if 'batches' in result:
+            print(f"  {'':<20} {result['batches']:,} lotes, {result['commits']:,} commits, "
+                  f"{result['bytes'] / 1024 / 1024:,.1f} MB enviados")
+        if 'read_bytes' in result and result['elapsed'] > 0:
+            print(f"  {'':<20} {result['read_bytes'] / 1024 / 1024:,.1f} MB lidos, "
+                  f"{result['read_bytes'] / 1024 / 1024 / result['elapsed']:,.1f} MB/s")
+        if result.get('legacy_elapsed'):
+            print(f"  {'':<20} formato inferido: {result['date_format'] or '-'}, "
+                  f"{result['failures']:,} não reconhecidas; busca completa (parse_date): "
+                  f"{result['items'] / result['legacy_elapsed']:,.0f} chamadas/s "
+                  f"({result['legacy_elapsed'] / result['elapsed']:,.1f}x mais lenta)")
+        if 'written_bytes' in result:
+            print(f"  {'':<20} {result['written_bytes'] / 1024 / 1024:,.1f} MB gravados")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks offline do sqlite_oracle_migration")
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help=f"cenários separados por vírgula (padrão: todos: {','.join(SCENARIOS)})")
+    parser.add_argument('--tables', type=int, default=1, help="tabelas em migrate_table_data e sqlite_read (padrão: 1)")
+    parser.add_argument('--rows', type=int, default=100000, help="registros por tabela (padrão: 100000)")
+    parser.add_argument('--columns', default=DEFAULT_COLUMNS, help=f"composição (padrão: {DEFAULT_COLUMNS})")
+    parser.add_argument('--date-format', default='%Y-%m-%d %H:%M:%S', help="formato strftime das datas")
+    parser.add_argument('--blob-size', type=int, default=256, help="bytes por BLOB (padrão: 256)")
+    parser.add_argument('--meta-tables', type=int, default=200, help="tabelas em get_table_info (padrão: 200)")
+    parser.add_argument('--meta-columns', default='int:10,real:5,text:10,date:5',
+                        help="composição das tabelas de get_table_info")
+    parser.add_argument('--iterations', type=int, default=200000,
+                        help="chamadas em map_type e datas em parse_date (padrão: 200000)")
+    parser.add_argument('--latency', type=float, default=0.0, help="latência simulada por ida e volta, em ms")
+    parser.add_argument('--row-cost', type=float, default=0.0, help="custo simulado por linha enviada, em µs")
+    parser.add_argument('--set', action='append', default=[], metavar='CHAVE=VALOR',
+                        help="opção extra da seção [MIGRATION] (pode repetir)")
+    parser.add_argument('--seed', type=int, default=42, help="semente do gerador aleatório")
+    parser.add_argument('--output', help="grava o resultado em JSON")
+    parser.add_argument('--compare', help="JSON de uma execução anterior para comparação")
+    parser.add_argument('--worker', choices=SCENARIOS, help=argparse.SUPPRESS)
+    parser.add_argument('--workdir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args)
+        return
+
+    scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenários desconhecidos: {', '.join(unknown)}")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as fp:
+            baseline = json.load(fp)['results']
+
+    revision = git_revision()
+    print(f"Benchmarks sqlite_oracle_migration @ {revision or '?'} (Python {platform.python_version()})")
+    print(f"  migrate_table_data/sqlite_read: {args.tables} x {args.rows:,} registros [{args.columns}], "
+          f"latência {args.latency} ms + {args.row_cost} µs/linha"
+          + (f", opções: {' '.join(args.set)}" if args.set else ''))
+
+    workdir = tempfile.mkdtemp(prefix='sqlite_oracle_bench_')
+    results = {}
+    try:
+        for scenario in scenarios:
+            results[scenario] = run_scenario(scenario, args, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            'revision': revision,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'parameters': {key: value for key, value in vars(args).items()
+                           if key not in ('worker', 'workdir', 'output', 'compare')},
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as fp:
+            json.dump(report, fp, indent=2, ensure_ascii=False)
+        print(f"\n✓ Resultado gravado em {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Gerador de bancos SQLite sintéticos para os benchmarks
+
+Cria `tables` tabelas com `rows` registros cada. A composição das colunas é
+dada por uma especificação "tipo:quantidade", por exemplo:
+
+    int:3,real:2,text:4,date:2,blob:1
+
+Tipos disponíveis (tipo declarado no SQLite entre parênteses):
+    int     (INTEGER)          real   (NUMBER(11,2))
+    text    (VARCHAR(100))     date   (DATE, no formato --date-format)
+    blob    (BLOB, --blob-size bytes)
+
+Uso:
+    python benchmarks/synthetic_db.py saida.db [--tables N] [--rows N]
+           [--columns SPEC] [--date-format FMT] [--blob-size N] [--seed N]
+"""
+import argparse
+import os
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+DEFAULT_COLUMNS = 'int:3,real:2,text:4,date:2,blob:1'
+
+COLUMN_TYPES = {
+    'int': 'INTEGER',
+    'real': 'NUMBER(11,2)',
+    'text': 'VARCHAR(100)',
+    'date': 'DATE',
+    'blob': 'BLOB',
+}
+
+
+def parse_column_spec(spec: str) -> List[Tuple[str, str]]:
+    """Converte "int:3,date:1" em [(nome_coluna, tipo), ...]"""
+    columns = []
+    for part in spec.split(','):
+        kind, _, count = part.strip().partition(':')
+        if kind not in COLUMN_TYPES:
+            raise ValueError(f"tipo de coluna desconhecido: '{kind}' (use {', '.join(COLUMN_TYPES)})")
+        for idx in range(int(count or 1)):
+            columns.append((f"{kind}_{idx + 1}", kind))
+    return columns
+
+
+def make_value(kind: str, rng: random.Random, date_format: str, blob_size: int, base_date: datetime):
+    # ~5% de NULLs em todas as colunas
+    if rng.random() < 0.05:
+        return None
+    if kind == 'int':
+        return rng.randint(-10**9, 10**9)
+    if kind == 'real':
+        return round(rng.uniform(-10**6, 10**6), 2)
+    if kind == 'text':
+        return ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz ') for _ in range(rng.randint(5, 60)))
+    if kind == 'date':
+        return (base_date + timedelta(seconds=rng.randint(0, 10 * 365 * 86400))).strftime(date_format)
+    return rng.randbytes(blob_size) if hasattr(rng, 'randbytes') else os.urandom(blob_size)
+
+
+def generate_database(path: str, tables: int = 1, rows: int = 10000, columns: str = DEFAULT_COLUMNS,
+                      date_format: str = '%Y-%m-%d %H:%M:%S', blob_size: int = 256,
+                      seed: int = 42) -> List[str]:
+    """Cria (ou recria) o banco sintético e retorna os nomes das tabelas"""
+    if os.path.exists(path):
+        os.remove(path)
+
+    rng = random.Random(seed)
+    base_date = datetime(2015, 1, 1)
+    column_defs = parse_column_spec(columns)
+    col_sql = ', '.join(f"{name} {COLUMN_TYPES[kind]}" for name, kind in column_defs)
+    placeholders = ', '.join('?' * len(column_defs))
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    names = []
+    for table_idx in range(tables):
+        table_name = f"bench_{table_idx + 1}"
+        names.append(table_name)
+        conn.execute(f"CREATE TABLE {table_name} (id INTEGER PRIMARY KEY, {col_sql})")
+
+        batch = []
+        for row_idx in range(rows):
+            batch.append(tuple(make_value(kind, rng, date_format, blob_size, base_date)
+                               for _, kind in column_defs))
+            if len(batch) >= 10000:
+                conn.executemany(f"INSERT INTO {table_name} ({', '.join(n for n, _ in column_defs)}) "
+                                 f"VALUES ({placeholders})", batch)
+                batch = []
+        if batch:
+            conn.executemany(f"INSERT INTO {table_name} ({', '.join(n for n, _ in column_defs)}) "
+                             f"VALUES ({placeholders})", batch)
+        conn.commit()
+    conn.close()
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera banco SQLite sintético para benchmarks")
+    parser.add_argument('path', help="arquivo SQLite de saída (recriado)")
+    parser.add_argument('--tables', type=int, default=1, help="quantidade de tabelas (padrão: 1)")
+    parser.add_argument('--rows', type=int, default=10000, help="registros por tabela (padrão: 10000)")
+    parser.add_argument('--columns', default=DEFAULT_COLUMNS, help=f"composição (padrão: {DEFAULT_COLUMNS})")
+    parser.add_argument('--date-format', default='%Y-%m-%d %H:%M:%S', help="formato strftime das datas")
+    parser.add_argument('--blob-size', type=int, default=256, help="bytes por BLOB (padrão: 256)")
+    parser.add_argument('--seed', type=int, default=42, help="semente do gerador aleatório")
+    args = parser.parse_args()
+
+    names = generate_database(args.path, args.tables, args.rows, args.columns,
+                              args.date_format, args.blob_size, args.seed)
+    print(f"✓ {args.path}: {len(names)} tabelas x {args.rows:,} registros "
+          f"({os.path.getsize(args.path) / 1024 / 1024:,.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -39,39 +39,1302 @@
 #############################################################################################
 Dependencies:
 configparser==7.2.0
-cx_Oracle==8.3.0
+cx_Oracle==8.3.0 ou oracledb>=2.0 (modo thin, sem Instant Client)
 
 """
 import sqlite3
+import asyncio
+import codecs
 import configparser
+import csv
+import glob
+import gzip
+import hashlib
+import heapq
+import importlib
+import json
 import sys
 import os
 import re
 import time
+import threading
+import queue
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from functools import lru_cache, wraps
+from pathlib import Path
 from typing import List, Tuple, Dict, Any
 
-try:
-    import cx_Oracle
-except ImportError:
-    print("ERRO: Biblioteca cx_Oracle não encontrada.")
-    print("Instale com: pip install cx_Oracle")
-    sys.exit(1)
+# Formatos comuns de data no SQLite (ordem da busca completa)
+DATE_FORMATS = [
+    '%Y-%m-%d',              # 2024-01-15
+    '%Y-%m-%d %H:%M:%S',     # 2024-01-15 14:30:00
+    '%Y-%m-%d %H:%M:%S.%f',  # 2024-01-15 14:30:00.123
+    '%d/%m/%Y',              # 15/01/2024
+    '%d/%m/%Y %H:%M:%S',     # 15/01/2024 14:30:00
+    '%Y/%m/%d',              # 2024/01/15
+    '%Y/%m/%d %H:%M:%S',     # 2024/01/15 14:30:00
+    '%d-%m-%Y',              # 15-01-2024
+    '%d-%m-%Y %H:%M:%S',     # 15-01-2024 14:30:00
+]
+
+# Formatos ISO aceitos por datetime.fromisoformat (caminho rápido em C)
+ISO_DATE_FORMATS = ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f')
+
+# Tokens strftime → grupos regex usados pelo parser de formato fixo
+_DATE_TOKEN_PATTERNS = {
+    '%Y': r'(?P<Y>\d{4})',
+    '%m': r'(?P<m>\d{1,2})',
+    '%d': r'(?P<d>\d{1,2})',
+    '%H': r'(?P<H>\d{1,2})',
+    '%M': r'(?P<M>\d{1,2})',
+    '%S': r'(?P<S>\d{1,2})',
+    '%f': r'(?P<f>\d{1,6})',
+}
+
+
+def make_fixed_format_parser(date_format: str):
+    """Cria parser rápido para um único formato de data
+    
+    Formatos ISO usam datetime.fromisoformat; os demais uma regex pré-compilada.
+    O parser gera ValueError quando o valor não segue o formato.
+    """
+    if date_format in ISO_DATE_FORMATS:
+        return datetime.fromisoformat
+    
+    pattern = re.escape(date_format)
+    for token, group in _DATE_TOKEN_PATTERNS.items():
+        pattern = pattern.replace(re.escape(token), group)
+    match = re.compile(pattern).fullmatch
+    
+    def parse(value: str) -> datetime:
+        m = match(value)
+        if m is None:
+            raise ValueError(value)
+        parts = m.groupdict()
+        micro = parts.get('f')
+        return datetime(int(parts['Y']), int(parts['m']), int(parts['d']),
+                        int(parts.get('H') or 0), int(parts.get('M') or 0),
+                        int(parts.get('S') or 0), int(micro.ljust(6, '0')) if micro else 0)
+    
+    return parse
+
+
+def parse_date_any(value: str):
+    """Busca completa: tenta todos os formatos conhecidos
+    
+    Retorna (datetime, formato) ou (valor original, None) se nenhum servir.
+    """
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt), fmt
+        except (ValueError, TypeError):
+            continue
+    return value, None
+
+
+def detect_date_format(samples: List[str]) -> str:
+    """Infere o formato predominante de uma amostra de valores da coluna"""
+    best_format, best_hits = None, 0
+    for fmt in DATE_FORMATS:
+        hits = 0
+        for value in samples:
+            try:
+                datetime.strptime(value, fmt)
+                hits += 1
+            except (ValueError, TypeError):
+                pass
+        if hits > best_hits:
+            best_format, best_hits = fmt, hits
+    return best_format
+
+
+class DateColumnParser:
+    """Parser de datas de uma coluna: formato inferido, cache LRU e busca completa
+    
+    O formato é detectado uma vez a partir da amostra; cada valor passa pelo
+    caminho rápido e só recorre à busca completa em caso de falha. Valores não
+    reconhecidos seguem como texto e são contados em `failures`.
+    """
+    
+    def __init__(self, samples: List[str] = None, cache_size: int = 4096):
+        self.failures = 0
+        self.date_format = detect_date_format(samples) if samples else None
+        self._fast = make_fixed_format_parser(self.date_format) if self.date_format else None
+        if cache_size > 0:
+            self._parse = lru_cache(maxsize=cache_size)(self._parse_uncached)
+        else:
+            self._parse = self._parse_uncached
+    
+    def __call__(self, value: str):
+        result = self._parse(value)
+        if result.__class__ is str:
+            self.failures += 1
+        return result
+    
+    def _parse_uncached(self, value: str):
+        if not value:
+            return None
+        
+        if self._fast is not None:
+            try:
+                return self._fast(value)
+            except ValueError:
+                pass
+        
+        result, fmt = parse_date_any(value)
+        if fmt and self._fast is None:
+            # Sem amostra: adota o primeiro formato reconhecido como caminho rápido
+            self.date_format = fmt
+            self._fast = make_fixed_format_parser(fmt)
+        return result
+
+
+# Tokenizador SQL usado pelo parser de DDL (comentários e espaços são descartados)
+_SQL_TOKEN_RE = re.compile(r"""
+    \s+ | --[^\n]* | /\*.*?(?:\*/|\Z)
+  | (?P<string>'(?:[^']|'')*')
+  | (?P<ident>"(?:[^"]|"")*"|`(?:[^`]|``)*`|\[[^\]]*\])
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<punct>.)
+""", re.VERBOSE | re.DOTALL)
+
+# Palavras que encerram o tipo declarado de uma coluna
+_COLUMN_CONSTRAINT_WORDS = {'CONSTRAINT', 'PRIMARY', 'NOT', 'NULL', 'UNIQUE', 'CHECK',
+                            'DEFAULT', 'COLLATE', 'REFERENCES', 'GENERATED', 'AS'}
+
+# Palavras que iniciam uma restrição de tabela (em vez de uma coluna)
+_TABLE_CONSTRAINT_WORDS = {'CONSTRAINT', 'PRIMARY', 'UNIQUE', 'CHECK', 'FOREIGN'}
+
+_OPEN, _CLOSE, _COMMA = ('punct', '('), ('punct', ')'), ('punct', ',')
+
+
+def tokenize_sql(sql: str) -> List[Tuple[str, str]]:
+    """Divide o SQL em tokens (tipo, valor) em uma única passada
+    
+    Identificadores entre aspas, crases ou colchetes voltam sem os delimitadores;
+    literais de texto mantêm as aspas simples.
+    """
+    tokens = []
+    for match in _SQL_TOKEN_RE.finditer(sql):
+        kind = match.lastgroup
+        if kind is None:
+            continue
+        value = match.group()
+        if kind == 'ident':
+            quote = value[0]
+            value = value[1:-1] if quote == '[' else value[1:-1].replace(quote * 2, quote)
+        tokens.append((kind, value))
+    return tokens
+
+
+def _is_word(token: Tuple[str, str], *words: str) -> bool:
+    return token[0] == 'word' and token[1].upper() in words
+
+
+def _read_group(tokens: List[Tuple[str, str]], start: int) -> Tuple[List[Tuple[str, str]], int]:
+    """Conteúdo do grupo entre parênteses que abre em `start` e índice após o fechamento"""
+    depth = 0
+    for idx in range(start, len(tokens)):
+        if tokens[idx] == _OPEN:
+            depth += 1
+        elif tokens[idx] == _CLOSE:
+            depth -= 1
+            if depth == 0:
+                return tokens[start + 1:idx], idx + 1
+    return tokens[start + 1:], len(tokens)
+
+
+def _split_top_level(tokens: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+    """Separa os tokens pelas vírgulas fora de parênteses"""
+    items, current, depth = [], [], 0
+    for token in tokens:
+        if token == _OPEN:
+            depth += 1
+        elif token == _CLOSE:
+            depth -= 1
+        elif token == _COMMA and depth == 0:
+            items.append(current)
+            current = []
+            continue
+        current.append(token)
+    if current:
+        items.append(current)
+    return items
+
+
+def _column_list(tokens: List[Tuple[str, str]]) -> List[str]:
+    """Nomes de uma lista de colunas, ignorando COLLATE/ASC/DESC"""
+    return [item[0][1] for item in _split_top_level(tokens) if item]
+
+
+def _render_tokens(tokens: List[Tuple[str, str]]) -> str:
+    """Reconstrói o texto dos tokens (NUMBER ( 10 , 2 ) → NUMBER(10,2))"""
+    text = ''
+    for kind, value in tokens:
+        if kind == 'ident':
+            value = '"' + value.replace('"', '""') + '"'
+        if text and kind != 'punct' and text[-1] not in '(,+-':
+            text += ' '
+        text += value
+    return text
+
+
+def _parse_column_def(tokens: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Analisa a definição de uma coluna: nome, tipo declarado e restrições"""
+    column = {'name': tokens[0][1], 'type': '', 'notnull': False, 'default': None,
+              'pk': False, 'unique': False, 'references': None}
+    
+    idx, count, type_tokens = 1, len(tokens), []
+    while idx < count and not _is_word(tokens[idx], *_COLUMN_CONSTRAINT_WORDS):
+        if tokens[idx] == _OPEN:
+            group, idx = _read_group(tokens, idx)
+            type_tokens += [_OPEN] + group + [_CLOSE]
+        else:
+            type_tokens.append(tokens[idx])
+            idx += 1
+    column['type'] = _render_tokens(type_tokens)
+    
+    while idx < count:
+        token = tokens[idx]
+        word = token[1].upper() if token[0] == 'word' else None
+        if word == 'CONSTRAINT':
+            idx += 2
+        elif word == 'PRIMARY':
+            column['pk'] = True
+            idx += 2
+        elif word == 'NOT' and idx + 1 < count and _is_word(tokens[idx + 1], 'NULL'):
+            column['notnull'] = True
+            idx += 2
+        elif word == 'UNIQUE':
+            column['unique'] = True
+            idx += 1
+        elif word == 'ON':
+            # ON CONFLICT <ação> / ON DELETE|UPDATE <ação> (SET NULL, NO ACTION...)
+            idx += 2
+            if idx < count and _is_word(tokens[idx], 'SET', 'NO'):
+                idx += 1
+            idx += 1
+        elif word == 'DEFAULT' and idx + 1 < count:
+            idx += 1
+            if tokens[idx] == _OPEN:
+                _, end = _read_group(tokens, idx)
+            elif tokens[idx][0] == 'punct' and tokens[idx][1] in '+-':
+                end = idx + 2
+            else:
+                end = idx + 1
+            column['default'] = _render_tokens(tokens[idx:end])
+            idx = end
+        elif word == 'REFERENCES' and idx + 1 < count:
+            reference = {'table': tokens[idx + 1][1], 'columns': []}
+            idx += 2
+            if idx < count and tokens[idx] == _OPEN:
+                group, idx = _read_group(tokens, idx)
+                reference['columns'] = _column_list(group)
+            column['references'] = reference
+        elif token == _OPEN:
+            # CHECK (...), AS (...), GENERATED ALWAYS AS (...)
+            _, idx = _read_group(tokens, idx)
+        else:
+            idx += 1
+    return column
+
+
+def _parse_table_constraint(tokens: List[Tuple[str, str]], schema: Dict[str, Any]):
+    """Analisa PRIMARY KEY / UNIQUE / FOREIGN KEY declarados no nível da tabela"""
+    idx = 2 if _is_word(tokens[0], 'CONSTRAINT') else 0
+    if idx >= len(tokens) or not _is_word(tokens[idx], 'PRIMARY', 'UNIQUE', 'FOREIGN'):
+        return  # CHECK e restrições sem efeito no catálogo
+    kind = tokens[idx][1].upper()
+    
+    while idx < len(tokens) and tokens[idx] != _OPEN:
+        idx += 1
+    group, idx = _read_group(tokens, idx)
+    columns = _column_list(group)
+    
+    if kind == 'PRIMARY':
+        schema['primary_key'] = columns
+    elif kind == 'UNIQUE':
+        schema['unique'].append(columns)
+    else:
+        reference = {'columns': columns, 'table': None, 'ref_columns': []}
+        while idx < len(tokens) and not _is_word(tokens[idx], 'REFERENCES'):
+            idx += 1
+        if idx + 1 < len(tokens):
+            reference['table'] = tokens[idx + 1][1]
+            if idx + 2 < len(tokens) and tokens[idx + 2] == _OPEN:
+                reference['ref_columns'] = _column_list(_read_group(tokens, idx + 2)[0])
+        schema['foreign_keys'].append(reference)
+
+
+def parse_create_table(ddl: str) -> Dict[str, Any]:
+    """Analisa um CREATE TABLE do SQLite em uma única passada de tokens
+    
+    Retorna as colunas (tipo declarado, NOT NULL, DEFAULT, PK, UNIQUE e
+    REFERENCES), a chave primária, as restrições UNIQUE, as chaves estrangeiras
+    e se a tabela é WITHOUT ROWID.
+    """
+    schema = {'columns': [], 'primary_key': [], 'unique': [], 'foreign_keys': [],
+              'without_rowid': False}
+    tokens = tokenize_sql(ddl or '')
+    if _OPEN not in tokens:
+        return schema
+    
+    body, end = _read_group(tokens, tokens.index(_OPEN))
+    for item in _split_top_level(body):
+        if not item:
+            continue
+        if item[0][0] == 'word' and item[0][1].upper() in _TABLE_CONSTRAINT_WORDS:
+            _parse_table_constraint(item, schema)
+        else:
+            schema['columns'].append(_parse_column_def(item))
+    
+    trailing = tokens[end:]
+    schema['without_rowid'] = any(_is_word(trailing[idx], 'WITHOUT') and _is_word(trailing[idx + 1], 'ROWID')
+                                  for idx in range(len(trailing) - 1))
+    
+    # Restrições declaradas na própria coluna
+    if not schema['primary_key']:
+        schema['primary_key'] = [col['name'] for col in schema['columns'] if col['pk']]
+    schema['unique'] += [[col['name']] for col in schema['columns'] if col['unique']]
+    schema['foreign_keys'] += [
+        {'columns': [col['name']], 'table': col['references']['table'],
+         'ref_columns': col['references']['columns']}
+        for col in schema['columns'] if col['references']
+    ]
+    return schema
+
+
+def expand_sqlite_sources(spec: str) -> List[str]:
+    """Arquivos de [SQLITE] database: caminho, lista (vírgulas ou linhas) e/ou glob
+    
+    Padrões glob ("sites/*.db") são expandidos em ordem alfabética; a ordem da
+    lista é mantida e arquivos repetidos entram uma só vez.
+    """
+    sources, seen = [], set()
+    for entry in re.split(r'[,\n]', spec):
+        entry = entry.strip()
+        if not entry:
+            continue
+        paths = sorted(glob.glob(entry)) if any(ch in entry for ch in '*?[') else [entry]
+        for path in paths:
+            if os.path.abspath(path) not in seen:
+                seen.add(os.path.abspath(path))
+                sources.append(path)
+    return sources
+
+
+class CheckpointJournal:
+    """Diário local (SQLite) de checkpoints para retomar migrações interrompidas
+    
+    Cada tabela (ou bloco de rowid, ou arquivo de origem) tem uma linha com status ('pending',
+    'partial', 'done'), o maior rowid já confirmado no Oracle e a quantidade de
+    registros confirmados. Cada gravação é uma transação SQLite própria, feita
+    logo após o commit correspondente no Oracle.
+    """
+    
+    WHOLE_TABLE = '*'
+    
+    def __init__(self, path: str, source_database: str, resume: bool = False):
+        self.path = path
+        self._lock = threading.Lock()
+        
+        if not resume and os.path.exists(path):
+            os.remove(path)
+        
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoint (
+                table_name  TEXT NOT NULL,
+                chunk       TEXT NOT NULL,
+                range_low   INTEGER,
+                range_high  INTEGER,
+                status      TEXT NOT NULL,
+                last_rowid  INTEGER,
+                rows        INTEGER NOT NULL DEFAULT 0,
+                updated_at  TEXT,
+                PRIMARY KEY (table_name, chunk)
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS run_info (
+                key   TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+        self.conn.execute("INSERT OR IGNORE INTO run_info VALUES ('source_database', ?)",
+                          (os.path.abspath(source_database),))
+        self.conn.commit()
+        
+        recorded_source = self.conn.execute(
+            "SELECT value FROM run_info WHERE key = 'source_database'").fetchone()[0]
+        if recorded_source != os.path.abspath(source_database):
+            raise ValueError(f"checkpoint '{path}' pertence a outro banco: {recorded_source}")
+    
+    @staticmethod
+    def chunk_key(rowid_range: Tuple[int, int] = None, source: str = None) -> str:
+        """Chave da tabela inteira ('*') ou do bloco ('low-high'), prefixada pelo arquivo de origem"""
+        key = CheckpointJournal.WHOLE_TABLE if rowid_range is None else f"{rowid_range[0]}-{rowid_range[1]}"
+        if source is None:
+            return key
+        return f"{os.path.abspath(source)}|{key}"
+    
+    def get(self, table_name: str, rowid_range: Tuple[int, int] = None, source: str = None) -> Dict[str, Any]:
+        """Retorna o checkpoint da tabela/bloco (ou None)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT status, last_rowid, rows FROM checkpoint WHERE table_name = ? AND chunk = ?",
+                (table_name, self.chunk_key(rowid_range, source))).fetchone()
+        if row is None:
+            return None
+        return {'status': row[0], 'last_rowid': row[1], 'rows': row[2]}
+    
+    def get_ranges(self, table_name: str) -> List[Tuple[int, int]]:
+        """Faixas de rowid registradas para a tabela (execução anterior)"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT range_low, range_high FROM checkpoint "
+                "WHERE table_name = ? AND chunk <> ? AND range_low IS NOT NULL ORDER BY range_low",
+                (table_name, self.WHOLE_TABLE)).fetchall()
+        return [tuple(row) for row in rows]
+    
+    def has_table(self, table_name: str) -> bool:
+        """Indica se a tabela já começou a ser carregada"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM checkpoint WHERE table_name = ? AND status <> 'pending' LIMIT 1",
+                (table_name,)).fetchone()
+        return row is not None
+    
+    def register(self, table_name: str, rowid_range: Tuple[int, int] = None, source: str = None):
+        """Registra tabela/bloco como pendente (se ainda não registrado)"""
+        low, high = rowid_range if rowid_range is not None else (None, None)
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO checkpoint (table_name, chunk, range_low, range_high, status) "
+                "VALUES (?, ?, ?, ?, 'pending')",
+                (table_name, self.chunk_key(rowid_range, source), low, high))
+            self.conn.commit()
+    
+    def save(self, table_name: str, rowid_range: Tuple[int, int], status: str,
+             last_rowid: int, rows: int, source: str = None):
+        """Grava o checkpoint em uma única transação (chamado após o commit no Oracle)"""
+        low, high = rowid_range if rowid_range is not None else (None, None)
+        with self._lock:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO checkpoint "
+                    "(table_name, chunk, range_low, range_high, status, last_rowid, rows, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (table_name, self.chunk_key(rowid_range, source), low, high, status, last_rowid, rows,
+                     datetime.now().isoformat(timespec='seconds')))
+    
+    def close(self):
+        self.conn.close()
+
+
+class SchemaCatalog:
+    """Catálogo do esquema SQLite: colunas, restrições, índices e contagens por tabela
+    
+    Montado com uma leitura de sqlite_master (DDL analisado por
+    parse_create_table, índices via PRAGMA index_list/index_info) e gravado em cache JSON junto com a impressão digital
+    do banco: caminho, tamanho e mtime do arquivo e do -wal. Enquanto ela não
+    mudar, as execuções seguintes reaproveitam o catálogo sem reanalisar o SQLite.
+    """
+    
+    VERSION = 2
+    
+    def __init__(self, database: str, cache_file: str = None):
+        self.database = os.path.abspath(database)
+        self.cache_file = cache_file
+        self.fingerprint = self.compute_fingerprint(self.database)
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        self.from_cache = False
+        self.dirty = False
+    
+    @staticmethod
+    def compute_fingerprint(database: str) -> List[int]:
+        """Tamanho e mtime (ns) do banco e do arquivo -wal"""
+        fingerprint = []
+        for path in (database, database + '-wal'):
+            if os.path.exists(path):
+                stat = os.stat(path)
+                fingerprint += [stat.st_size, stat.st_mtime_ns]
+            else:
+                fingerprint += [0, 0]
+        return fingerprint
+    
+    def _read_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_file, encoding='utf-8') as cache_fp:
+                cache = json.load(cache_fp)
+        except (OSError, ValueError):
+            return {}
+        return cache if cache.get('version') == self.VERSION else {}
+    
+    def load(self) -> bool:
+        """Carrega o catálogo do cache se o banco não mudou desde a gravação"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return False
+        entry = self._read_cache().get('databases', {}).get(self.database)
+        if not entry or entry.get('fingerprint') != self.fingerprint:
+            return False
+        
+        self.tables = entry['tables']
+        for info in self.tables.values():
+            info['columns'] = [tuple(col) for col in info['columns']]
+        self.from_cache = True
+        return True
+    
+    def build(self, conn: sqlite3.Connection):
+        """Lê todas as tabelas de sqlite_master e analisa cada DDL uma única vez"""
+        cursor = conn.cursor()
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
+        self.tables = {}
+        for table_name, ddl in cursor.fetchall():
+            schema = parse_create_table(ddl)
+            declared = {col['name'].lower(): col for col in schema['columns']}
+            
+            # PRAGMA define ordem e nomes das colunas; o DDL analisado fornece o tipo exato
+            # col é uma tupla: (cid, name, type, notnull, dflt_value, pk)
+            columns = []
+            quoted_name = table_name.replace('"', '""')
+            for col in conn.execute(f'PRAGMA table_info("{quoted_name}")').fetchall():
+                parsed = declared.get(col[1].lower())
+                if parsed and parsed['type']:
+                    col = (col[0], col[1], parsed['type']) + tuple(col[3:])
+                columns.append(tuple(col))
+            
+            primary_key = [col[1] for col in sorted(columns, key=lambda col: col[5]) if col[5]]
+            self.tables[table_name] = {
+                'columns': columns,
+                'count': None,
+                'row_bytes': None,
+                'schema': schema,
+                'primary_key': primary_key,
+                'indexes': self.read_indexes(conn, table_name),
+            }
+        self.dirty = True
+    
+    @staticmethod
+    def read_indexes(conn: sqlite3.Connection, table_name: str) -> List[Dict[str, Any]]:
+        """Índices da tabela (exceto o da chave primária, obtida do PRAGMA table_info)
+        
+        origin: 'u' = restrição UNIQUE, 'c' = CREATE INDEX. Índices sobre expressões
+        ficam sem lista de colunas e são marcados com 'expression'.
+        """
+        indexes = []
+        quoted_name = table_name.replace('"', '""')
+        for _, index_name, unique, origin, partial in conn.execute(
+                f'PRAGMA index_list("{quoted_name}")').fetchall():
+            if origin == 'pk':
+                continue
+            quoted_index = index_name.replace('"', '""')
+            info = sorted(conn.execute(f'PRAGMA index_info("{quoted_index}")').fetchall())
+            columns = [col_name for _, _, col_name in info]
+            indexes.append({
+                'name': index_name,
+                'columns': columns if None not in columns else [],
+                'unique': bool(unique),
+                'origin': origin,
+                'partial': bool(partial),
+                'expression': None in columns,
+            })
+        return indexes
+    
+    def table_names(self) -> List[str]:
+        return list(self.tables)
+    
+    def set_count(self, table_name: str, count: int):
+        self.tables[table_name]['count'] = count
+        self.dirty = True
+    
+    def set_row_bytes(self, table_name: str, row_bytes: int):
+        self.tables[table_name]['row_bytes'] = row_bytes
+        self.dirty = True
+    
+    def save(self):
+        """Grava o catálogo no cache (substituição atômica do arquivo)"""
+        if not self.cache_file or not self.dirty:
+            return
+        cache = self._read_cache() if os.path.exists(self.cache_file) else {}
+        cache['version'] = self.VERSION
+        cache.setdefault('databases', {})[self.database] = {
+            'fingerprint': self.fingerprint,
+            'tables': self.tables,
+        }
+        tmp_file = f"{self.cache_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as cache_fp:
+            json.dump(cache, cache_fp, ensure_ascii=False)
+        os.replace(tmp_file, self.cache_file)
+        self.dirty = False
+
+
+
+# Regras padrão de mapeamento: (padrão aplicado ao tipo declarado em maiúsculas, tipo Oracle).
+# Padrões com "$" exigem o tipo inteiro; os demais casam com o início do tipo declarado.
+# Grupos (\1, \2) do padrão são substituídos no tipo Oracle.
+DEFAULT_TYPE_RULES = [
+    (r'(DATE|TIMESTAMP|BLOB|CLOB|RAW)$', r'\1'),
+    (r'NUMBER\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)', r'NUMBER(\1,\2)'),
+    (r'NUMBER\s*\(\s*(\d+)\s*\)', r'NUMBER(\1)'),
+    (r'(NUMBER|NUMERIC)$', 'NUMBER'),
+    (r'(INTEGER|INT|SMALLINT|BIGINT|TINYINT|MEDIUMINT)$', 'NUMBER'),
+    (r'(REAL|FLOAT|DOUBLE|DOUBLE PRECISION)$', 'NUMBER'),
+    (r'DECIMAL\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)', r'NUMBER(\1,\2)'),
+    (r'DECIMAL\s*\(\s*(\d+)\s*\)', r'NUMBER(\1)'),
+    (r'VARCHAR2\s*\(\s*(\d+)\s*\)', r'VARCHAR2(\1)'),
+    (r'VARCHAR\s*\(\s*(\d+)\s*\)', r'VARCHAR2(\1)'),
+    (r'CHAR\s*\(\s*(\d+)\s*\)', r'CHAR(\1)'),
+    (r'(TEXT|VARCHAR|STRING|NVARCHAR|NTEXT)$', 'VARCHAR2(4000)'),
+    (r'CHAR$', 'CHAR(1)'),
+    (r'(BOOLEAN|BOOL)$', 'NUMBER(1)'),
+    (r'DATETIME$', 'TIMESTAMP'),
+]
+
+# Tipo Oracle de tipos vazios ou não reconhecidos
+DEFAULT_ORACLE_TYPE = 'VARCHAR2(4000)'
+
+# Chave "tabela.coluna" da seção [TYPE_MAPPING] (sem metacaracteres de regex)
+_COLUMN_OVERRIDE_RE = re.compile(r'[^\\^$*+?()\[\]{}|.]+\.[^\\^$*+?()\[\]{}|.]+')
+
+
+class TypeMapper:
+    """Mapeamento de tipos declarados no SQLite para tipos Oracle
+    
+    As regras (as da seção [TYPE_MAPPING] antes das padrão) são compiladas uma
+    única vez e cada tipo declarado é resolvido uma única vez: as chamadas
+    seguintes são uma consulta em dicionário. Chaves "tabela.coluna" fixam o
+    tipo de uma coluna; as demais são expressões regulares (sem distinção de
+    maiúsculas) que precisam casar com o tipo declarado inteiro.
+    """
+    
+    def __init__(self, overrides: Dict[str, str] = None):
+        self.column_overrides: Dict[Tuple[str, str], str] = {}
+        self.rules = []
+        for key, oracle_type in (overrides or {}).items():
+            key, oracle_type = key.strip(), oracle_type.strip()
+            if _COLUMN_OVERRIDE_RE.fullmatch(key):
+                table_name, _, column = key.partition('.')
+                self.column_overrides[(table_name.strip().lower(), column.strip().lower())] = oracle_type
+            else:
+                try:
+                    pattern = re.compile(rf'(?:{key})$', re.IGNORECASE)
+                except re.error as e:
+                    raise ValueError(f"regra inválida em [TYPE_MAPPING] '{key}': {e.msg}")
+                self.rules.append((pattern.match, oracle_type))
+        self.user_rules = len(self.rules)
+        self.rules.extend((re.compile(pattern).match, oracle_type) for pattern, oracle_type in DEFAULT_TYPE_RULES)
+        self._resolved: Dict[str, str] = {}
+    
+    def resolve(self, sqlite_type: str) -> str:
+        """Tipo Oracle de um tipo declarado (memoizado)"""
+        oracle_type = self._resolved.get(sqlite_type)
+        if oracle_type is None:
+            oracle_type = self._resolve_uncached(sqlite_type)
+            self._resolved[sqlite_type] = oracle_type
+        return oracle_type
+    
+    def _resolve_uncached(self, sqlite_type: str) -> str:
+        if not sqlite_type:
+            return DEFAULT_ORACLE_TYPE
+        sqlite_type_upper = sqlite_type.upper().strip()
+        for match, oracle_type in self.rules:
+            found = match(sqlite_type_upper)
+            if found:
+                return found.expand(oracle_type)
+        return DEFAULT_ORACLE_TYPE
+    
+    def column_override(self, table_name: str, column: str) -> str:
+        """Tipo fixado para a coluna em [TYPE_MAPPING] (None se não houver)"""
+        if not self.column_overrides:
+            return None
+        return self.column_overrides.get((table_name.lower(), column.lower()))
+
+
+def estimate_batch_bytes(batch: List[Tuple]) -> int:
+    """Volume aproximado de um lote: tamanho de textos/BLOBs e 8 bytes por número/data"""
+    total = 0
+    for row in batch:
+        for value in row:
+            if value is None:
+                continue
+            cls = value.__class__
+            total += len(value) if cls is str or cls is bytes else 8
+    return total
+
+
+# Modelo de custo padrão do escalonador (sem sonda): segundos por registro e por byte
+DEFAULT_ROW_SECONDS = 2e-5
+DEFAULT_BYTE_SECONDS = 1e-8
+
+# --export: registros por arquivo quando chunk_size = 0 e terminador de registro
+# (RS + LF: quebras de linha dentro dos textos não encerram o registro)
+EXPORT_CHUNK_ROWS = 1000000
+EXPORT_RECORD_TERMINATOR = '\x1e\n'
+# Nível 1: ~2,5x mais rápido que o padrão (6) com arquivos só ~2% maiores
+EXPORT_GZIP_LEVEL = 1
+# ERRORS do SQL*Loader só aceita um número: "sem limite" (batch_errors sem max_errors)
+EXPORT_SQLLDR_MAX_ERRORS = 999999999
+
+# mode = sync e --verify: valores da chave por bloco de hash quando chunk_size = 0;
+# diferenças listadas por tabela no console (as demais só no relatório)
+VERIFY_CHUNK_ROWS = 10000
+VERIFY_PRINT_LIMIT = 10
+
+
+@lru_cache(maxsize=None)
+def number_quantum(oracle_type: str):
+    """Quantum de arredondamento de NUMBER(p[,s]) (ex: NUMBER(10,2) → 0.01; None sem p)"""
+    match = re.match(r'NUMBER\s*\(\s*\d+\s*(?:,\s*(-?\d+)\s*)?\)', oracle_type)
+    if not match:
+        return None
+    return Decimal(1).scaleb(-int(match.group(1) or 0))
+
+
+def export_field(value) -> str:
+    """Campo dos arquivos de --export (delimitado por vírgula, aspas opcionais)
+    
+    Textos com vírgula, aspas ou quebra de linha vão entre aspas (aspas
+    internas dobradas); bytes viram hexadecimal, a forma aceita pelo
+    SQL*Loader para BLOB/RAW; números usam str (repr para float).
+    """
+    cls = value.__class__
+    if cls is str:
+        if '"' in value:
+            return '"' + value.replace('"', '""') + '"'
+        if ',' in value or '\n' in value or '\r' in value or '\x1e' in value:
+            return '"' + value + '"'
+        return value
+    if cls is bytes:
+        return value.hex()
+    return str(value)
+
+
+# mode = swap: sufixos da tabela carregada (e de seus índices) e da cópia substituída
+STAGING_SUFFIX = '_STG'
+REPLACED_SUFFIX = '_OLD'
+
+
+def simulate_pool(order: List[Any], costs: Dict[Any, float], workers: int = 1) -> float:
+    """Tempo total das tarefas submetidas nesta ordem a um pool de `workers`
+    
+    Cada tarefa vai para o worker que fica livre primeiro.
+    """
+    finish = [0.0] * max(1, workers)
+    for key in order:
+        heapq.heappush(finish, heapq.heappop(finish) + costs[key])
+    return max(finish)
+
+
+def schedule_largest_first(costs: Dict[Any, float], workers: int = 1) -> Tuple[List[Any], float]:
+    """Ordena as tarefas da mais cara para a mais barata (LPT)
+    
+    Retorna a ordem de submissão ao pool e o tempo total estimado com `workers`.
+    """
+    order = sorted(costs, key=lambda key: costs[key], reverse=True)
+    return order, simulate_pool(order, costs, workers)
+
+
+class AdaptiveBatchSizer:
+    """Tamanho de lote adaptativo de uma tabela (adaptive_batch)
+    
+    O primeiro lote é uma amostra de SAMPLE_ROWS registros: a largura média da
+    linha estimada nele limita os lotes seguintes a `memory_budget` bytes. A
+    cada executemany, a vazão medida (média móvel, registros/s) leva o lote ao
+    tamanho que consome `target_latency` segundos, no máximo dobrando ou
+    reduzindo à metade por passo.
+    """
+    
+    SAMPLE_ROWS = 100
+    MIN_ROWS = 10
+    
+    def __init__(self, initial: int, memory_budget: int, target_latency: float):
+        self.initial = max(self.MIN_ROWS, initial)
+        self.memory_budget = memory_budget
+        self.target_latency = target_latency
+        self.size = min(self.initial, self.SAMPLE_ROWS)
+        self.row_bytes = 0
+        self.max_rows = None
+        self._rate = None
+    
+    def observe(self, rows: List[Tuple]):
+        """Estima a largura da linha pela amostra e aplica o teto de memória"""
+        sample = rows[:self.SAMPLE_ROWS]
+        if not sample:
+            return
+        self.row_bytes = max(1, estimate_batch_bytes(sample) // len(sample))
+        self.max_rows = max(self.MIN_ROWS, self.memory_budget // self.row_bytes)
+        self.size = min(self.initial, self.max_rows)
+    
+    def record(self, rows: int, elapsed: float):
+        """Ajusta o próximo lote pela vazão do lote recém-gravado"""
+        if rows < self.size // 2 or elapsed <= 0:
+            return  # Lote parcial (fim da tabela ou do bloco): vazão pouco representativa
+        rate = rows / elapsed
+        self._rate = rate if self._rate is None else 0.7 * self._rate + 0.3 * rate
+        size = min(max(int(self._rate * self.target_latency), self.size // 2), self.size * 2)
+        if self.max_rows:
+            size = min(size, self.max_rows)
+        self.size = max(self.MIN_ROWS, size)
+
+
+def timed_phase(phase: str):
+    """Decorador: acumula o tempo do método (cujo 1º argumento é a tabela) na fase indicada"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, table_name, *args, **kwargs):
+            with self.metrics.timer(table_name, phase):
+                return method(self, table_name, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class MetricsRecorder:
+    """Métricas da migração por tabela: tempo por fase e contadores
+    
+    Fases: introspect (get_table_info), ddl (create_oracle_table), fetch (leitura
+    do SQLite), convert (conversão e parse de datas), execute (executemany: bind
+    e rede), lob (cópia dos LOBs em blocos), commit e index. Contadores: rows, bytes, batches, commits,
+    date_failures e rejected. Medidas (último valor, não somadas): batch_size e
+    row_bytes do lote adaptativo. A gravação é em JSON lines (uma linha por tabela mais o total,
+    acrescentadas a cada gravação) ou em textfile do Prometheus (substituído).
+    """
+    
+    PHASES = ('introspect', 'ddl', 'fetch', 'convert', 'execute', 'lob', 'commit', 'index')
+    COUNTERS = ('rows', 'bytes', 'batches', 'commits', 'date_failures', 'rejected')
+    GAUGES = ('batch_size', 'row_bytes')
+    FORMATS = ('jsonl', 'prometheus')
+    PREFIX = 'sqlite_oracle_migration'
+    
+    def __init__(self, path: str = None, output_format: str = 'jsonl', interval: float = 0):
+        self.path = path
+        self.output_format = output_format
+        self.interval = interval
+        self.started = time.time()
+        self.tables: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+    
+    def _entry(self, table_name: str) -> Dict[str, float]:
+        entry = self.tables.get(table_name)
+        if entry is None:
+            entry = self.tables[table_name] = dict.fromkeys(self.PHASES + self.COUNTERS + self.GAUGES, 0)
+        return entry
+    
+    def add(self, table_name: str, **values: float):
+        """Soma valores às fases/contadores da tabela"""
+        with self._lock:
+            entry = self._entry(table_name)
+            for key, value in values.items():
+                entry[key] += value
+    
+    def set(self, table_name: str, **values: float):
+        """Substitui medidas (GAUGES) da tabela"""
+        with self._lock:
+            self._entry(table_name).update(values)
+    
+    @contextmanager
+    def timer(self, table_name: str, phase: str):
+        """Mede o tempo do bloco e acumula na fase da tabela"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(table_name, **{phase: time.perf_counter() - start})
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {table: dict(entry) for table, entry in self.tables.items()}
+    
+    def write(self, final: bool = False):
+        """Grava o estado atual das métricas no arquivo configurado"""
+        if not self.path:
+            return
+        tables = self.snapshot()
+        total = dict.fromkeys(self.PHASES + self.COUNTERS, 0)
+        for entry in tables.values():
+            for key in total:
+                total[key] += entry[key]
+        
+        if self.output_format == 'prometheus':
+            self._write_prometheus(tables, total, final)
+        else:
+            self._write_jsonl(tables, total, final)
+    
+    def _write_jsonl(self, tables: Dict[str, Dict[str, float]], total: Dict[str, float], final: bool):
+        header = {
+            'ts': datetime.now().isoformat(timespec='seconds'),
+            'run_started': datetime.fromtimestamp(self.started).isoformat(timespec='seconds'),
+            'elapsed': round(time.time() - self.started, 3),
+            'final': final,
+        }
+        with open(self.path, 'a', encoding='utf-8') as metrics_fp:
+            for table, entry in list(tables.items()) + [(None, total)]:
+                record = dict(header, table=table)
+                record.update({key: round(value, 6) if isinstance(value, float) else value
+                               for key, value in entry.items()})
+                metrics_fp.write(json.dumps(record, ensure_ascii=False) + '\n')
+    
+    def _write_prometheus(self, tables: Dict[str, Dict[str, float]], total: Dict[str, float], final: bool):
+        def label(value: str) -> str:
+            return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        
+        lines = [
+            f"# HELP {self.PREFIX}_elapsed_seconds Tempo decorrido da migração",
+            f"# TYPE {self.PREFIX}_elapsed_seconds gauge",
+            f"{self.PREFIX}_elapsed_seconds {time.time() - self.started:.3f}",
+            f"# HELP {self.PREFIX}_running 1 enquanto a migração está em andamento",
+            f"# TYPE {self.PREFIX}_running gauge",
+            f"{self.PREFIX}_running {0 if final else 1}",
+            f"# HELP {self.PREFIX}_phase_seconds_total Tempo acumulado por fase",
+            f"# TYPE {self.PREFIX}_phase_seconds_total counter",
+        ]
+        for table, entry in tables.items():
+            for phase in self.PHASES:
+                lines.append(f'{self.PREFIX}_phase_seconds_total{{table="{label(table)}",phase="{phase}"}} '
+                             f'{entry[phase]:.6f}')
+        for counter in self.COUNTERS:
+            lines.append(f"# TYPE {self.PREFIX}_{counter}_total counter")
+            for table, entry in tables.items():
+                lines.append(f'{self.PREFIX}_{counter}_total{{table="{label(table)}"}} {entry[counter]}')
+        for gauge in self.GAUGES:
+            lines.append(f"# TYPE {self.PREFIX}_{gauge} gauge")
+            for table, entry in tables.items():
+                lines.append(f'{self.PREFIX}_{gauge}{{table="{label(table)}"}} {entry[gauge]}')
+        
+        # Substituição atômica: o node_exporter nunca lê um arquivo pela metade
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as metrics_fp:
+            metrics_fp.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, self.path)
+    
+    def start_periodic(self):
+        """Inicia a gravação periódica (metrics_interval > 0)"""
+        if not self.path or self.interval <= 0 or self._thread is not None:
+            return
+        
+        def dump():
+            while not self._stop.wait(self.interval):
+                self.write()
+        
+        self._thread = threading.Thread(target=dump, name='metrics', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Encerra a gravação periódica e grava o resultado final"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.write(final=True)
+
+
+class RejectWriter:
+    """Registros rejeitados pelo Oracle (batcherrors) de uma tabela
+    
+    Formato 'csv': um arquivo <diretório>/<tabela>.csv por tabela. Formato
+    'sqlite': uma tabela por tabela de origem em <diretório>/rejects.db. Cada
+    registro leva o código e a mensagem do erro Oracle seguidos dos valores
+    enviados. O arquivo só é criado no primeiro rejeitado; sem `append`
+    (execução nova) o conteúdo anterior é descartado.
+    """
+    
+    def __init__(self, directory: str, output_format: str, table_name: str,
+                 columns: List[str], append: bool = False):
+        self.table_name = table_name
+        self.columns = columns
+        self.output_format = output_format
+        self.rows = 0
+        self._lock = threading.Lock()
+        self._fp = None
+        self._writer = None
+        self._conn = None
+        
+        os.makedirs(directory, exist_ok=True)
+        if output_format == 'sqlite':
+            self.path = os.path.join(directory, 'rejects.db')
+            self._open_sqlite(append)
+        else:
+            safe_name = re.sub(r'[^\w.-]+', '_', table_name)
+            self.path = os.path.join(directory, f"{safe_name}.csv")
+            write_header = not (append and os.path.exists(self.path))
+            self._fp = open(self.path, 'a' if append else 'w', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._fp)
+            if write_header:
+                self._writer.writerow(['ora_code', 'ora_message'] + columns)
+    
+    def _open_sqlite(self, append: bool):
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        quoted_table = '"' + self.table_name.replace('"', '""') + '"'
+        col_defs = ', '.join('"' + col.replace('"', '""') + '"' for col in self.columns)
+        with self._conn:
+            if not append:
+                self._conn.execute(f"DROP TABLE IF EXISTS {quoted_table}")
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {quoted_table} "
+                               f"(ora_code INTEGER, ora_message TEXT, {col_defs})")
+        placeholders = ', '.join('?' * (len(self.columns) + 2))
+        self._insert_sql = f"INSERT INTO {quoted_table} VALUES ({placeholders})"
+    
+    @staticmethod
+    def _plain(value):
+        # Datas convertidas voltam ao texto ISO; BLOBs vão como hexadecimal no CSV
+        if isinstance(value, datetime):
+            return value.isoformat(sep=' ')
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
+    
+    def write(self, rejected: List[Tuple[Tuple, int, str]]):
+        """Grava (valores, código ORA, mensagem) dos registros rejeitados"""
+        with self._lock:
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.executemany(self._insert_sql, [
+                        (code, message) + tuple(self._plain(value) for value in values)
+                        for values, code, message in rejected])
+            else:
+                for values, code, message in rejected:
+                    self._writer.writerow([code, message] + [
+                        value.hex() if isinstance(value, bytes) else self._plain(value)
+                        for value in values])
+                self._fp.flush()
+            self.rows += len(rejected)
+    
+    def close(self):
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+            if self._conn is not None:
+                self._conn.close()
+
+
+# Drivers aceitos em [ORACLE] driver (nome → módulo), na ordem tentada por 'auto'
+ORACLE_DRIVERS = {'cx_oracle': 'cx_Oracle', 'oracledb': 'oracledb'}
+
+
+class OracleDriver:
+    """Driver Oracle: cx_Oracle ou python-oracledb (modo thin, sem Instant Client)
+    
+    Os dois módulos têm a mesma DB-API (cursores, executemany com batcherrors,
+    LOBs, tipos de bind e DatabaseError); aqui ficam só as diferenças de conexão
+    e de pool e o acesso à API assíncrona, exclusiva do python-oracledb. O
+    módulo é importado sob demanda: --export e --plan não exigem driver.
+    """
+    
+    def __init__(self, name: str, module: Any):
+        self.name = name
+        self.module = module
+        self.DatabaseError = module.DatabaseError
+        self.supports_async = name == 'oracledb' and hasattr(module, 'create_pool_async')
+    
+    @classmethod
+    def load(cls, name: str = 'auto') -> 'OracleDriver':
+        """Importa o driver (auto: cx_Oracle e, na falta dele, python-oracledb)"""
+        candidates = list(ORACLE_DRIVERS) if name == 'auto' else [name]
+        for candidate in candidates:
+            try:
+                return cls(candidate, importlib.import_module(ORACLE_DRIVERS[candidate]))
+            except ImportError:
+                continue
+        modules = ' ou '.join(ORACLE_DRIVERS[candidate] for candidate in candidates)
+        raise ImportError(f"Biblioteca {modules} não encontrada. Instale com: pip install oracledb")
+    
+    def describe(self) -> str:
+        if self.name == 'oracledb':
+            return f"python-oracledb ({'thin' if self.module.is_thin_mode() else 'thick'})"
+        return "cx_Oracle (Instant Client)"
+    
+    def makedsn(self, host: str, port: str, service_name: str = None, sid: str = None) -> str:
+        if service_name:
+            return self.module.makedsn(host, port, service_name=service_name)
+        return self.module.makedsn(host, port, sid=sid)
+    
+    def connect(self, user: str, password: str, dsn: str):
+        if self.name == 'cx_oracle':
+            return self.module.connect(user=user, password=password, dsn=dsn, encoding="UTF-8")
+        # python-oracledb usa sempre UTF-8 (sem parâmetro encoding)
+        return self.module.connect(user=user, password=password, dsn=dsn)
+    
+    def create_pool(self, user: str, password: str, dsn: str, size: int):
+        if self.name == 'cx_oracle':
+            return self.module.SessionPool(user=user, password=password, dsn=dsn, min=size, max=size,
+                                           increment=0, threaded=True, encoding="UTF-8")
+        return self.module.create_pool(user=user, password=password, dsn=dsn, min=size, max=size, increment=0)
+
+
+class AsyncBatchWriter:
+    """Gravação assíncrona de lotes (python-oracledb): vários executemany em voo
+    
+    Um event loop em thread própria mantém um pool de conexões assíncronas.
+    Cada lote entregue a submit é gravado e confirmado numa conexão livre do
+    pool sem bloquear quem chamou: enquanto um lote aguarda a resposta do
+    servidor, os seguintes já estão a caminho, e a latência de ida e volta
+    deixa de se somar lote a lote. Os commits, porém, seguem a ordem de envio:
+    cada lote só confirma depois do anterior e é desfeito se o anterior
+    falhou, então o que está no Oracle é sempre um prefixo dos lotes enviados.
+    """
+    
+    def __init__(self, driver: OracleDriver, user: str, password: str, dsn: str, connections: int):
+        self.connections = connections
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        
+        async def create_pool():
+            return driver.module.create_pool_async(user=user, password=password, dsn=dsn,
+                                                   min=connections, max=connections, increment=0)
+        try:
+            self.pool = self.run(create_pool())
+        except Exception:
+            self.stop_loop()
+            raise
+    
+    def run(self, coroutine):
+        """Executa a corrotina no event loop e aguarda o resultado"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+    
+    def submit(self, sql: str, rows: List[Tuple], input_sizes: List[Any] = None,
+               batch_errors: bool = False, previous: Future = None) -> Future:
+        """Envia o lote sem esperar; o Future devolve (erros de batcherrors, segundos do executemany)
+        
+        `previous` é o Future do lote anterior da mesma carga ainda em voo: o
+        commit deste lote aguarda o dele.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._send(sql, rows, input_sizes, batch_errors, previous), self.loop)
+    
+    async def _send(self, sql: str, rows: List[Tuple], input_sizes: List[Any], batch_errors: bool,
+                    previous: Future = None):
+        async with self.pool.acquire() as connection:
+            cursor = connection.cursor()
+            if input_sizes:
+                cursor.setinputsizes(*input_sizes)
+            started = time.perf_counter()
+            await cursor.executemany(sql, rows, batcherrors=batch_errors)
+            elapsed = time.perf_counter() - started
+            errors = cursor.getbatcherrors() if batch_errors else []
+            if previous is not None:
+                try:
+                    await asyncio.wrap_future(previous)
+                except Exception:
+                    await connection.rollback()
+                    raise RuntimeError("lote desfeito: um lote anterior da mesma carga falhou")
+            await connection.commit()
+            return errors, elapsed
+    
+    def stop_loop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+    
+    def close(self):
+        try:
+            self.run(self.pool.close())
+        finally:
+            self.stop_loop()
 
 
 class MigrationTool:
     """Ferramenta de migração SQLite -> Oracle"""
     
-    def __init__(self, config_file: str = "migration.cfg"):
+    def __init__(self, config_file: str = "migration.cfg", resume: bool = False, plan_only: bool = False,
+                 export_only: bool = False, verify_only: bool = False):
         self.config_file = config_file
+        self.resume = resume
+        self.plan_only = plan_only
+        self.export_only = export_only
+        self.verify_only = verify_only
         self.config = None
         self.sqlite_conn = None
+        self.sqlite_sources: List[str] = []
+        self.fan_in = False
+        self.source_column = None
+        self.source_counts: Dict[Tuple[str, str], int] = {}
         self.oracle_conn = None
+        self.oracle_driver = 'auto'
+        self.driver = None
+        self.oracle_pool = None
+        self.async_depth = 1
+        self.async_writer = None
+        self.oracle_dsn = None
         self.mode = None
         self.batch_size = 1000
+        self.sqlite_read_only = True
+        self.sqlite_immutable = False
+        self.sqlite_mmap_size = 268435456
+        self.sqlite_cache_size = -65536
+        self.sqlite_snapshot = 'auto'
+        self.snapshot_active = False
+        self._snapshot_readers: List[sqlite3.Connection] = []
+        self.adaptive_batch = False
+        self.row_count = 'exact'
+        self.table_counts: Dict[str, int] = {}
+        self.estimated_counts = set()
+        self.schedule = 'largest'
+        self.plan_sample_rows = 2000
+        self.export_dir = 'export'
+        self.export_compress = 'gzip'
+        self.export_oracle_dir = 'MIGRATION_DIR'
+        self.export_exec_dir = 'EXEC_DIR'
+        self.verify_after_load = False
+        self.verify_report = 'migration_verify.csv'
+        self.batch_memory = 16777216
+        self.batch_latency = 0.5
+        self.workers = 1
+        self.chunk_size = 0
+        self.date_cache_size = 4096
+        self.profile_columns = False
+        self.pipeline = False
+        self.pipeline_queue_size = 4
+        self.load_profile = 'conventional'
+        self.append_hint = True
+        self.nologging = True
+        self.commit_policy = 'batches'
+        self.commit_every = 1
+        self.checkpoint = False
+        self.checkpoint_file = 'migration_checkpoint.db'
+        self.journal = None
+        self.schema_cache = ''
+        self.catalog = None
+        self.create_indexes = True
+        self.index_parallel = 4
+        self.index_workers = 2
+        self.created_tables: List[str] = []
+        self.staging_tables: Dict[str, str] = {}
+        self.metrics = MetricsRecorder()
+        self.batch_errors = True
+        self.max_errors = 1000
+        self.reject_format = 'csv'
+        self.reject_dir = 'rejects'
+        self._reject_writers: Dict[str, RejectWriter] = {}
+        self.lob_streaming = 'auto'
+        self.lob_chunk_size = 1048576
+        self._lob_columns: Dict[str, List[int]] = {}
+        self._rowid_tables: Dict[str, bool] = {}
+        self.sync_keys: Dict[str, str] = {}
+        self.lob_content_hash = None  # EXECUTE em DBMS_CRYPTO (conferido uma vez, se houver LOBs)
+        self.type_mapper = TypeMapper()
+        self.table_input_sizes: Dict[str, List[Any]] = {}
         self.normalize_names = True
         self.debug_mode = False
         
+        # Estado compartilhado entre workers paralelos
+        self.table_results: Dict[str, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+        self._print_lock = threading.Lock()
+        self._worker_local = threading.local()
+        self._worker_sessions: List[Tuple[Any, Any]] = []
+        
     def load_config(self) -> bool:
         """Carrega arquivo de configuração"""
         print("=" * 80)
@@ -114,14 +1377,210 @@ class MigrationTool:
                 print("  ⚠ AVISO: Nenhum 'service_name' ou 'sid' configurado!")
                 print("  Configure um deles na seção [ORACLE]")
             
+            self.oracle_driver = self.config['ORACLE'].get('driver', 'auto').lower()
+            if self.oracle_driver not in ('auto',) + tuple(ORACLE_DRIVERS):
+                print(f"ERRO: driver inválido '{self.oracle_driver}' (use 'auto', 'cx_oracle' ou 'oracledb')")
+                return False
+            
             self.mode = self.config['MIGRATION'].get('mode', 'append').lower()
             self.batch_size = int(self.config['MIGRATION'].get('batch_size', '1000'))
+            # Perfil de leitura do SQLite de origem
+            self.sqlite_read_only = self.config['SQLITE'].getboolean('read_only', True)
+            self.sqlite_immutable = self.config['SQLITE'].getboolean('immutable', False)
+            self.sqlite_mmap_size = max(0, int(self.config['SQLITE'].get('mmap_size', '268435456')))
+            self.sqlite_cache_size = int(self.config['SQLITE'].get('cache_size', '-65536'))
+            self.sqlite_snapshot = self.config['SQLITE'].get('snapshot', 'auto').lower()
+            if self.sqlite_snapshot not in ('auto', 'true', 'false'):
+                print(f"ERRO: snapshot inválido '{self.sqlite_snapshot}' (use 'auto', 'true' ou 'false')")
+                return False
+            
+            self.adaptive_batch = self.config['MIGRATION'].getboolean('adaptive_batch', False)
+            self.row_count = self.config['MIGRATION'].get('row_count', 'exact').lower()
+            if self.row_count not in ('exact', 'estimate'):
+                print(f"ERRO: row_count inválido '{self.row_count}' (use 'exact' ou 'estimate')")
+                return False
+            self.schedule = self.config['MIGRATION'].get('schedule', 'largest').lower()
+            self.plan_sample_rows = max(100, int(self.config['MIGRATION'].get('plan_sample_rows', '2000')))
+            if self.schedule not in ('largest', 'catalog'):
+                print(f"ERRO: schedule inválido '{self.schedule}' (use 'largest' ou 'catalog')")
+                return False
+            self.export_dir = self.config['MIGRATION'].get('export_dir', 'export')
+            self.export_compress = self.config['MIGRATION'].get('export_compress', 'gzip').lower()
+            if self.export_compress not in ('gzip', 'none'):
+                print(f"ERRO: export_compress inválido '{self.export_compress}' (use 'gzip' ou 'none')")
+                return False
+            self.export_oracle_dir = self.config['MIGRATION'].get('export_oracle_dir', 'MIGRATION_DIR').upper()
+            self.export_exec_dir = self.config['MIGRATION'].get('export_exec_dir', 'EXEC_DIR').upper()
+            self.batch_memory = max(65536, int(self.config['MIGRATION'].get('batch_memory', '16777216')))
+            self.batch_latency = max(0.01, float(self.config['MIGRATION'].get('batch_latency', '0.5')))
             self.normalize_names = self.config['MIGRATION'].getboolean('normalize_names', True)
             self.debug_mode = self.config['MIGRATION'].getboolean('debug_mode', False)
             
+            # Vários arquivos SQLite (glob ou lista) com o mesmo esquema na mesma carga
+            self.sqlite_sources = expand_sqlite_sources(self.config['SQLITE']['database'])
+            if not self.sqlite_sources:
+                print(f"ERRO: Nenhum arquivo SQLite corresponde a '{self.config['SQLITE']['database']}'")
+                return False
+            self.fan_in = len(self.sqlite_sources) > 1
+            source_column = self.config['SQLITE'].get('source_column', '').strip()
+            self.source_column = self.normalize_name(source_column) if source_column else None
+            self.workers = max(1, int(self.config['MIGRATION'].get('workers', '1')))
+            self.chunk_size = max(0, int(self.config['MIGRATION'].get('chunk_size', '0')))
+            self.date_cache_size = max(0, int(self.config['MIGRATION'].get('date_cache_size', '4096')))
+            self.profile_columns = self.config['MIGRATION'].getboolean('profile_columns', False)
+            if 'TYPE_MAPPING' in self.config:
+                try:
+                    self.type_mapper = TypeMapper(dict(self.config['TYPE_MAPPING']))
+                except ValueError as e:
+                    print(f"ERRO: {e}")
+                    return False
+            self.pipeline = self.config['MIGRATION'].getboolean('pipeline', False)
+            self.pipeline_queue_size = max(1, int(self.config['MIGRATION'].get('pipeline_queue_size', '4')))
+            self.async_depth = max(1, int(self.config['MIGRATION'].get('async_depth', '1')))
+            self.verify_after_load = self.config['MIGRATION'].getboolean('verify', False)
+            self.verify_report = self.config['MIGRATION'].get('verify_report', 'migration_verify.csv').strip()
+            self.load_profile = self.config['MIGRATION'].get('load_profile', 'conventional').lower()
+            self.append_hint = self.config['MIGRATION'].getboolean('append_hint', True)
+            self.nologging = self.config['MIGRATION'].getboolean('nologging', True)
+            
+            # commit_interval: N (a cada N lotes), 'table' (por tabela) ou 'end' (uma vez no final)
+            commit_interval = self.config['MIGRATION'].get('commit_interval', '1').lower()
+            if commit_interval in ('table', 'end'):
+                self.commit_policy = commit_interval
+                self.commit_every = 0
+            else:
+                self.commit_policy = 'batches'
+                self.commit_every = max(1, int(commit_interval))
+            
+            self.checkpoint = self.config['MIGRATION'].getboolean('checkpoint', False) or self.resume
+            self.checkpoint_file = self.config['MIGRATION'].get('checkpoint_file', 'migration_checkpoint.db')
+            self.schema_cache = self.config['MIGRATION'].get('schema_cache', '').strip()
+            self.create_indexes = self.config['MIGRATION'].getboolean('create_indexes', True)
+            self.index_parallel = max(1, int(self.config['MIGRATION'].get('index_parallel', '4')))
+            self.index_workers = max(1, int(self.config['MIGRATION'].get('index_workers', '2')))
+            self.batch_errors = self.config['MIGRATION'].getboolean('batch_errors', True)
+            self.max_errors = max(0, int(self.config['MIGRATION'].get('max_errors', '1000')))
+            self.reject_format = self.config['MIGRATION'].get('reject_format', 'csv').lower()
+            self.reject_dir = self.config['MIGRATION'].get('reject_dir', 'rejects')
+            self.lob_streaming = self.config['MIGRATION'].get('lob_streaming', 'auto').lower()
+            self.lob_chunk_size = max(8192, int(self.config['MIGRATION'].get('lob_chunk_size', '1048576')))
+            if self.lob_streaming not in ('auto', 'true', 'false'):
+                print(f"ERRO: lob_streaming inválido '{self.lob_streaming}' (use 'auto', 'true' ou 'false')")
+                return False
+            if self.reject_format not in ('csv', 'sqlite'):
+                print(f"ERRO: reject_format inválido '{self.reject_format}' (use 'csv' ou 'sqlite')")
+                return False
+            
+            metrics_format = self.config['MIGRATION'].get('metrics_format', 'jsonl').lower()
+            if metrics_format not in MetricsRecorder.FORMATS:
+                print(f"ERRO: metrics_format inválido '{metrics_format}' (use 'jsonl' ou 'prometheus')")
+                return False
+            self.metrics = MetricsRecorder(
+                self.config['MIGRATION'].get('metrics_file', '').strip() or None,
+                metrics_format,
+                max(0.0, float(self.config['MIGRATION'].get('metrics_interval', '0')))
+            )
+            
+            if self.mode not in ('append', 'truncate', 'swap', 'sync'):
+                print(f"ERRO: mode inválido '{self.mode}' (use 'append', 'truncate', 'swap' ou 'sync')")
+                return False
+            if self.mode == 'sync':
+                # Cada bloco diferente é apagado e recarregado em uma única transação
+                self.commit_policy = 'table'
+                self.commit_every = 0
+                if self.checkpoint:
+                    print("  ⚠ AVISO: checkpoint não se aplica a mode = sync (a sincronização é idempotente)")
+                    self.checkpoint = False
+                if self.fan_in or self.source_column:
+                    print("ERRO: mode = sync compara um único arquivo SQLite (sem source_column)")
+                    return False
+            if self.fan_in and self.export_only:
+                print("ERRO: --export lê um único arquivo SQLite (informe um arquivo em [SQLITE] database)")
+                return False
+            if self.verify_only and (self.export_only or self.plan_only):
+                print("ERRO: --verify confere tabelas já carregadas (não combina com --export ou --plan)")
+                return False
+            if self.fan_in and self.create_indexes and not self.source_column:
+                print("  ⚠ AVISO: sem source_column, chaves primárias e UNIQUE de arquivos diferentes podem colidir")
+            
+            if self.load_profile not in ('conventional', 'bulk'):
+                print(f"ERRO: load_profile inválido '{self.load_profile}' (use 'conventional' ou 'bulk')")
+                return False
+            if self.mode == 'swap' and self.load_profile != 'bulk':
+                # A tabela de staging não é lida por ninguém durante a carga
+                print("  ⚠ AVISO: mode = swap carrega a tabela de staging com load_profile = bulk")
+                self.load_profile = 'bulk'
+            if self.load_profile == 'bulk' and self.mode not in ('truncate', 'swap'):
+                print("  ⚠ AVISO: load_profile = bulk exige mode = truncate ou swap; usando carga convencional")
+                self.load_profile = 'conventional'
+            if self.uses_direct_path() and self.commit_every != 1:
+                # Inserção direct-path exige commit antes da próxima inserção na mesma tabela
+                print("  ⚠ AVISO: APPEND_VALUES exige commit a cada lote; commit_interval ajustado para 1")
+                self.commit_policy = 'batches'
+                self.commit_every = 1
+            if self.async_depth > 1 and self.commit_policy != 'batches':
+                # Cada lote em voo é confirmado na sua própria conexão
+                print(f"  ⚠ AVISO: async_depth exige commit_interval numérico; usando escrita síncrona")
+                self.async_depth = 1
+            elif self.async_depth > 1 and self.commit_every != 1:
+                print("  ⚠ AVISO: com async_depth cada lote é confirmado na sua conexão; commit_interval ajustado para 1")
+                self.commit_every = 1
+            
+            print(f"  • Leitura SQLite: {self.describe_sqlite_profile()}")
+            if self.fan_in:
+                print(f"  • Arquivos SQLite: {len(self.sqlite_sources)} (esquema do primeiro, carga simultânea "
+                      f"nas mesmas tabelas)")
+            if self.source_column:
+                print(f"  • Arquivo de origem gravado na coluna {self.source_column}")
             print(f"  • Modo de migração: {self.mode.upper()}")
+            if self.mode == 'swap':
+                print(f"  • Carga em <tabela>{STAGING_SUFFIX}, trocada pela definitiva (RENAME) ao final")
             print(f"  • Normalizar nomes: {'SIM (espaços → underscores)' if self.normalize_names else 'NÃO'}")
-            print(f"  • Tamanho do lote: {self.batch_size} registros")
+            if self.adaptive_batch:
+                print(f"  • Tamanho do lote: adaptativo (inicial {self.batch_size}, até "
+                      f"{self.batch_memory / 1024 / 1024:,.1f} MB, alvo {self.batch_latency:.2f}s por lote)")
+            else:
+                print(f"  • Tamanho do lote: {self.batch_size} registros")
+            if self.schedule == 'largest':
+                print(f"  • Ordem de carga: maior tabela primeiro (registros × largura estimada)")
+            if self.export_only:
+                print(f"  • Exportação: {self.export_dir} ({self.export_compress}, "
+                      f"{self.chunk_size or EXPORT_CHUNK_ROWS:,} registros por arquivo; sem conexão Oracle)")
+            if self.workers > 1:
+                print(f"  • Workers paralelos: {self.workers}")
+                if self.chunk_size:
+                    print(f"  • Tabelas grandes divididas em blocos de {self.chunk_size:,} registros")
+            if self.profile_columns:
+                print(f"  • Perfil de colunas: ATIVADO (tipos ajustados aos dados)")
+            if self.type_mapper.user_rules or self.type_mapper.column_overrides:
+                print(f"  • Mapeamento de tipos: {self.type_mapper.user_rules} regra(s) e "
+                      f"{len(self.type_mapper.column_overrides)} coluna(s) em [TYPE_MAPPING]")
+            print(f"  • Perfil de carga: {self.describe_load_profile()}")
+            if self.checkpoint:
+                print(f"  • Checkpoint: {self.checkpoint_file}{' (RETOMANDO)' if self.resume else ''}")
+            if self.create_indexes:
+                print(f"  • Índices após a carga: PARALLEL {self.index_parallel} NOLOGGING, "
+                      f"{self.index_workers} construções simultâneas")
+            if self.batch_errors:
+                limit = f"até {self.max_errors:,} por tabela" if self.max_errors else "sem limite"
+                print(f"  • Registros rejeitados: {self.reject_dir} ({self.reject_format}, {limit})")
+            if self.lob_streaming != 'false':
+                when = "LOBs maiores que o bloco" if self.lob_streaming == 'auto' else "todos os LOBs"
+                print(f"  • LOBs em blocos de {self.lob_chunk_size:,} bytes: {when}")
+            if self.metrics.enabled:
+                interval = f", a cada {self.metrics.interval:g}s" if self.metrics.interval else ''
+                print(f"  • Métricas: {self.metrics.path} ({self.metrics.output_format}{interval})")
+            if self.schema_cache:
+                print(f"  • Cache do catálogo do esquema: {self.schema_cache}")
+            if self.pipeline:
+                print(f"  • Pipeline leitura/conversão/escrita: ATIVADO (fila de {self.pipeline_queue_size} lotes)")
+            if self.async_depth > 1:
+                print(f"  • Escrita assíncrona: até {self.async_depth} lotes em voo por tabela (python-oracledb)")
+            if self.verify_only or self.verify_after_load:
+                when = "somente conferência" if self.verify_only else "após a carga"
+                report = f", relatório em {self.verify_report}" if self.verify_report else ''
+                print(f"  • Conferência SQLite × Oracle ({when}): contagem e hash por bloco de "
+                      f"{max(1, self.chunk_size or VERIFY_CHUNK_ROWS):,} valores da chave{report}")
             if self.debug_mode:
                 print(f"  • Modo DEBUG: ATIVADO")
             
@@ -131,22 +1590,135 @@ class MigrationTool:
             print(f"ERRO ao ler configuração: {str(e)}")
             return False
     
+    def describe_sqlite_profile(self) -> str:
+        """Resumo do perfil de leitura do SQLite (exibido na configuração)"""
+        parts = ['imutável' if self.sqlite_immutable else
+                 'somente leitura' if self.sqlite_read_only else 'leitura/escrita']
+        parts.append(f"mmap {self.sqlite_mmap_size / 1024 / 1024:,.0f} MB" if self.sqlite_mmap_size else 'sem mmap')
+        cache_bytes = -self.sqlite_cache_size * 1024 if self.sqlite_cache_size < 0 else None
+        parts.append(f"cache {cache_bytes / 1024 / 1024:,.0f} MB" if cache_bytes is not None
+                     else f"cache {self.sqlite_cache_size:,} páginas")
+        if self.sqlite_snapshot != 'false' and not self.sqlite_immutable and not self.fan_in:
+            parts.append('snapshot único' + (' (se WAL)' if self.sqlite_snapshot == 'auto' else ''))
+        return ', '.join(parts)
+    
+    def open_sqlite_source(self, db_path: str = None) -> sqlite3.Connection:
+        """Abre o SQLite de origem com o perfil de leitura da seção [SQLITE]
+        
+        URI com mode=ro (e immutable=1, que dispensa travas e detecção de
+        mudanças: só para arquivos que ninguém altera durante a migração),
+        mmap_size e cache_size aplicados a cada conexão. Sem `db_path`, abre o
+        primeiro arquivo de [SQLITE] database.
+        """
+        db_path = db_path or self.sqlite_sources[0]
+        params = []
+        if self.sqlite_read_only or self.sqlite_immutable:
+            params.append('mode=ro')
+        if self.sqlite_immutable:
+            params.append('immutable=1')
+        uri = Path(os.path.abspath(db_path)).as_uri() + ('?' + '&'.join(params) if params else '')
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.execute(f"PRAGMA mmap_size = {self.sqlite_mmap_size}")
+        conn.execute(f"PRAGMA cache_size = {self.sqlite_cache_size}")
+        return conn
+    
+    @staticmethod
+    def begin_snapshot(conn: sqlite3.Connection):
+        """Abre (e mantém) uma transação de leitura: a conexão passa a ver um snapshot fixo"""
+        conn.execute("BEGIN")
+        conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+    
+    def open_snapshot(self) -> bool:
+        """Fixa um único snapshot para a conexão principal e os leitores dos workers
+        
+        Todas as conexões iniciam a transação de leitura antes de qualquer carga;
+        se o banco (ou o -wal) mudar enquanto elas são abertas, a abertura é
+        repetida, garantindo que todas enxerguem o mesmo commit.
+        """
+        database = os.path.abspath(self.sqlite_sources[0])
+        readers = self.workers if self.workers > 1 else 0
+        for _ in range(3):
+            before = SchemaCatalog.compute_fingerprint(database)
+            self.begin_snapshot(self.sqlite_conn)
+            self._snapshot_readers = [self.open_sqlite_source() for _ in range(readers)]
+            for reader in self._snapshot_readers:
+                self.begin_snapshot(reader)
+            if SchemaCatalog.compute_fingerprint(database) == before:
+                return True
+            
+            # Houve commit durante a abertura: descarta e tenta de novo
+            self.sqlite_conn.rollback()
+            for reader in self._snapshot_readers:
+                reader.close()
+            self._snapshot_readers = []
+        return False
+    
     def connect_sqlite(self) -> bool:
         """Conecta ao banco SQLite"""
         print(f"\n[2/7] Conectando ao SQLite...")
         try:
-            db_path = self.config['SQLITE']['database']
-            if not os.path.exists(db_path):
-                print(f"ERRO: Database SQLite '{db_path}' não encontrado!")
-                return False
+            for db_path in self.sqlite_sources:
+                if not os.path.exists(db_path):
+                    print(f"ERRO: Database SQLite '{db_path}' não encontrado!")
+                    return False
+            db_path = self.sqlite_sources[0]
                 
-            self.sqlite_conn = sqlite3.connect(db_path)
+            # Conexão compartilhada com a thread leitora do modo pipeline
+            self.sqlite_conn = self.open_sqlite_source()
             print(f"✓ Conectado ao SQLite: {db_path}")
-            return True
+            if self.fan_in and not self.check_source_schemas():
+                return False
+            
+            # Snapshot único entre tabelas e workers (auto: só em bancos WAL, em que
+            # a transação de leitura não bloqueia quem grava); com vários arquivos,
+            # cada leitura vê o seu próprio arquivo
+            if self.sqlite_snapshot != 'false' and not self.sqlite_immutable and not self.fan_in:
+                journal_mode = self.sqlite_conn.execute("PRAGMA journal_mode").fetchone()[0].lower()
+                if self.sqlite_snapshot == 'true' or journal_mode == 'wal':
+                    if self.open_snapshot():
+                        self.snapshot_active = True
+                        print(f"  • Snapshot de leitura fixado (journal_mode = {journal_mode})")
+                    else:
+                        print("  ⚠ AVISO: banco alterado durante a abertura do snapshot; "
+                              "tabelas podem refletir momentos diferentes")
+            return True
         except Exception as e:
             print(f"ERRO ao conectar SQLite: {str(e)}")
             return False
     
+    @staticmethod
+    def read_source_shape(conn: sqlite3.Connection) -> Dict[str, Tuple]:
+        """Tabelas e colunas (nome, tipo declarado, posição na PK) de um arquivo SQLite"""
+        shape = {}
+        for table_name, in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'").fetchall():
+            quoted_name = table_name.replace('"', '""')
+            shape[table_name] = tuple((col[1], (col[2] or '').upper(), col[5])
+                                      for col in conn.execute(f'PRAGMA table_info("{quoted_name}")'))
+        return shape
+    
+    def check_source_schemas(self) -> bool:
+        """Confere que todos os arquivos têm as tabelas e colunas do primeiro
+        
+        O catálogo (e o DDL no Oracle) vem só do primeiro arquivo: a divergência
+        é apontada antes de criar qualquer tabela.
+        """
+        reference = self.read_source_shape(self.sqlite_conn)
+        for db_path in self.sqlite_sources[1:]:
+            conn = self.open_sqlite_source(db_path)
+            try:
+                shape = self.read_source_shape(conn)
+            finally:
+                conn.close()
+            if shape != reference:
+                differing = sorted(name for name in set(shape) | set(reference)
+                                   if shape.get(name) != reference.get(name))
+                print(f"ERRO: '{db_path}' tem esquema diferente de '{self.sqlite_sources[0]}' "
+                      f"(tabelas: {', '.join(differing)})")
+                return False
+        print(f"✓ {len(self.sqlite_sources)} arquivos SQLite com o mesmo esquema")
+        return True
+    
     def connect_oracle(self) -> bool:
         """Conecta ao banco Oracle (suporta SID e Service Name)"""
         print(f"\n[3/7] Conectando ao Oracle...")
@@ -165,27 +1737,26 @@ class MigrationTool:
             print("ERRO: Configure 'service_name' OU 'sid' na seção [ORACLE]")
             return False
         
+        if self.driver is None:
+            try:
+                self.driver = OracleDriver.load(self.oracle_driver)
+            except ImportError as e:
+                print(f"ERRO: {e}")
+                return False
+            print(f"  • Driver: {self.driver.describe()}")
+        
         # Tentar conexão com Service Name (prioridade)
         if service_name:
             try:
                 print(f"  • Tentando conexão com Service Name: {service_name}")
-                dsn = cx_Oracle.makedsn(
-                    host,
-                    port,
-                    service_name=service_name
-                )
-                
-                self.oracle_conn = cx_Oracle.connect(
-                    user=user,
-                    password=password,
-                    dsn=dsn,
-                    encoding="UTF-8"
-                )
+                dsn = self.driver.makedsn(host, port, service_name=service_name)
+                self.oracle_conn = self.driver.connect(user, password, dsn)
                 
+                self.oracle_dsn = dsn
                 print(f"✓ Conectado ao Oracle: {user}@{service_name} (Service Name)")
                 return True
                 
-            except cx_Oracle.DatabaseError as e:
+            except self.driver.DatabaseError as e:
                 error_obj, = e.args
                 print(f"  ✗ Falha com Service Name: {error_obj.message}")
                 
@@ -202,23 +1773,14 @@ class MigrationTool:
                 if not service_name:  # Só exibe se não tentou service_name antes
                     print(f"  • Tentando conexão com SID: {sid}")
                 
-                dsn = cx_Oracle.makedsn(
-                    host,
-                    port,
-                    sid=sid
-                )
-                
-                self.oracle_conn = cx_Oracle.connect(
-                    user=user,
-                    password=password,
-                    dsn=dsn,
-                    encoding="UTF-8"
-                )
+                dsn = self.driver.makedsn(host, port, sid=sid)
+                self.oracle_conn = self.driver.connect(user, password, dsn)
                 
+                self.oracle_dsn = dsn
                 print(f"✓ Conectado ao Oracle: {user}@{sid} (SID)")
                 return True
                 
-            except cx_Oracle.DatabaseError as e:
+            except self.driver.DatabaseError as e:
                 error_obj, = e.args
                 print(f"  ✗ Falha com SID: {error_obj.message}")
                 print(f"\nERRO ao conectar Oracle: {error_obj.message}")
@@ -226,333 +1788,2180 @@ class MigrationTool:
         
         return False
     
+    def create_oracle_pool(self) -> bool:
+        """Cria pool de sessões Oracle para os workers paralelos"""
+        if self.workers <= 1:
+            return True
+        
+        try:
+            self.oracle_pool = self.driver.create_pool(self.config['ORACLE']['user'],
+                                                       self.config['ORACLE']['password'],
+                                                       self.oracle_dsn, self.workers)
+            print(f"✓ Pool de sessões Oracle criado ({self.workers} sessões)")
+            return True
+        except self.driver.DatabaseError as e:
+            error_obj, = e.args
+            print(f"ERRO ao criar pool de sessões Oracle: {error_obj.message}")
+            return False
+    
+    def create_async_writer(self) -> bool:
+        """Cria o pool assíncrono da escrita com lotes em voo (async_depth > 1)"""
+        if self.async_depth <= 1:
+            return True
+        if not self.driver.supports_async:
+            print("  ⚠ AVISO: async_depth exige python-oracledb (driver = oracledb); usando escrita síncrona")
+            self.async_depth = 1
+            return True
+        
+        connections = self.workers * self.async_depth
+        try:
+            self.async_writer = AsyncBatchWriter(self.driver, self.config['ORACLE']['user'],
+                                                 self.config['ORACLE']['password'], self.oracle_dsn, connections)
+            print(f"✓ Pool assíncrono criado ({connections} conexões, {self.async_depth} lotes em voo por tabela)")
+            return True
+        except self.driver.DatabaseError as e:
+            error_obj, = e.args
+            print(f"ERRO ao criar pool assíncrono: {error_obj.message}")
+            return False
+    
+    def connect_sqlite_reader(self) -> sqlite3.Connection:
+        """Conexão de leitura ao SQLite (uma por worker)
+        
+        Com snapshot, entrega os leitores abertos junto com a conexão principal.
+        """
+        with self._stats_lock:
+            if self._snapshot_readers:
+                return self._snapshot_readers.pop()
+        return self.open_sqlite_source()
+    
+    def get_worker_connections(self) -> Tuple[sqlite3.Connection, Any]:
+        """Retorna as conexões SQLite/Oracle exclusivas da thread atual"""
+        local = self._worker_local
+        if getattr(local, 'sqlite_conn', None) is None:
+            local.sqlite_conn = self.connect_sqlite_reader()
+            local.oracle_conn = self.oracle_pool.acquire()
+            with self._stats_lock:
+                self._worker_sessions.append((local.sqlite_conn, local.oracle_conn))
+        return local.sqlite_conn, local.oracle_conn
+    
+    def release_worker_connections(self):
+        """Fecha conexões SQLite e devolve sessões Oracle dos workers"""
+        for sqlite_conn, oracle_conn in self._worker_sessions:
+            try:
+                sqlite_conn.close()
+            except Exception:
+                pass
+            try:
+                self.oracle_pool.release(oracle_conn)
+            except Exception:
+                pass
+        self._worker_sessions = []
+    
+    def log(self, message: str, table_name: str = None):
+        """Imprime mensagem de forma segura entre threads"""
+        with self._print_lock:
+            if table_name and self.workers > 1:
+                print(f"    [{table_name}] {message}")
+            else:
+                print(f"    {message}")
+    
+    def record_rows(self, table_name: str, rows: int):
+        """Acumula registros efetivamente gravados no Oracle para a tabela"""
+        with self._stats_lock:
+            stats = self.table_results.setdefault(table_name, {'rows': 0, 'elapsed': 0.0, 'ok': None})
+            stats['rows'] += rows
+        self.metrics.add(table_name, rows=rows)
+    
+    def record_date_failures(self, table_name: str, columns: List[str],
+                             converters: List[Tuple[int, Any]], show_progress: bool = False):
+        """Acumula e reporta datas não reconhecidas por coluna"""
+        failures = {columns[idx]: parser.failures for idx, parser in converters
+                    if getattr(parser, 'failures', 0)}
+        if not failures:
+            return
+        
+        with self._stats_lock:
+            table_failures = self.table_results[table_name].setdefault('date_failures', {})
+            for column, count in failures.items():
+                table_failures[column] = table_failures.get(column, 0) + count
+        self.metrics.add(table_name, date_failures=sum(failures.values()))
+        
+        if show_progress:
+            print()
+        for column, count in failures.items():
+            self.log(f"⚠ {count:,} valores de data não reconhecidos em '{column}' (enviados como texto)",
+                     table_name)
+    
+    def get_reject_writer(self, table_name: str, columns: List[str]) -> RejectWriter:
+        """Arquivo de rejeitados da tabela (criado no primeiro registro rejeitado)"""
+        with self._stats_lock:
+            writer = self._reject_writers.get(table_name)
+            if writer is None:
+                writer = RejectWriter(self.reject_dir, self.reject_format, table_name, columns,
+                                      append=self.resume)
+                self._reject_writers[table_name] = writer
+            return writer
+    
+    def handle_batch_errors(self, table_name: str, columns: List[str],
+                            batch: List[Tuple], errors: List[Any]) -> int:
+        """Grava os registros rejeitados de um executemany e aplica max_errors
+        
+        `errors` vem de getbatcherrors(). Retorna as posições rejeitadas no lote;
+        excedido o limite da tabela, gera RuntimeError: a carga da tabela é
+        interrompida e só os lotes ainda não confirmados são desfeitos. Os já
+        confirmados (commit_interval, escrita assíncrona) ficam no Oracle; a
+        tabela é completada com --resume (checkpoint) ou recarregada com
+        mode = truncate.
+        """
+        if not errors:
+            return []
+        
+        writer = self.get_reject_writer(table_name, columns)
+        writer.write([(batch[error.offset], error.code, error.message) for error in errors])
+        with self._stats_lock:
+            stats = self.table_results[table_name]
+            stats['rejected'] = stats.get('rejected', 0) + len(errors)
+            total_rejected = stats['rejected']
+        self.metrics.add(table_name, rejected=len(errors))
+        
+        if self.max_errors and total_rejected > self.max_errors:
+            raise RuntimeError(f"{total_rejected:,} registros rejeitados excedem max_errors = "
+                               f"{self.max_errors:,} (ver {writer.path})")
+        return [error.offset for error in errors]
+    
+    def get_streamed_lob_columns(self, table_name: str, column_types: List[str]) -> List[int]:
+        """Posições das colunas BLOB/CLOB copiadas em blocos (blobopen → LOB.write)
+        
+        Com lob_streaming = auto, só quando algum valor da tabela excede
+        lob_chunk_size; tabelas WITHOUT ROWID usam sempre o caminho comum.
+        """
+        if table_name in self._lob_columns:
+            return self._lob_columns[table_name]
+        
+        lob_columns = [idx for idx, oracle_type in enumerate(column_types)
+                       if oracle_type.upper() in ('BLOB', 'CLOB')]
+        if self.lob_streaming == 'false' or not lob_columns:
+            lob_columns = []
+        elif not self.has_rowid(table_name):
+            self.log("⚠ Tabela sem rowid: LOBs enviados inteiros no lote", table_name)
+            lob_columns = []
+        elif self.lob_streaming == 'auto':
+            # length() de BLOB lê apenas o cabeçalho do registro, não o conteúdo
+            # (todos os arquivos de origem: basta um valor grande em qualquer um)
+            names = [col[1] for col in self.catalog.tables[table_name]['columns']]
+            lengths = ', '.join(f'MAX(length("{names[idx]}"))' for idx in lob_columns)
+            largest = [length for conn in self.each_sqlite_source()
+                       for length in conn.execute(f'SELECT {lengths} FROM "{table_name}"').fetchone()]
+            if not any((length or 0) > self.lob_chunk_size for length in largest):
+                lob_columns = []
+        
+        self._lob_columns[table_name] = lob_columns
+        return lob_columns
+    
+    def read_lob_chunks(self, sqlite_conn: sqlite3.Connection, table_name: str,
+                        column: str, rowid: int):
+        """Lê o valor em blocos de lob_chunk_size via E/S incremental do SQLite"""
+        if hasattr(sqlite_conn, 'blobopen'):
+            with sqlite_conn.blobopen(table_name, column, rowid, readonly=True) as blob:
+                while True:
+                    chunk = blob.read(self.lob_chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+        
+        # Python < 3.11 (sem blobopen): um valor inteiro por vez, nunca o lote
+        value = sqlite_conn.execute(f'SELECT CAST("{column}" AS BLOB) FROM "{table_name}" WHERE rowid = ?',
+                                    (rowid,)).fetchone()[0] or b''
+        for start in range(0, len(value), self.lob_chunk_size):
+            yield value[start:start + self.lob_chunk_size]
+    
+    def stream_lobs(self, sqlite_conn: sqlite3.Connection, table_name: str, columns: List[str],
+                    column_types: List[str], lob_columns: List[int], rowids: List[int],
+                    batch: List[Tuple], lob_vars: List[Any], rejected: List[int]) -> int:
+        """Copia os LOBs do lote para os localizadores devolvidos pelo RETURNING
+        
+        Cada valor é lido do SQLite e gravado com LOB.write bloco a bloco, de modo
+        que a memória fica limitada a um bloco independentemente do tamanho do LOB.
+        Retorna a quantidade de bytes copiados.
+        """
+        copied = 0
+        skip = set(rejected)
+        for idx, lob_var in zip(lob_columns, lob_vars):
+            is_clob = column_types[idx].upper() == 'CLOB'
+            for pos, rowid in enumerate(rowids):
+                if pos in skip or batch[pos][idx] != 1:
+                    continue  # Rejeitado ou NULL
+                lob = lob_var.getvalue(pos)
+                if isinstance(lob, list):
+                    lob = lob[0] if lob else None  # DML RETURNING: lista por linha
+                if lob is None:
+                    continue
+                
+                # CLOB: bytes UTF-8 decodificados incrementalmente (blocos podem cortar caracteres)
+                decoder = codecs.getincrementaldecoder('utf-8')('replace') if is_clob else None
+                offset = 1
+                for chunk in self.read_lob_chunks(sqlite_conn, table_name, columns[idx], rowid):
+                    copied += len(chunk)
+                    data = decoder.decode(chunk) if decoder else chunk
+                    if data:
+                        lob.write(data, offset)
+                        offset += len(data)
+                if decoder:
+                    tail = decoder.decode(b'', final=True)
+                    if tail:
+                        lob.write(tail, offset)
+        return copied
+    
+    def uses_direct_path(self) -> bool:
+        """Indica se as inserções usam direct-path (/*+ APPEND_VALUES */)"""
+        return self.load_profile == 'bulk' and self.append_hint
+    
+    def describe_load_profile(self) -> str:
+        """Descrição do perfil de carga e da política de commit"""
+        parts = []
+        if self.load_profile == 'bulk':
+            if self.append_hint:
+                parts.append('APPEND_VALUES')
+            if self.nologging:
+                parts.append('NOLOGGING')
+        if self.commit_policy == 'table':
+            parts.append('commit por tabela')
+        elif self.commit_policy == 'end':
+            parts.append('commit único no final')
+        else:
+            parts.append(f"commit a cada {self.commit_every} lote(s)")
+        return f"{self.load_profile.upper()} ({', '.join(parts)})"
+    
+    def finish_transactions(self, commit: bool):
+        """Confirma ou desfaz as transações abertas (commit_interval = end)"""
+        connections = [self.oracle_conn] + [oracle_conn for _, oracle_conn in self._worker_sessions]
+        for oracle_conn in connections:
+            if commit:
+                oracle_conn.commit()
+            else:
+                oracle_conn.rollback()
+    
+    def open_journal(self) -> bool:
+        """Abre (ou reinicia) o diário de checkpoints"""
+        if not self.checkpoint:
+            return True
+        
+        if self.resume and not os.path.exists(self.checkpoint_file):
+            print(f"  ⚠ AVISO: checkpoint '{self.checkpoint_file}' não encontrado; iniciando do zero")
+        try:
+            source_database = self.config['SQLITE']['database'] if self.fan_in else self.sqlite_sources[0]
+            self.journal = CheckpointJournal(self.checkpoint_file, source_database,
+                                             resume=self.resume)
+            return True
+        except (sqlite3.Error, ValueError) as e:
+            print(f"ERRO ao abrir checkpoint: {str(e)}")
+            return False
+    
+    def is_table_done(self, table_name: str, force: bool = False) -> bool:
+        """Verifica no checkpoint se a tabela já foi concluída (marca como pulada)"""
+        if not force:
+            if not self.journal:
+                return False
+            checkpoint = self.journal.get(table_name)
+            if not checkpoint or checkpoint['status'] != 'done':
+                return False
+        
+        self.table_results[table_name].update({'ok': True, 'skipped': True})
+        self.log("↷ Já migrada (checkpoint)", table_name)
+        return True
+    
+    def reconcile_checkpoint(self, table_name: str, sqlite_conn: sqlite3.Connection, oracle_conn: Any,
+                             checkpoint: Dict[str, Any], rowid_range: Tuple[int, int] = None,
+                             source: str = None) -> Dict[str, Any]:
+        """Confere com o Oracle o checkpoint retomado antes de continuar a carga
+        
+        O diário é gravado logo após cada commit no Oracle; se o processo morrer
+        entre os dois, o último lote confirmado fica fora da marca d'água e seria
+        gravado de novo. Com chave INTEGER PRIMARY KEY (alias do rowid), a marca
+        d'água avança até o MAX da chave já gravada na faixa; sem ela, a contagem
+        da tabela no Oracle indica quantos registros seguintes pular. Em mode =
+        append a tabela pode ter dados anteriores à carga: não há como conferir.
+        """
+        if self.mode == 'append':
+            self.log("⚠ Checkpoint não conferido com o Oracle (mode = append): o último lote pode se repetir",
+                     table_name)
+            return checkpoint
+        
+        oracle_table = self.load_target(table_name)
+        key = self.get_sync_key(table_name, self.catalog.tables[table_name]['columns'])
+        
+        conditions, params = [], {}
+        if self.source_column:
+            conditions.append(f"{self.source_column} = :source")
+            params['source'] = source or self.sqlite_sources[0]
+        elif self.fan_in:
+            self.log("⚠ Checkpoint não conferido com o Oracle (vários arquivos sem source_column): "
+                     "o último lote pode se repetir", table_name)
+            return checkpoint
+        
+        cursor = oracle_conn.cursor()
+        last_rowid, rows = checkpoint['last_rowid'], checkpoint['rows']
+        if key:
+            oracle_key = self.normalize_name(key)
+            if last_rowid is not None:
+                conditions.append(f"{oracle_key} > :last_rowid")
+                params['last_rowid'] = last_rowid
+            if rowid_range is not None:
+                conditions.append(f"{oracle_key} BETWEEN :range_low AND :range_high")
+                params['range_low'], params['range_high'] = rowid_range
+            where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+            cursor.execute(f"SELECT COUNT(*), MAX({oracle_key}) FROM {oracle_table}{where_clause}", params)
+            extra, max_key = cursor.fetchone()
+            if not extra:
+                return checkpoint
+            last_rowid, rows = int(max_key), rows + int(extra)
+        elif rowid_range is None:
+            where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+            cursor.execute(f"SELECT COUNT(*) FROM {oracle_table}{where_clause}", params)
+            extra = int(cursor.fetchone()[0] or 0) - rows
+            if extra <= 0:
+                return checkpoint
+            found = sqlite_conn.execute(
+                f'SELECT rowid FROM "{table_name}" WHERE rowid > ? ORDER BY rowid LIMIT 1 OFFSET ?',
+                (last_rowid if last_rowid is not None else -2 ** 63, extra - 1)).fetchone()
+            if found is None:
+                return checkpoint
+            last_rowid, rows = found[0], rows + extra
+        else:
+            self.log("⚠ Checkpoint do bloco não conferido com o Oracle (sem chave INTEGER PRIMARY KEY): "
+                     "o último lote pode se repetir", table_name)
+            return checkpoint
+        
+        self.log(f"↻ {rows - checkpoint['rows']:,} registros confirmados no Oracle após o último "
+                 f"checkpoint: marca d'água avançada para rowid {last_rowid:,}", table_name)
+        self.journal.save(table_name, rowid_range, 'partial', last_rowid, rows, source)
+        return {'status': 'partial', 'last_rowid': last_rowid, 'rows': rows}
+    
+    def restart_checkpoint(self, table_name: str, oracle_conn: Any, checkpoint: Dict[str, Any],
+                           rowid_range: Tuple[int, int] = None, source: str = None) -> Dict[str, Any]:
+        """Descarta o que um bloco sem rowid já gravou no Oracle e o recarrega do início
+        
+        Tabelas WITHOUT ROWID não têm marca d'água: a leitura recomeça do primeiro
+        registro e, como chaves e índices só são criados após a carga, nada no
+        Oracle rejeitaria os registros repetidos. Em mode = append (dados
+        anteriores à carga) ou com vários arquivos sem source_column não há como
+        separar o que este bloco gravou.
+        """
+        if self.mode == 'append' or (self.fan_in and not self.source_column):
+            reason = "mode = append" if self.mode == 'append' else "vários arquivos sem source_column"
+            self.log(f"⚠ Tabela sem rowid retomada do início sem limpar o Oracle ({reason}): "
+                     f"registros já gravados se repetem", table_name)
+            return checkpoint
+        
+        oracle_table = self.load_target(table_name)
+        cursor = oracle_conn.cursor()
+        if self.source_column:
+            cursor.execute(f"DELETE FROM {oracle_table} WHERE {self.source_column} = :source",
+                           {'source': source or self.sqlite_sources[0]})
+        else:
+            cursor.execute(f"DELETE FROM {oracle_table}")
+        oracle_conn.commit()
+        self.log(f"↻ Tabela sem rowid: {cursor.rowcount:,} registros já gravados descartados, "
+                 f"carga reiniciada do início", table_name)
+        self.journal.save(table_name, rowid_range, 'partial', None, 0, source)
+        return {'status': 'partial', 'last_rowid': None, 'rows': 0}
+    
+    def has_rowid(self, table_name: str) -> bool:
+        """Indica se a tabela possui rowid (tabelas WITHOUT ROWID não possuem)"""
+        if table_name not in self._rowid_tables:
+            try:
+                self.sqlite_conn.execute(f'SELECT rowid FROM "{table_name}" LIMIT 0')
+                self._rowid_tables[table_name] = True
+            except sqlite3.OperationalError:
+                self._rowid_tables[table_name] = False
+        return self._rowid_tables[table_name]
+    
     def normalize_name(self, name: str) -> str:
         """Normaliza nome de tabela/coluna"""
         if self.normalize_names:
             return name.replace(' ', '_').upper()
         return name
     
+    def load_catalog(self) -> SchemaCatalog:
+        """Carrega o catálogo do esquema do cache ou analisa o SQLite uma única vez"""
+        self.catalog = SchemaCatalog(self.sqlite_sources[0], self.schema_cache or None)
+        if not self.catalog.load():
+            self.catalog.build(self.sqlite_conn)
+        return self.catalog
+    
     def get_sqlite_tables(self) -> List[str]:
         """Obtém lista de tabelas do SQLite"""
         print(f"\n[4/7] Analisando estrutura do SQLite...")
-        cursor = self.sqlite_conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
-        tables = [row[0] for row in cursor.fetchall()]
+        self.load_catalog()
+        if self.catalog.from_cache:
+            print(f"✓ Catálogo do esquema reaproveitado de '{self.schema_cache}' (banco inalterado)")
+        tables = self.catalog.table_names()
         print(f"✓ Encontradas {len(tables)} tabelas no SQLite")
         return tables
     
-    def extract_column_type_from_ddl(self, ddl: str, column_name: str) -> str:
-        """Extrai o tipo exato de uma coluna do DDL"""
-        if not ddl:
-            return None
+    @timed_phase('introspect')
+    def get_table_info(self, table_name: str) -> Tuple[List[Tuple], int]:
+        """Obtém informações da tabela SQLite (colunas do catálogo e contagem)"""
+        catalog = self.catalog or self.load_catalog()
+        info = catalog.tables[table_name]
+        
+        count = info['count']
+        if count is None and self.row_count == 'estimate':
+            count = self.estimate_row_count(table_name)
+            if count is not None:
+                self.estimated_counts.add(table_name)
+        if count is None:
+            cursor = self.sqlite_conn.cursor()
+            cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
+            count = cursor.fetchone()[0]
+            catalog.set_count(table_name, count)
+        
+        self.table_counts[table_name] = count
+        return list(info['columns']), count
+    
+    def estimate_row_count(self, table_name: str, conn: sqlite3.Connection = None) -> int:
+        """Contagem aproximada sem varrer a tabela: sqlite_stat1 (ANALYZE) ou max(rowid)
+        
+        Retorna None quando não há estimativa (WITHOUT ROWID sem estatísticas).
+        """
+        conn = conn or self.sqlite_conn
+        try:
+            stats = conn.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = ?",
+                                             (table_name,)).fetchall()
+        except sqlite3.OperationalError:
+            stats = []  # ANALYZE nunca executado
+        # 1º número de cada linha: registros da tabela (ou do índice)
+        estimates = [int(stat.split()[0]) for stat, in stats if stat and stat.split()[0].isdigit()]
+        if estimates:
+            return max(estimates)
+        try:
+            max_rowid = conn.execute(f'SELECT MAX(rowid) FROM "{table_name}"').fetchone()[0]
+        except sqlite3.OperationalError:
+            return None
+        return max(max_rowid or 0, 0)
+    
+    def count_source_rows(self, tables: List[str]):
+        """Registros de cada tabela nos demais arquivos (carga de vários arquivos)
+        
+        Seguem row_count (COUNT(*) ou estimativa); o primeiro arquivo usa a
+        contagem do catálogo. Servem ao escalonamento e aos totais do passo [5/7].
+        """
+        for db_path in self.sqlite_sources[1:]:
+            conn = self.open_sqlite_source(db_path)
+            try:
+                for table in tables:
+                    count = self.estimate_row_count(table, conn) if self.row_count == 'estimate' else None
+                    if count is None:
+                        count = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+                    else:
+                        self.estimated_counts.add(table)
+                    self.source_counts[(table, db_path)] = count
+            finally:
+                conn.close()
+    
+    def each_sqlite_source(self):
+        """Conexão com cada arquivo SQLite de origem: a principal e, com vários arquivos, os demais"""
+        yield self.sqlite_conn
+        for db_path in self.sqlite_sources[1:]:
+            conn = self.open_sqlite_source(db_path)
+            try:
+                yield conn
+            finally:
+                conn.close()
+    
+    def estimate_row_bytes(self, table_name: str) -> int:
+        """Largura média da linha (bytes) estimada em uma amostra, guardada no catálogo
+        
+        Mesma medida de estimate_batch_bytes, calculada pelo SQLite: length() de
+        BLOB lê apenas o cabeçalho do registro, então nenhum LOB é carregado.
+        """
+        info = self.catalog.tables[table_name]
+        if info.get('row_bytes') is None:
+            widths = []
+            for col in info['columns']:
+                name = '"' + col[1].replace('"', '""') + '"'
+                widths.append(f"CASE typeof({name}) WHEN 'null' THEN 0 WHEN 'integer' THEN 8 "
+                              f"WHEN 'real' THEN 8 ELSE length({name}) END")
+            count, total = self.sqlite_conn.execute(
+                f'SELECT COUNT(*), SUM(width) FROM (SELECT {" + ".join(widths) or "0"} AS width '
+                f'FROM "{table_name}" LIMIT 200)').fetchone()
+            self.catalog.set_row_bytes(table_name, total // count if count else 0)
+        return info['row_bytes']
+    
+    def estimate_load_seconds(self, rows: int, row_bytes: int) -> float:
+        """Custo relativo de carga pelo modelo padrão (ordena o escalonamento)"""
+        return rows * (DEFAULT_ROW_SECONDS + row_bytes * DEFAULT_BYTE_SECONDS)
+    
+    def order_tables(self, tables: List[str], table_info: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Ordem de carga das tabelas (schedule = largest: maior custo primeiro)"""
+        if self.schedule != 'largest':
+            return list(tables)
+        costs = {table: self.estimate_load_seconds(table_info[table]['count'], table_info[table]['row_bytes'])
+                 for table in tables}
+        return schedule_largest_first(costs)[0]
+    
+    def map_sqlite_to_oracle_type(self, sqlite_type: str) -> str:
+        """Mapeia tipos SQLite para Oracle (preservando precisão e escala)"""
+        return self.type_mapper.resolve(sqlite_type)
+    
+    def profile_table_columns(self, table_name: str, columns: List[Tuple]) -> List[Dict[str, int]]:
+        """Levanta perfil real das colunas (classes de armazenamento e tamanhos)
+        
+        Uma única varredura por tabela calcula, para cada coluna, a quantidade
+        de valores por classe do SQLite, o maior texto (em bytes UTF-8), o maior
+        BLOB e a maior quantidade de dígitos dos inteiros. Com vários arquivos,
+        cada um é varrido e o perfil soma as quantidades e guarda os máximos.
+        """
+        metrics = ('text', 'integer', 'real', 'blob', 'max_bytes', 'max_blob', 'max_digits')
+        select_parts = []
+        for col in columns:
+            name = col[1].replace('"', '""')
+            select_parts.extend([
+                f'SUM(typeof("{name}") = \'text\')',
+                f'SUM(typeof("{name}") = \'integer\')',
+                f'SUM(typeof("{name}") = \'real\')',
+                f'SUM(typeof("{name}") = \'blob\')',
+                f'MAX(CASE WHEN typeof("{name}") = \'text\' THEN length(CAST("{name}" AS BLOB)) END)',
+                f'MAX(CASE WHEN typeof("{name}") = \'blob\' THEN length("{name}") END)',
+                f'MAX(CASE WHEN typeof("{name}") = \'integer\' THEN length(CAST("{name}" AS TEXT)) END)',
+            ])
+        
+        profile = [dict.fromkeys(metrics, 0) for _ in columns]
+        for conn in self.each_sqlite_source():
+            values = conn.execute(f'SELECT {", ".join(select_parts)} FROM "{table_name}"').fetchone()
+            for idx, col_profile in enumerate(profile):
+                chunk = values[idx * len(metrics):(idx + 1) * len(metrics)]
+                for metric, value in zip(metrics, chunk):
+                    if metric.startswith('max_'):
+                        col_profile[metric] = max(col_profile[metric], value or 0)
+                    else:
+                        col_profile[metric] += value or 0
+        return profile
+    
+    def refine_oracle_type(self, oracle_type: str, profile: Dict[str, int]) -> str:
+        """Ajusta tipos genéricos (VARCHAR2(4000)/NUMBER) ao perfil real da coluna"""
+        if not profile:
+            return oracle_type
+        
+        has_text = profile['text'] > 0
+        has_numbers = profile['integer'] > 0 or profile['real'] > 0
+        only_integers = profile['integer'] > 0 and not (has_text or profile['real'] or profile['blob'])
+        
+        if oracle_type == 'VARCHAR2(4000)':
+            if has_text and not (has_numbers or profile['blob']) and profile['max_bytes'] <= 4000:
+                return f"VARCHAR2({max(profile['max_bytes'], 1)})"
+            if has_text and not profile['blob'] and profile['max_bytes'] > 4000:
+                return 'CLOB'  # Textos acima de 4000 bytes não cabem em VARCHAR2
+            if has_numbers and not (has_text or profile['blob']):
+                oracle_type = 'NUMBER'
+        
+        if oracle_type == 'NUMBER' and only_integers and profile['max_digits'] <= 38:
+            return f"NUMBER({max(profile['max_digits'], 1)})"
+        
+        return oracle_type
+    
+    def find_long_text_columns(self, table_name: str, names: List[str]) -> List[int]:
+        """Posições (em `names`) das colunas com algum texto acima de 4000 bytes
+        
+        Sonda leve usada sem profile_columns: só MAX(length) em bytes UTF-8
+        (CAST AS BLOB), em todos os arquivos de origem.
+        """
+        lengths = ', '.join('MAX(length(CAST("' + name.replace('"', '""') + '" AS BLOB)))' for name in names)
+        largest = [0] * len(names)
+        for conn in self.each_sqlite_source():
+            row = conn.execute(f'SELECT {lengths} FROM "{table_name}"').fetchone()
+            largest = [max(previous, length or 0) for previous, length in zip(largest, row)]
+        return [idx for idx, length in enumerate(largest) if length > 4000]
+    
+    def build_input_sizes(self, profile: List[Dict[str, int]], oracle_types: List[str]) -> List[Any]:
+        """Monta os tamanhos exatos de bind para cursor.setinputsizes
+        
+        Colunas só texto usam o maior tamanho observado; colunas só numéricas
+        usam NUMBER. Colunas mistas, datas e BLOBs ficam a cargo do driver (None).
+        """
+        input_sizes = []
+        number_type = self.driver.module.NUMBER if self.driver else None  # Sem driver: --export
+        for col, oracle_type in zip(profile, oracle_types):
+            has_text = col['text'] > 0
+            has_numbers = col['integer'] > 0 or col['real'] > 0
+            if oracle_type.upper().startswith(('DATE', 'TIMESTAMP')):
+                input_sizes.append(None)  # Convertidas para datetime no carregamento
+            elif has_text and not (has_numbers or col['blob']) and col['max_bytes'] <= 4000:
+                input_sizes.append(max(col['max_bytes'], 1))
+            elif has_numbers and not (has_text or col['blob']):
+                input_sizes.append(number_type)
+            else:
+                input_sizes.append(None)
+        return input_sizes
+    
+    @timed_phase('ddl')
+    def create_oracle_table(self, table_name: str, columns: List[Tuple], oracle_types: List[str]) -> bool:
+        """Cria tabela no Oracle (tipos resolvidos por build_oracle_types)"""
+        oracle_table_name = self.load_target(table_name)
+        cursor = self.oracle_conn.cursor()
+        
+        try:
+            # Se modo truncate, dropar tabela existente (em swap, a staging de uma carga anterior)
+            if self.mode in ('truncate', 'swap'):
+                try:
+                    cursor.execute(f"DROP TABLE {oracle_table_name} PURGE")
+                    self.oracle_conn.commit()
+                except self.driver.DatabaseError:
+                    pass  # Tabela não existe
+            
+            # Verificar se tabela já existe
+            cursor.execute("""
+                SELECT COUNT(*) FROM user_tables 
+                WHERE table_name = :1
+            """, (oracle_table_name,))
+            
+            exists = cursor.fetchone()[0] > 0
+            
+            if exists and self.mode in ('append', 'sync'):
+                return True  # Tabela já existe, modo append/sync
+            
+            # Criar tabela
+            if self.debug_mode:
+                for col, oracle_type in zip(columns, oracle_types):
+                    print(f"      {self.normalize_name(col[1])}: {col[2] if col[2] else 'TEXT'} → {oracle_type}")
+            
+            create_sql = self.create_table_sql(oracle_table_name, columns, oracle_types, self.source_column)
+            if self.load_profile == 'bulk' and self.nologging:
+                create_sql += " NOLOGGING"
+            
+            if self.debug_mode:
+                print(f"      SQL: {create_sql}")
+            
+            cursor.execute(create_sql)
+            self.oracle_conn.commit()
+            self.created_tables.append(table_name)
+            
+            return True
+            
+        except Exception as e:
+            print(f"    ERRO ao criar tabela: {str(e)}")
+            if self.debug_mode:
+                import traceback
+                traceback.print_exc()
+            return False
+    
+    def create_table_sql(self, oracle_table_name: str, columns: List[Tuple], oracle_types: List[str],
+                         source_column: str = None) -> str:
+        """CREATE TABLE com os tipos resolvidos (carga direta e --export)"""
+        col_defs = [f"{self.normalize_name(col[1])} {oracle_type}" for col, oracle_type in zip(columns, oracle_types)]
+        if source_column:
+            col_defs.append(f"{source_column} VARCHAR2(512)")
+        return f"CREATE TABLE {oracle_table_name} ({', '.join(col_defs)})"
+    
+    def load_target(self, table_name: str) -> str:
+        """Nome da tabela Oracle que recebe os dados (a staging em mode = swap)"""
+        return self.staging_tables.get(table_name) or self.normalize_name(table_name)
+    
+    def source_tag(self, source: str = None) -> str:
+        """Literal SQL com o arquivo de origem para source_column (None se desativada)
+        
+        Um literal por arquivo no INSERT evita copiar cada linha para acrescentar
+        o valor ao lote.
+        """
+        if not self.source_column:
+            return None
+        return "'" + (source or self.sqlite_sources[0]).replace("'", "''") + "'"
+    
+    def max_identifier_length(self) -> int:
+        """Tamanho máximo de identificadores no Oracle conectado (30 antes do 12.2)"""
+        version = tuple(int(part) for part in re.findall(r'\d+', getattr(self.oracle_conn, 'version', '') or '')[:2])
+        return 128 if version >= (12, 2) else 30
+    
+    def check_swap_names(self, tables: List[str]) -> bool:
+        """Confere se os nomes _STG/_OLD da troca cabem no limite de identificadores
+        
+        Verificado antes de criar qualquer staging: um nome longo demais só
+        falharia depois da carga, no CREATE INDEX ou no RENAME.
+        """
+        limit = self.max_identifier_length()
+        too_long = []
+        for table in tables:
+            names = [self.staging_tables[table], f"{self.normalize_name(table)}{REPLACED_SUFFIX}"]
+            if self.create_indexes:
+                names += [job['name'] for job in self.get_index_jobs(table, warn=False)]
+            too_long += [name for name in names if len(name) > limit]
+        if too_long:
+            print(f"ERRO: mode = swap gera nomes acima de {limit} caracteres: {', '.join(too_long)}")
+            print(f"  Encurte os nomes das tabelas/índices ou use mode = truncate")
+            return False
+        return True
+    
+    def oracle_table_exists(self, oracle_table_name: str) -> bool:
+        """Verifica se a tabela existe no schema Oracle"""
+        cursor = self.oracle_conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM user_tables WHERE table_name = :1", (oracle_table_name,))
+        return cursor.fetchone()[0] > 0
+    
+    def show_progress_bar(self, current: int, total: int, bar_length: int = 50):
+        """Exibe barra de progresso"""
+        percent = current / total if total > 0 else 0
+        filled = int(bar_length * percent)
+        bar = '█' * filled + '░' * (bar_length - filled)
+        print(f"\r    [{bar}] {percent*100:.1f}% ({current:,}/{total:,})", end='', flush=True)
+    
+    def parse_date(self, date_str: str):
+        """Converte string de data para objeto datetime Python"""
+        if not date_str:
+            return None
+        
+        # Se nenhum formato funcionar, retornar string original
+        # Oracle tentará converter
+        result, _ = parse_date_any(date_str)
+        return result
+    
+    def build_column_converters(self, column_types: List[str],
+                                sample_rows: List[Tuple] = None) -> List[Tuple[int, Any]]:
+        """Compila os conversores por coluna (apenas colunas que exigem conversão)
+        
+        Retorna pares (índice, função); colunas ausentes da lista são identidade.
+        O formato de cada coluna de data é inferido a partir de `sample_rows`.
+        """
+        converters = []
+        for idx, col_type in enumerate(column_types):
+            if col_type.upper().startswith(('DATE', 'TIMESTAMP')):
+                # Strings de data → datetime; None, BLOB e números passam intactos
+                samples = [row[idx] for row in (sample_rows or [])[:100]
+                           if row[idx].__class__ is str]
+                converters.append((idx, DateColumnParser(samples, self.date_cache_size)))
+        return converters
+    
+    def build_row_converter(self, converters: List[Tuple[int, Any]]):
+        """Compila o conversor de linha da tabela
+        
+        Retorna None quando todas as colunas são identidade: as tuplas lidas do
+        SQLite são enviadas ao Oracle sem cópia.
+        """
+        if not converters:
+            return None
+        
+        def convert_row(row):
+            converted = list(row)
+            for idx, convert in converters:
+                val = converted[idx]
+                if val.__class__ is str:
+                    converted[idx] = convert(val)
+            return converted
+        
+        return convert_row
+    
+    def get_rowid_ranges(self, table_name: str, count: int, chunk_size: int = None) -> List[Tuple[int, int]]:
+        """Divide a tabela em faixas de rowid com ~chunk_size registros cada"""
+        cursor = self.sqlite_conn.cursor()
+        try:
+            cursor.execute(f'SELECT MIN(rowid), MAX(rowid) FROM "{table_name}"')
+        except sqlite3.OperationalError:
+            return [None]  # Tabela WITHOUT ROWID: migra inteira
+        
+        min_rowid, max_rowid = cursor.fetchone()
+        if min_rowid is None:
+            return [None]
+        
+        # Largura da faixa proporcional à densidade de rowids (tolera lacunas)
+        num_chunks = max(1, -(-count // (chunk_size or self.chunk_size)))
+        span = max_rowid - min_rowid + 1
+        width = max(1, -(-span // num_chunks))
+        
+        ranges = []
+        low = min_rowid
+        while low <= max_rowid:
+            high = min(low + width - 1, max_rowid)
+            ranges.append((low, high))
+            low = high + 1
+        return ranges
+    
+    def migrate_table_data(self, table_name: str, column_types: List[str],
+                           sqlite_conn: sqlite3.Connection = None,
+                           oracle_conn: Any = None,
+                           rowid_range: Tuple[int, int] = None,
+                           range_column: str = 'rowid',
+                           source: str = None) -> bool:
+        """Migra dados de uma tabela (ou de uma faixa de rowid/chave da tabela)
+        
+        Com vários arquivos SQLite, `source` é o arquivo lido por `sqlite_conn`.
+        """
+        oracle_table_name = self.load_target(table_name)
+        sqlite_conn = sqlite_conn or self.sqlite_conn
+        oracle_conn = oracle_conn or self.oracle_conn
+        show_progress = self.workers <= 1 and self.mode != 'sync' and not self.fan_in
+        
+        # LOBs copiados em blocos após o INSERT (o lote leva apenas o indicador de NULL)
+        lob_columns = self.get_streamed_lob_columns(table_name, column_types)
+        
+        # Checkpoint: lê em ordem de rowid para registrar a marca d'água confirmada
+        # (os LOBs também precisam do rowid para a leitura incremental)
+        checkpoint = self.journal.get(table_name, rowid_range, source) if self.journal else None
+        track_rowid = (self.journal is not None or bool(lob_columns)) and self.has_rowid(table_name)
+        if checkpoint and self.resume and checkpoint['status'] != 'done':
+            if track_rowid:
+                checkpoint = self.reconcile_checkpoint(table_name, sqlite_conn, oracle_conn, checkpoint,
+                                                       rowid_range, source)
+            elif self.mode != 'sync':
+                checkpoint = self.restart_checkpoint(table_name, oracle_conn, checkpoint, rowid_range, source)
+        committed_before = checkpoint['rows'] if checkpoint else 0
+        
+        # Filtro por faixa de rowid (bloco paralelo e/ou retomada após a marca d'água)
+        conditions = []
+        where_params = []
+        if rowid_range is not None:
+            conditions.append(f'{range_column} BETWEEN ? AND ?')
+            where_params.extend(rowid_range)
+        if checkpoint and checkpoint['last_rowid'] is not None and track_rowid:
+            conditions.append('rowid > ?')
+            where_params.append(checkpoint['last_rowid'])
+            self.log(f"↻ Retomando após rowid {checkpoint['last_rowid']:,} "
+                     f"({committed_before:,} registros já confirmados)", table_name)
+        where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        select_list = 'rowid, *' if track_rowid else '*'
+        
+        # Escrita assíncrona: até async_depth lotes em voo, cada um confirmado na sua conexão
+        # (LOBs em blocos precisam do localizador na mesma sessão: escrita síncrona)
+        use_async = self.async_writer is not None and not lob_columns
+        in_flight = deque()
+        if lob_columns:
+            select_parts = []
+            for idx, col in enumerate(self.catalog.tables[table_name]['columns']):
+                name = '"' + col[1].replace('"', '""') + '"'
+                select_parts.append(f"typeof({name}) <> 'null' AS {name}" if idx in lob_columns else name)
+            select_list = 'rowid, ' + ', '.join(select_parts)
+        order_clause = ' ORDER BY rowid' if track_rowid else ''
+        
+        try:
+            # Obter estrutura e dados
+            cursor_sqlite = sqlite_conn.cursor()
+            cursor_sqlite.execute(f'SELECT {select_list} FROM "{table_name}"{where_clause}{order_clause}',
+                                  where_params)
+            
+            # Obter nomes das colunas
+            columns = [desc[0] for desc in cursor_sqlite.description]
+            if track_rowid:
+                columns = columns[1:]
+            oracle_columns = [self.normalize_name(col) for col in columns]
+            
+            # Arquivo de origem (source_column) entra como literal após as colunas lidas
+            source_tag = self.source_tag(source)
+            insert_columns = oracle_columns + [self.source_column] if source_tag else oracle_columns
+            extra_values = [source_tag] if source_tag else []
+            
+            # Preparar statement de insert
+            placeholders = ', '.join([f':{i+1}' for i in range(len(columns))] + extra_values)
+            insert_sql = f"INSERT INTO {oracle_table_name} ({', '.join(insert_columns)}) VALUES ({placeholders})"
+            
+            if lob_columns:
+                # LOB vazio (ou NULL) no INSERT; o localizador volta pelo RETURNING
+                values = []
+                for idx in range(len(columns)):
+                    if idx in lob_columns:
+                        empty = 'EMPTY_CLOB()' if column_types[idx].upper() == 'CLOB' else 'EMPTY_BLOB()'
+                        values.append(f"CASE WHEN :{idx+1} = 1 THEN {empty} END")
+                    else:
+                        values.append(f":{idx+1}")
+                returning = ', '.join(oracle_columns[idx] for idx in lob_columns)
+                into = ', '.join(f":{len(columns) + pos + 1}" for pos in range(len(lob_columns)))
+                insert_sql = (f"INSERT INTO {oracle_table_name} ({', '.join(insert_columns)}) "
+                              f"VALUES ({', '.join(values + extra_values)}) RETURNING {returning} INTO {into}")
+            
+            # Direct-path bloqueia a tabela inteira: blocos paralelos (e arquivos carregados
+            # simultaneamente na mesma tabela) usam inserção convencional
+            concurrent_table = rowid_range is not None or (self.fan_in and self.workers > 1) or use_async
+            if self.uses_direct_path() and not concurrent_table and not lob_columns:
+                insert_sql = insert_sql.replace("INSERT INTO", "INSERT /*+ APPEND_VALUES */ INTO", 1)
+            
+            cursor_oracle = oracle_conn.cursor()
+            
+            # Tamanhos exatos de bind (perfil de colunas) evitam re-alocação de buffers
+            input_sizes = self.table_input_sizes.get(table_name)
+            if not (input_sizes and any(size is not None for size in input_sizes)):
+                input_sizes = None
+            if input_sizes and not lob_columns:
+                cursor_oracle.setinputsizes(*input_sizes)
+            
+            # Total só para a barra de progresso (catálogo ou estimativa): sem COUNT(*)
+            total_rows = self.expected_rows(table_name, rowid_range, committed_before)
+            
+            # Lote adaptativo: tamanho recalculado entre um executemany e o próximo
+            sizer = AdaptiveBatchSizer(self.batch_size, self.batch_memory, self.batch_latency) \
+                if self.adaptive_batch else None
+            
+            def read_batch():
+                # Retorna (linhas, maior rowid do lote); o rowid lido é removido das linhas
+                # (com LOBs em blocos ele segue na 1ª posição até a gravação)
+                rows = cursor_sqlite.fetchmany(sizer.size if sizer else self.batch_size)
+                if not track_rowid or not rows:
+                    return rows, None
+                if lob_columns:
+                    return rows, rows[-1][0]
+                return [row[1:] for row in rows], rows[-1][0]
+            
+            # Conversor compilado uma vez por tabela (None = linhas passam intactas)
+            # O primeiro lote serve de amostra para inferir o formato das datas
+            rows, watermark = read_batch()
+            if not rows:
+                if rowid_range is None and not checkpoint and not self.fan_in:
+                    self.log("⚠ Tabela vazia", table_name)
+                if self.journal and self.commit_policy != 'end':
+                    self.journal.save(table_name, rowid_range, 'done',
+                                      checkpoint['last_rowid'] if checkpoint else None, committed_before, source)
+                return True
+            if sizer:
+                sizer.observe(rows)
+            row_types = ['ROWID'] + column_types if lob_columns else column_types
+            converters = self.build_column_converters(row_types, rows)
+            convert_row = self.build_row_converter(converters)
+            
+            # Migrar em lotes
+            inserted = 0
+            stage_times = {'read': 0.0, 'convert': 0.0, 'write': 0.0}
+            
+            pending_rows = 0
+            pending_batches = 0
+            committed_rows = committed_before
+            last_watermark = checkpoint['last_rowid'] if checkpoint else None
+            
+            def commit_pending(status, committed=False):
+                # committed: lotes já confirmados nas conexões da escrita assíncrona
+                nonlocal pending_rows, pending_batches, committed_rows
+                if not committed:
+                    with self.metrics.timer(table_name, 'commit'):
+                        oracle_conn.commit()
+                    self.metrics.add(table_name, commits=1)
+                self.record_rows(table_name, pending_rows)
+                committed_rows += pending_rows
+                pending_rows = 0
+                pending_batches = 0
+                if self.journal:
+                    self.journal.save(table_name, rowid_range, status, last_watermark, committed_rows, source)
+            
+            def retire_batch():
+                # Lotes são retirados na ordem de envio: a marca d'água só avança sobre lotes confirmados
+                nonlocal pending_rows, last_watermark
+                future, batch, batch_watermark = in_flight.popleft()
+                with self.metrics.timer(table_name, 'execute'):
+                    errors, elapsed = future.result()
+                self.metrics.add(table_name, commits=1)
+                if sizer:
+                    sizer.record(len(batch), elapsed)
+                rejected = self.handle_batch_errors(table_name, columns, batch, errors) \
+                    if self.batch_errors else []
+                pending_rows += len(batch) - len(rejected)
+                if batch_watermark is not None:
+                    last_watermark = batch_watermark
+                commit_pending('partial', committed=True)
+            
+            def write_batch(batch, batch_watermark):
+                nonlocal inserted, pending_rows, pending_batches, last_watermark
+                if use_async:
+                    while len(in_flight) >= self.async_depth:
+                        retire_batch()
+                    previous = in_flight[-1][0] if in_flight else None
+                    in_flight.append((self.async_writer.submit(insert_sql, batch, input_sizes, self.batch_errors,
+                                                               previous),
+                                      batch, batch_watermark))
+                    self.metrics.add(table_name, batches=1,
+                                     bytes=estimate_batch_bytes(batch) if self.metrics.enabled else 0)
+                    inserted += len(batch)
+                    if show_progress:
+                        self.show_progress_bar(inserted, max(total_rows, inserted))
+                    return
+                
+                if lob_columns:
+                    rowids = [row[0] for row in batch]
+                    batch = [row[1:] for row in batch]
+                    lob_types = self.driver.module
+                    lob_vars = [cursor_oracle.var(lob_types.CLOB if column_types[idx].upper() == 'CLOB'
+                                                  else lob_types.BLOB, arraysize=len(batch))
+                                for idx in lob_columns]
+                    cursor_oracle.setinputsizes(*(input_sizes or [None] * len(columns)), *lob_vars)
+                
+                write_start = time.perf_counter()
+                with self.metrics.timer(table_name, 'execute'):
+                    cursor_oracle.executemany(insert_sql, batch, batcherrors=self.batch_errors)
+                self.metrics.add(table_name, batches=1,
+                                 bytes=estimate_batch_bytes(batch) if self.metrics.enabled else 0)
+                
+                # Registros rejeitados vão para o arquivo de rejeitados; os demais seguem no lote
+                rejected = self.handle_batch_errors(table_name, columns, batch, cursor_oracle.getbatcherrors()) \
+                    if self.batch_errors else []
+                
+                if lob_columns:
+                    with self.metrics.timer(table_name, 'lob'):
+                        lob_bytes = self.stream_lobs(sqlite_conn, table_name, columns, column_types,
+                                                     lob_columns, rowids, batch, lob_vars, rejected)
+                    self.metrics.add(table_name, bytes=lob_bytes)
+                
+                if sizer:
+                    sizer.record(len(batch), time.perf_counter() - write_start)
+                
+                inserted += len(batch)
+                pending_rows += len(batch) - len(rejected)
+                pending_batches += 1
+                if batch_watermark is not None:
+                    last_watermark = batch_watermark
+                
+                # Registros só contam como migrados após o commit
+                if self.commit_every and pending_batches >= self.commit_every:
+                    commit_pending('partial')
+                
+                if show_progress:
+                    self.show_progress_bar(inserted, max(total_rows, inserted))
+            
+            if self.pipeline:
+                self.run_pipeline(read_batch, (rows, watermark), convert_row, write_batch, stage_times)
+            else:
+                while rows:
+                    t0 = time.perf_counter()
+                    batch = rows if convert_row is None else [convert_row(row) for row in rows]
+                    t1 = time.perf_counter()
+                    write_batch(batch, watermark)
+                    t2 = time.perf_counter()
+                    rows, watermark = read_batch()
+                    t3 = time.perf_counter()
+                    
+                    stage_times['convert'] += t1 - t0
+                    stage_times['write'] += t2 - t1
+                    stage_times['read'] += t3 - t2
+            
+            while in_flight:
+                retire_batch()
+            
+            # Commit do restante (commit_interval = end: provisório até o final da migração)
+            if self.commit_policy != 'end':
+                commit_pending('done', committed=use_async)
+            else:
+                self.record_rows(table_name, pending_rows)
+            
+            self.record_stage_times(table_name, stage_times)
+            if sizer:
+                self.record_batch_size(table_name, sizer)
+            
+            if show_progress:
+                self.show_progress_bar(inserted, inserted)
+            
+            # Leitura completa da tabela: a contagem real fica no catálogo para as próximas execuções
+            # (o catálogo descreve só o primeiro arquivo)
+            if not where_clause and not self.fan_in:
+                self.record_table_count(table_name, inserted)
+            
+            self.record_date_failures(table_name, ['rowid'] + columns if lob_columns else columns,
+                                      converters, show_progress)
+            
+            return True
+            
+        except Exception as e:
+            # Desfaz lotes ainda não confirmados desta tabela; lotes assíncronos em voo
+            # terminam (ou falham) antes do retorno, mas ficam fora do checkpoint
+            try:
+                oracle_conn.rollback()
+            except Exception:
+                pass
+            for future, _, _ in in_flight:
+                future.exception()
+            if show_progress:
+                print()
+            self.log(f"ERRO{f' em {source}' if source else ''}: {str(e)}", table_name)
+            if self.debug_mode:
+                import traceback
+                traceback.print_exc()
+            return False
+    
+    def get_sync_key(self, table_name: str, columns: List[Tuple]) -> str:
+        """Retorna a coluna INTEGER PRIMARY KEY da tabela (ou None)
+        
+        Só o alias do rowid (tipo declarado exatamente INTEGER numa tabela com
+        rowid) garante valores inteiros: INT, BIGINT ou POINT admitem texto e
+        quebrariam a aritmética das faixas.
+        """
+        pk_columns = [col for col in columns if col[5]]
+        if len(pk_columns) == 1 and (pk_columns[0][2] or '').strip().upper() == 'INTEGER' \
+                and self.has_rowid(table_name):
+            return pk_columns[0][1]
+        return None
+    
+    @staticmethod
+    def hash_text(text: str) -> int:
+        """MD5 truncado em 60 bits, igual ao calculado no Oracle por STANDARD_HASH"""
+        return int(hashlib.md5(text.encode('utf-8')).hexdigest()[:15], 16)
+    
+    @staticmethod
+    def canonical_value(value, oracle_type: str, lob_content: bool = True) -> str:
+        """Representação textual do valor idêntica à expressão usada no Oracle
+        
+        BLOB/CLOB viram o MD5 do conteúdo ou, com lob_content = False (sem
+        EXECUTE em DBMS_CRYPTO), apenas o tamanho.
+        """
+        if value is None or value == '':
+            return ''  # Oracle trata '' como NULL
+        
+        oracle_type = oracle_type.upper()
+        if oracle_type in ('BLOB', 'CLOB'):
+            data = bytes(value) if isinstance(value, (bytes, bytearray, memoryview)) else str(value)
+            if len(data) == 0:
+                return ''  # LOB vazio: o lado Oracle devolve NULL (GETLENGTH = 0)
+            if not lob_content:
+                return str(len(data))  # GETLENGTH: bytes no BLOB, caracteres no CLOB
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            return hashlib.md5(data).hexdigest().upper()
+        if oracle_type == 'DATE' and isinstance(value, datetime):
+            return value.strftime('%Y-%m-%d %H:%M:%S')
+        if oracle_type.startswith('TIMESTAMP') and isinstance(value, datetime):
+            return value.strftime('%Y-%m-%d %H:%M:%S.%f')
+        if oracle_type.startswith('NUMBER'):
+            # Formato TO_CHAR(n, 'TM9'): mínimo de dígitos, sem zero antes do ponto;
+            # NUMBER(p,s) guarda o valor arredondado na escala declarada
+            try:
+                number = Decimal(repr(value) if isinstance(value, float) else str(value))
+                quantum = number_quantum(oracle_type)
+                if quantum is not None:
+                    number = number.quantize(quantum, rounding=ROUND_HALF_UP)
+            except InvalidOperation:
+                return str(value)
+            text = format(number.normalize(), 'f')
+            if '.' in text:
+                text = text.rstrip('0').rstrip('.')
+            if text.startswith('0.'):
+                text = text[1:]
+            elif text.startswith('-0.'):
+                text = '-' + text[2:]
+            return text
+        if oracle_type.startswith('CHAR'):
+            return str(value).rstrip(' ')
+        if oracle_type == 'RAW' and isinstance(value, bytes):
+            return value.hex().upper()
+        return str(value)
+    
+    def oracle_canonical_expr(self, column: str, oracle_type: str) -> str:
+        """Expressão Oracle equivalente a canonical_value"""
+        oracle_type = oracle_type.upper()
+        if oracle_type in ('BLOB', 'CLOB'):
+            if self.lob_content_hash is False:
+                return (f"CASE WHEN DBMS_LOB.GETLENGTH({column}) > 0 "
+                        f"THEN TO_CHAR(DBMS_LOB.GETLENGTH({column})) END")
+            # MD5 do conteúdo (2 = DBMS_CRYPTO.HASH_MD5: constantes de pacote não valem em SQL)
+            return (f"CASE WHEN DBMS_LOB.GETLENGTH({column}) > 0 "
+                    f"THEN RAWTOHEX(DBMS_CRYPTO.HASH({column}, 2)) END")
+        if oracle_type == 'DATE':
+            return f"TO_CHAR({column}, 'YYYY-MM-DD HH24:MI:SS')"
+        if oracle_type.startswith('TIMESTAMP'):
+            return f"TO_CHAR({column}, 'YYYY-MM-DD HH24:MI:SS.FF6')"
+        if oracle_type.startswith('NUMBER'):
+            return f"TO_CHAR({column}, 'TM9')"
+        if oracle_type.startswith('CHAR'):
+            return f"RTRIM({column})"
+        if oracle_type == 'RAW':
+            return f"RAWTOHEX({column})"
+        return column
+    
+    def check_lob_hash(self, oracle_types: Dict[str, List[str]]):
+        """Confere uma vez se DBMS_CRYPTO pode ser usado para comparar BLOB/CLOB
+        
+        EXECUTE em DBMS_CRYPTO não é concedido a PUBLIC por padrão: sem ele, os
+        LOBs passam a ser comparados pelo tamanho em vez de a tabela falhar.
+        """
+        if self.lob_content_hash is not None:
+            return
+        if not any(oracle_type.upper() in ('BLOB', 'CLOB')
+                   for types in oracle_types.values() for oracle_type in types):
+            return
+        try:
+            cursor = self.oracle_conn.cursor()
+            cursor.execute("SELECT RAWTOHEX(DBMS_CRYPTO.HASH(TO_CLOB('x'), 2)) FROM dual")
+            cursor.fetchall()
+            self.lob_content_hash = True
+        except self.driver.DatabaseError as e:
+            error_obj, = e.args
+            self.lob_content_hash = False
+            print(f"  ⚠ AVISO: DBMS_CRYPTO indisponível ({error_obj.message.splitlines()[0]}); "
+                  f"BLOB/CLOB comparados só pelo tamanho (conceda EXECUTE ON DBMS_CRYPTO para comparar o conteúdo)")
+    
+    def compute_sqlite_chunk_hashes(self, sqlite_conn: sqlite3.Connection, table_name: str,
+                                    column_types: List[str], key: str, low: int,
+                                    width: int, key_range: Tuple[int, int] = None) -> Dict[int, Tuple]:
+        """Calcula (count, somas de hash por coluna) de cada bloco no lado SQLite
+        
+        Uma única varredura ordenada pela chave (restrita a key_range, se informada);
+        os valores passam pelos mesmos conversores da carga antes de serem
+        normalizados e hasheados.
+        """
+        cursor = sqlite_conn.cursor()
+        if key and key_range:
+            cursor.execute(f'SELECT "{key}", * FROM "{table_name}" WHERE "{key}" BETWEEN ? AND ? '
+                           f'ORDER BY "{key}"', key_range)
+        elif key:
+            cursor.execute(f'SELECT "{key}", * FROM "{table_name}" WHERE "{key}" IS NOT NULL ORDER BY "{key}"')
+        else:
+            cursor.execute(f'SELECT NULL, * FROM "{table_name}"')
+        
+        chunks: Dict[int, List[int]] = {}
+        converters = None
+        convert_row = None
+        num_columns = len(column_types)
+        hash_text = self.hash_text
+        canonical_value = self.canonical_value
+        lob_content = self.lob_content_hash is not False
+        
+        while True:
+            rows = cursor.fetchmany(self.batch_size)
+            if not rows:
+                break
+            if converters is None:
+                converters = self.build_column_converters(column_types, [row[1:] for row in rows])
+                convert_row = self.build_row_converter(converters)
+            
+            for row in rows:
+                key_value = row[0]
+                values = row[1:] if convert_row is None else convert_row(row[1:])
+                chunk = (key_value - low) // width if key else 0
+                acc = chunks.get(chunk)
+                if acc is None:
+                    acc = chunks[chunk] = [0] * (num_columns + 1)
+                acc[0] += 1
+                prefix = f"{key_value}\x1f" if key else "\x1f"
+                for idx in range(num_columns):
+                    acc[idx + 1] += hash_text(prefix + canonical_value(values[idx], column_types[idx],
+                                                                        lob_content))
+        
+        return {chunk: tuple(acc) for chunk, acc in chunks.items()}
+    
+    def compute_oracle_chunk_hashes(self, oracle_conn: Any, table_name: str, columns: List[str],
+                                    column_types: List[str], key: str, low: int,
+                                    width: int, key_range: Tuple[int, int] = None,
+                                    source: str = None) -> Dict[int, Tuple]:
+        """Calcula (count, somas de hash por coluna) de cada bloco no Oracle
+        
+        Um único GROUP BY com agregados STANDARD_HASH (MD5) no servidor: nenhuma
+        linha trafega para o cliente. key_range restringe a faixa da chave e
+        source, os registros de um arquivo de origem (source_column).
+        """
+        oracle_table_name = self.normalize_name(table_name)
+        oracle_key = self.normalize_name(key) if key else None
+        prefix = f"TO_CHAR({oracle_key}) || CHR(31)" if key else "CHR(31)"
+        
+        sums = []
+        for column, oracle_type in zip(columns, column_types):
+            expr = self.oracle_canonical_expr(self.normalize_name(column), oracle_type)
+            sums.append(f"SUM(TO_NUMBER(SUBSTR(RAWTOHEX(STANDARD_HASH({prefix} || {expr}, 'MD5')), 1, 15), "
+                        f"'XXXXXXXXXXXXXXX'))")
+        
+        chunk_expr = f"FLOOR(({oracle_key} - :low) / :width)" if key else "0"
+        conditions, params = [], {'low': low, 'width': width} if key else {}
+        if key and key_range:
+            conditions.append(f"{oracle_key} BETWEEN :key_low AND :key_high")
+            params['key_low'], params['key_high'] = key_range
+        elif key:
+            conditions.append(f"{oracle_key} IS NOT NULL")
+        if source is not None:
+            conditions.append(f"{self.source_column} = :source")
+            params['source'] = source
+        where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = (f"SELECT {chunk_expr}, COUNT(*), {', '.join(sums)} FROM {oracle_table_name}"
+               f"{where_clause} GROUP BY {chunk_expr}")
+        
+        cursor = oracle_conn.cursor()
+        cursor.execute(sql, params)
+        return {int(row[0]): tuple(int(value or 0) for value in row[1:]) for row in cursor.fetchall()}
+    
+    def sync_table(self, table_name: str, column_types: List[str],
+                   sqlite_conn: sqlite3.Connection = None, oracle_conn: Any = None) -> bool:
+        """Sincroniza a tabela reenviando apenas os blocos cujo hash difere
+        
+        A tabela é dividida em faixas da chave INTEGER PRIMARY KEY; cada faixa tem
+        sua contagem e somas de hash comparadas entre SQLite e Oracle. Faixas
+        diferentes são apagadas e recarregadas (delete + insert) em uma única
+        transação. Sem chave inteira, a tabela inteira é um único bloco.
+        """
+        sqlite_conn = sqlite_conn or self.sqlite_conn
+        oracle_conn = oracle_conn or self.oracle_conn
+        oracle_table_name = self.normalize_name(table_name)
+        key = self.sync_keys.get(table_name)
+        
+        try:
+            columns = [desc[0] for desc in
+                       sqlite_conn.execute(f'SELECT * FROM "{table_name}" LIMIT 0').description]
+            
+            # Faixa da chave cobre os dois lados (detecta registros apagados no SQLite)
+            low = width = 1
+            num_chunks = 1
+            if key:
+                sqlite_min, sqlite_max = sqlite_conn.execute(
+                    f'SELECT MIN("{key}"), MAX("{key}") FROM "{table_name}"').fetchone()
+                cursor = oracle_conn.cursor()
+                cursor.execute(f"SELECT MIN({self.normalize_name(key)}), MAX({self.normalize_name(key)}) "
+                               f"FROM {oracle_table_name}")
+                oracle_min, oracle_max = cursor.fetchone()
+                bounds = [int(v) for v in (sqlite_min, sqlite_max, oracle_min, oracle_max) if v is not None]
+                if not bounds:
+                    self.log("⚠ Tabela vazia", table_name)
+                    return True
+                low, high = min(bounds), max(bounds)
+                width = max(1, self.chunk_size or VERIFY_CHUNK_ROWS)
+                num_chunks = (high - low) // width + 1
+            
+            sqlite_hashes = self.compute_sqlite_chunk_hashes(
+                sqlite_conn, table_name, column_types, key, low, width)
+            oracle_hashes = self.compute_oracle_chunk_hashes(
+                oracle_conn, table_name, columns, column_types, key, low, width)
+            
+            changed = sorted(chunk for chunk in set(sqlite_hashes) | set(oracle_hashes)
+                             if sqlite_hashes.get(chunk) != oracle_hashes.get(chunk))
+            
+            with self._stats_lock:
+                self.table_results[table_name]['sync'] = (len(changed), num_chunks)
+            
+            cursor = oracle_conn.cursor()
+            for chunk in changed:
+                if key:
+                    chunk_range = (low + chunk * width, low + (chunk + 1) * width - 1)
+                    cursor.execute(f"DELETE FROM {oracle_table_name} "
+                                   f"WHERE {self.normalize_name(key)} BETWEEN :1 AND :2", chunk_range)
+                    ok = self.migrate_table_data(table_name, column_types, sqlite_conn, oracle_conn,
+                                                 chunk_range, range_column=f'"{key}"')
+                else:
+                    cursor.execute(f"DELETE FROM {oracle_table_name}")
+                    ok = self.migrate_table_data(table_name, column_types, sqlite_conn, oracle_conn)
+                if not ok:
+                    return False
+            
+            return True
+            
+        except Exception as e:
+            try:
+                oracle_conn.rollback()
+            except Exception:
+                pass
+            self.log(f"ERRO na sincronização: {str(e)}", table_name)
+            if self.debug_mode:
+                import traceback
+                traceback.print_exc()
+            return False
+    
+    def verify_table_segment(self, table_name: str, columns: List[str], column_types: List[str],
+                             key: str, low: int, width: int, chunks: Tuple[int, int],
+                             source: str = None) -> Tuple[Dict[int, Tuple], Dict[int, Tuple]]:
+        """Hashes por bloco dos dois lados para uma faixa de blocos (uma tarefa da conferência)
+        
+        Com vários arquivos SQLite e sem source_column, as somas dos arquivos são
+        adicionadas bloco a bloco (os hashes são somas, logo combináveis) e
+        comparadas com a tabela Oracle inteira.
+        """
+        if self.workers > 1:
+            sqlite_conn, oracle_conn = self.get_worker_connections()
+        else:
+            sqlite_conn, oracle_conn = self.sqlite_conn, self.oracle_conn
+        key_range = (low + chunks[0] * width, low + (chunks[1] + 1) * width - 1) if key else None
+        if source is not None:
+            paths = [source]
+        else:
+            paths = self.sqlite_sources if self.fan_in else [None]
+        
+        sqlite_hashes: Dict[int, Tuple] = {}
+        for path in paths:
+            conn = sqlite_conn if path is None else self.open_sqlite_source(path)
+            try:
+                hashes = self.compute_sqlite_chunk_hashes(conn, table_name, column_types, key, low, width,
+                                                          key_range)
+            finally:
+                if path is not None:
+                    conn.close()
+            for chunk, sums in hashes.items():
+                previous = sqlite_hashes.get(chunk)
+                sqlite_hashes[chunk] = sums if previous is None else tuple(
+                    a + b for a, b in zip(previous, sums))
+        
+        oracle_hashes = self.compute_oracle_chunk_hashes(oracle_conn, table_name, columns, column_types,
+                                                         key, low, width, key_range, source)
+        return sqlite_hashes, oracle_hashes
+    
+    def run_pipeline(self, read_batch, first_item: Tuple[List[Tuple], Any],
+                     convert_row, write_batch, stage_times: Dict[str, float]):
+        """Executa leitura, conversão e escrita em estágios sobrepostos
+        
+        Uma thread lê lotes do SQLite (read_batch), outra converte e a thread
+        atual grava no Oracle. Filas limitadas a `pipeline_queue_size` lotes
+        aplicam contrapressão, mantendo o uso de memória constante.
+        """
+        end_marker = object()
+        raw_queue = queue.Queue(maxsize=self.pipeline_queue_size)
+        converted_queue = queue.Queue(maxsize=self.pipeline_queue_size)
+        stop = threading.Event()
+        errors = []
+        
+        def put(target, item):
+            # Desiste se outro estágio falhou (evita bloqueio eterno com fila cheia)
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def get(source):
+            # Retorna end_marker se outro estágio falhou
+            while not stop.is_set():
+                try:
+                    return source.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return end_marker
+        
+        def reader():
+            try:
+                item = first_item
+                while item[0]:
+                    if not put(raw_queue, item):
+                        return
+                    t0 = time.perf_counter()
+                    item = read_batch()
+                    stage_times['read'] += time.perf_counter() - t0
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                put(raw_queue, end_marker)
+        
+        def converter():
+            try:
+                while True:
+                    item = get(raw_queue)
+                    if item is end_marker:
+                        break
+                    rows, watermark = item
+                    t0 = time.perf_counter()
+                    batch = rows if convert_row is None else [convert_row(row) for row in rows]
+                    stage_times['convert'] += time.perf_counter() - t0
+                    if not put(converted_queue, (batch, watermark)):
+                        return
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                put(converted_queue, end_marker)
+        
+        threads = [threading.Thread(target=reader, daemon=True),
+                   threading.Thread(target=converter, daemon=True)]
+        for thread in threads:
+            thread.start()
+        
+        try:
+            while True:
+                item = get(converted_queue)
+                if item is end_marker:
+                    break
+                t0 = time.perf_counter()
+                write_batch(*item)
+                stage_times['write'] += time.perf_counter() - t0
+        except Exception:
+            stop.set()
+            raise
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        
+        if errors:
+            raise errors[0]
+    
+    def record_stage_times(self, table_name: str, stage_times: Dict[str, float]):
+        """Acumula o tempo gasto em cada estágio (leitura, conversão, escrita)"""
+        with self._stats_lock:
+            stages = self.table_results[table_name].setdefault(
+                'stages', {'read': 0.0, 'convert': 0.0, 'write': 0.0})
+            for stage, seconds in stage_times.items():
+                stages[stage] += seconds
+        self.metrics.add(table_name, fetch=stage_times['read'], convert=stage_times['convert'])
+    
+    def expected_rows(self, table_name: str, rowid_range: Tuple[int, int] = None,
+                      committed_before: int = 0) -> int:
+        """Registros esperados na leitura (barra de progresso), sem varrer a tabela"""
+        total = self.table_counts.get(table_name, 0)
+        if rowid_range is not None:
+            total = min(total, rowid_range[1] - rowid_range[0] + 1)
+        return max(total - committed_before, 0)
+    
+    def record_table_count(self, table_name: str, count: int):
+        """Grava no catálogo a contagem obtida durante a transferência"""
+        with self._stats_lock:
+            self.table_counts[table_name] = count
+            self.estimated_counts.discard(table_name)
+            self.catalog.set_count(table_name, count)
+    
+    def record_batch_size(self, table_name: str, sizer: AdaptiveBatchSizer):
+        """Registra o tamanho de lote em que a tabela se estabilizou"""
+        with self._stats_lock:
+            self.table_results[table_name]['batch_size'] = sizer.size
+        self.metrics.set(table_name, batch_size=sizer.size, row_bytes=sizer.row_bytes)
+    
+    def migrate_table_task(self, table_name: str, column_types: List[str],
+                           rowid_range: Tuple[int, int] = None, source: str = None) -> bool:
+        """Executa a migração de uma tabela (ou bloco) dentro de um worker do pool
+        
+        Com vários arquivos SQLite, cada tarefa lê a tabela de um arquivo (`source`)
+        por uma conexão própria e grava pela sessão Oracle do worker, reaproveitada
+        entre arquivos. Retorna True quando este foi o último bloco pendente da tabela.
+        """
+        sqlite_conn, oracle_conn = self.get_worker_connections()
+        start = time.time()
+        if self.mode == 'sync':
+            ok = self.sync_table(table_name, column_types, sqlite_conn, oracle_conn)
+        elif source is not None:
+            source_conn = self.open_sqlite_source(source)
+            try:
+                ok = self.migrate_table_data(table_name, column_types, source_conn, oracle_conn, source=source)
+            finally:
+                source_conn.close()
+        else:
+            ok = self.migrate_table_data(table_name, column_types, sqlite_conn, oracle_conn, rowid_range)
+        end = time.time()
+        
+        # Tempo da tabela = do início do primeiro bloco ao fim do último
+        with self._stats_lock:
+            stats = self.table_results[table_name]
+            stats['start'] = min(stats.get('start', start), start)
+            stats['end'] = max(stats.get('end', end), end)
+            stats['elapsed'] = stats['end'] - stats['start']
+            stats['ok'] = ok and stats['ok'] is not False
+            stats['chunks_done'] = stats.get('chunks_done', 0) + 1
+            return stats['chunks_done'] == stats.get('chunks', 1)
+    
+    def format_table_result(self, table_name: str) -> str:
+        """Formata linha de resultado (registros e velocidade) de uma tabela"""
+        stats = self.table_results[table_name]
+        rate = stats['rows'] / stats['elapsed'] if stats['elapsed'] > 0 else 0
+        status = "✓ Concluído" if stats['ok'] else "✗ Falha na migração"
+        result = f"{status} ({stats['rows']:,} registros, {stats['elapsed']:.2f}s, {rate:,.0f} reg/s)"
+        if stats.get('rejected'):
+            result += f" [{stats['rejected']:,} rejeitados → {self._reject_writers[table_name].path}]"
+        if 'sync' in stats:
+            changed, num_chunks = stats['sync']
+            result += f" [sync: {changed}/{num_chunks} blocos reenviados]"
+        if 'batch_size' in stats:
+            result += f" [lote: {stats['batch_size']:,} registros]"
+        stages = stats.get('stages')
+        if stages and (self.pipeline or self.debug_mode):
+            result += (f" [leitura {stages['read']:.2f}s, conversão {stages['convert']:.2f}s, "
+                       f"escrita {stages['write']:.2f}s]")
+        return result
+    
+    def analyze_tables(self, tables: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Passo [5/7]: colunas, contagem, largura estimada e perfil de cada tabela"""
+        print(f"\n[5/7] Analisando tabelas...")
+        if self.fan_in:
+            self.count_source_rows(tables)
+        table_info = {}
+        for table in tables:
+            columns, count = self.get_table_info(table)
+            files = ''
+            if self.fan_in:
+                self.source_counts[(table, self.sqlite_sources[0])] = count
+                count = sum(self.source_counts[(table, db_path)] for db_path in self.sqlite_sources)
+                self.table_counts[table] = count
+                files = f" em {len(self.sqlite_sources)} arquivos"
+            row_bytes = self.estimate_row_bytes(table)
+            table_info[table] = {'columns': columns, 'count': count, 'row_bytes': row_bytes, 'profile': None}
+            approx = '~' if table in self.estimated_counts else ''
+            print(f"  • {table}: {len(columns)} colunas, {approx}{count:,} registros{files}, "
+                  f"~{row_bytes:,} bytes/registro")
+            
+            if self.mode == 'sync':
+                self.sync_keys[table] = self.get_sync_key(table, columns)
+                if not self.sync_keys[table]:
+                    print(f"    ⚠ {table}: sem chave INTEGER PRIMARY KEY; sincronizada como "
+                          f"bloco único (reenviada inteira se houver diferença)")
+            
+            if self.profile_columns and count > 0:
+                profile = self.profile_table_columns(table, columns)
+                table_info[table]['profile'] = profile
+                if self.debug_mode:
+                    for col, col_profile in zip(columns, profile):
+                        print(f"      {col[1]}: {col_profile}")
+        self.catalog.save()
+        return table_info
+    
+    def build_oracle_types(self, tables: List[str],
+                           table_info: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Tipos Oracle das colunas (DDL e conversão) e tamanhos de bind do perfil
+        
+        Resolvidos uma vez por tabela; tipos fixados por coluna em [TYPE_MAPPING]
+        não são ajustados pelo perfil. Sem perfil, com lob_streaming ativo, as
+        colunas VARCHAR2(4000) genéricas com textos maiores viram CLOB.
+        """
+        oracle_types = {}
+        for table in tables:
+            oracle_types[table] = []
+            profile = table_info[table]['profile']
+            generic_text = []
+            for idx, col in enumerate(table_info[table]['columns']):
+                oracle_type = self.type_mapper.column_override(table, col[1])
+                if oracle_type is None:
+                    oracle_type = self.map_sqlite_to_oracle_type(col[2] if col[2] else 'TEXT')
+                    if profile:
+                        oracle_type = self.refine_oracle_type(oracle_type, profile[idx])
+                    elif oracle_type == 'VARCHAR2(4000)':
+                        generic_text.append(idx)
+                oracle_types[table].append(oracle_type)
+            if generic_text and self.lob_streaming != 'false' and table_info[table]['count'] > 0:
+                columns = table_info[table]['columns']
+                for idx in self.find_long_text_columns(table, [columns[idx][1] for idx in generic_text]):
+                    oracle_types[table][generic_text[idx]] = 'CLOB'
+                    print(f"  • {table}.{columns[generic_text[idx]][1]}: textos acima de 4000 bytes "
+                          f"(VARCHAR2(4000) → CLOB)")
+            if profile:
+                self.table_input_sizes[table] = self.build_input_sizes(profile, oracle_types[table])
+        return oracle_types
+    
+    def probe_table(self, table_name: str, column_types: List[str], oracle_cursor: Any = None) -> Dict[str, Any]:
+        """Sonda de vazão do plano: lê e converte uma amostra e a envia sem gravar
+        
+        O envio usa executemany de um bloco PL/SQL que só testa os binds (nada é
+        gravado no Oracle): mede rede e bind, mas não o custo do INSERT (redo,
+        índices, extents).
+        """
+        start = time.perf_counter()
+        rows = self.sqlite_conn.execute(f'SELECT * FROM "{table_name}" LIMIT ?',
+                                        (self.plan_sample_rows,)).fetchall()
+        convert_row = self.build_row_converter(self.build_column_converters(column_types, rows))
+        batch = rows if convert_row is None else [convert_row(row) for row in rows]
+        probe = {'rows': len(batch), 'bytes': estimate_batch_bytes(batch),
+                 'local': time.perf_counter() - start, 'send': None}
+        
+        if oracle_cursor is not None and batch:
+            checks = ' AND '.join(f":{idx+1} IS NULL" for idx in range(len(column_types)))
+            block = f"BEGIN IF {checks} THEN NULL; END IF; END;"
+            start = time.perf_counter()
+            for offset in range(0, len(batch), self.batch_size):
+                oracle_cursor.executemany(block, batch[offset:offset + self.batch_size])
+            probe['send'] = time.perf_counter() - start
+        return probe
+    
+    def plan(self) -> bool:
+        """Dry-run (--plan): estimativa de tempo e volume por tabela, sem gravar no Oracle"""
+        tables = self.get_sqlite_tables()
+        if not tables:
+            print("Nenhuma tabela encontrada no SQLite!")
+            return False
+        table_info = self.analyze_tables(tables)
+        oracle_types = self.build_oracle_types(tables, table_info)
+        
+        oracle_cursor = self.oracle_conn.cursor() if self.oracle_conn else None
+        print(f"\n[PLANO] Sonda de vazão ({self.plan_sample_rows:,} registros por tabela"
+              f"{', envio sem gravação ao Oracle' if oracle_cursor else ', só leitura e conversão'})...")
+        
+        estimates, costs = {}, {}
+        for table in tables:
+            info = table_info[table]
+            try:
+                probe = self.probe_table(table, oracle_types[table], oracle_cursor)
+            except self.driver.DatabaseError as e:
+                error_obj, = e.args
+                self.log(f"⚠ Envio de amostra falhou ({error_obj.message}): estimativa só local", table)
+                probe = self.probe_table(table, oracle_types[table])
+            
+            per_row = 0.0
+            if probe['rows']:
+                send = probe['send'] or 0.0
+                # Com pipeline, leitura/conversão e envio se sobrepõem
+                per_row = (max(probe['local'], send) if self.pipeline else probe['local'] + send) / probe['rows']
+                info['row_bytes'] = probe['bytes'] // probe['rows']
+            estimates[table] = {'seconds': info['count'] * per_row, 'bytes': info['count'] * info['row_bytes']}
+            
+            # Blocos paralelos dividem a tabela em tarefas independentes
+            chunks = 1
+            if self.workers > 1 and self.chunk_size and self.mode != 'sync' and info['count'] > self.chunk_size:
+                chunks = -(-info['count'] // self.chunk_size)
+            for chunk in range(chunks):
+                costs[(table, chunk)] = estimates[table]['seconds'] / chunks
+        
+        if self.schedule == 'largest':
+            order, makespan = schedule_largest_first(costs, self.workers)
+        else:
+            order = list(costs)
+            makespan = simulate_pool(order, costs, self.workers)
+        ordered_tables = list(dict.fromkeys(table for table, _ in order))
+        
+        print(f"\n  {'tabela':<30} {'registros':>12} {'volume':>10} {'tempo estimado':>15}")
+        for table in ordered_tables:
+            print(f"  {table[:30]:<30} {table_info[table]['count']:>12,} "
+                  f"{estimates[table]['bytes'] / 1024 / 1024:>7,.1f} MB {estimates[table]['seconds']:>14,.1f}s")
+        
+        total_rows = sum(info['count'] for info in table_info.values())
+        total_bytes = sum(estimate['bytes'] for estimate in estimates.values())
+        print("\n" + "=" * 80)
+        print(f"  • Total: {len(tables)} tabelas, {total_rows:,} registros, {total_bytes / 1024 / 1024:,.1f} MB")
+        print(f"  • Tempo estimado: {makespan:,.1f}s com {self.workers} worker(s) "
+              f"(ordem: {'maior primeiro' if self.schedule == 'largest' else 'catálogo'})")
+        if not oracle_cursor:
+            print("  • Sem conexão Oracle: o tempo não inclui rede nem bind")
+        print("  • Nada foi gravado no Oracle")
+        print("=" * 80)
+        return True
+    
+    def build_export_formatter(self, column_types: List[str], sample_rows: List[Tuple]):
+        """Compila a formatação de linha dos arquivos de exportação
+        
+        Datas reconhecidas viram texto ISO (máscaras fixas no .ctl e na tabela
+        externa); os demais valores passam por export_field. Retorna (conversores
+        de data, função que devolve o registro já delimitado).
+        """
+        converters = self.build_column_converters(column_types, sample_rows)
+        parsers = dict(converters)
+        formatters = []
+        for idx, col_type in enumerate(column_types):
+            if idx in parsers:
+                def date_field(value, parse=parsers[idx],
+                               timespec='microseconds' if col_type.upper().startswith('TIMESTAMP') else 'seconds'):
+                    if value.__class__ is str:
+                        parsed = parse(value)
+                        if parsed.__class__ is datetime:
+                            return parsed.isoformat(' ', timespec)
+                    return export_field(value)
+                formatters.append(date_field)
+            else:
+                formatters.append(export_field)
+        
+        def format_row(row):
+            return ','.join(['' if value is None else to_field(value)
+                             for to_field, value in zip(formatters, row)])
+        
+        return converters, format_row
+    
+    def export_table_chunk(self, table_name: str, column_types: List[str], path: str,
+                           rowid_range: Tuple[int, int] = None) -> Dict[str, Any]:
+        """Grava uma tabela (ou uma faixa de rowid) em um arquivo delimitado
         
-        # Remover comentários e quebras de linha extras
-        ddl_clean = re.sub(r'--.*$', '', ddl, flags=re.MULTILINE)
-        ddl_clean = ' '.join(ddl_clean.split())
+        Lê em lotes de batch_size com a conexão SQLite da thread, de modo que a
+        memória fica limitada a um lote por worker. O arquivo é gravado com
+        nome temporário e renomeado ao final.
+        """
+        sqlite_conn = self.get_export_reader()
+        where_clause, where_params = '', []
+        if rowid_range is not None:
+            where_clause = ' WHERE rowid BETWEEN ? AND ?'
+            where_params = list(rowid_range)
         
-        # Pattern para encontrar a definição da coluna
-        # Procura: nome_coluna TIPO(params) ou nome_coluna TIPO
-        # Suporta espaços e variações de case
-        pattern = rf'\b{re.escape(column_name)}\s+([A-Z][A-Z0-9_]*(?:\s*\([^)]+\))?)'
+        started = time.time()
+        cursor_sqlite = sqlite_conn.cursor()
+        cursor_sqlite.execute(f'SELECT * FROM "{table_name}"{where_clause}', where_params)
+        columns = [desc[0] for desc in cursor_sqlite.description]
+        lob_columns = [idx for idx, col_type in enumerate(column_types) if col_type.upper() in ('BLOB', 'CLOB')]
+        lob_lengths = {idx: 0 for idx in lob_columns}
         
-        match = re.search(pattern, ddl_clean, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
+        rows = cursor_sqlite.fetchmany(self.batch_size)
+        converters, format_row = self.build_export_formatter(column_types, rows)
         
-        return None
-    
-    def get_table_info(self, table_name: str) -> Tuple[List[Tuple], int]:
-        """Obtém informações da tabela SQLite"""
-        cursor = self.sqlite_conn.cursor()
+        exported = 0
+        tmp_path = f"{path}.tmp"
+        if self.export_compress == 'gzip':
+            data_file = gzip.open(tmp_path, 'wt', encoding='utf-8', newline='', compresslevel=EXPORT_GZIP_LEVEL)
+        else:
+            data_file = open(tmp_path, 'w', encoding='utf-8', newline='')
+        with data_file:
+            while rows:
+                for idx in lob_columns:
+                    lob_lengths[idx] = max(lob_lengths[idx], max((len(row[idx]) for row in rows if row[idx]), default=0))
+                # Um write por lote: o registro termina em RS + LF
+                data_file.write(EXPORT_RECORD_TERMINATOR.join(map(format_row, rows)) + EXPORT_RECORD_TERMINATOR)
+                exported += len(rows)
+                rows = cursor_sqlite.fetchmany(self.batch_size)
+        os.replace(tmp_path, path)
         
-        # Informações das colunas via PRAGMA (básico)
-        cursor.execute(f'PRAGMA table_info("{table_name}")')
-        pragma_columns = cursor.fetchall()
+        self.record_rows(table_name, exported)
+        self.record_date_failures(table_name, columns, converters)
+        return {'rows': exported, 'bytes': os.path.getsize(path), 'elapsed': time.time() - started,
+                'lob_lengths': lob_lengths}
+    
+    def get_export_reader(self) -> sqlite3.Connection:
+        """Conexão SQLite exclusiva da thread de exportação"""
+        local = self._worker_local
+        if getattr(local, 'sqlite_conn', None) is None:
+            local.sqlite_conn = self.connect_sqlite_reader()
+            with self._stats_lock:
+                self._worker_sessions.append((local.sqlite_conn, None))
+        return local.sqlite_conn
+    
+    def export_field_spec(self, column: str, oracle_type: str, lob_length: int = 0) -> Tuple[str, str]:
+        """Campo da tabela no .ctl (SQL*Loader) e na tabela externa (ORACLE_LOADER)"""
+        upper = oracle_type.upper()
+        if upper.startswith('DATE'):
+            return (f'{column} DATE "YYYY-MM-DD HH24:MI:SS"',
+                    f'{column} CHAR(19) DATE_FORMAT DATE MASK "YYYY-MM-DD HH24:MI:SS"')
+        if upper.startswith('TIMESTAMP'):
+            return (f'{column} TIMESTAMP "YYYY-MM-DD HH24:MI:SS.FF6"',
+                    f'{column} CHAR(26) DATE_FORMAT TIMESTAMP MASK "YYYY-MM-DD HH24:MI:SS.FF6"')
         
-        # Obter DDL real da tabela para tipos precisos
-        cursor.execute(f"""
-            SELECT sql FROM sqlite_master 
-            WHERE type='table' AND name='{table_name}'
-        """)
-        ddl_result = cursor.fetchone()
-        ddl = ddl_result[0] if ddl_result else None
+        # Campos delimitados têm CHAR(255) como padrão: textos maiores precisam do tamanho
+        # (4 bytes por caractere em UTF-8; BLOB/RAW em hexadecimal ocupam 2 por byte)
+        size = re.search(r'\((\d+)', upper)
+        length = 255
+        if upper in ('BLOB', 'CLOB'):
+            length = lob_length * (4 if upper == 'CLOB' else 2)
+        elif size and upper.startswith('RAW'):
+            length = int(size.group(1)) * 2
+        elif size and not upper.startswith(('NUMBER', 'FLOAT')):
+            length = int(size.group(1)) * 4
+        field = f"{column} CHAR({max(length, 255)})"
+        return field, field
+    
+    def write_export_scripts(self, table_name: str, columns: List[Tuple], oracle_types: List[str],
+                             files: List[str], lob_lengths: Dict[int, int]) -> List[str]:
+        """Grava o .ctl (SQL*Loader) e o .sql (tabela externa + INSERT) da tabela"""
+        oracle_table = self.normalize_name(table_name)
+        external_table = f"{oracle_table}_EXT"
+        specs = [self.export_field_spec(self.normalize_name(col[1]), oracle_type, lob_lengths.get(idx, 0))
+                 for idx, (col, oracle_type) in enumerate(zip(columns, oracle_types))]
+        errors = (self.max_errors or EXPORT_SQLLDR_MAX_ERRORS) if self.batch_errors else 0
+        reject_limit = (self.max_errors or 'UNLIMITED') if self.batch_errors else 0
+        gzip_files = self.export_compress == 'gzip'
         
-        # Enriquecer informações com tipos do DDL
-        enhanced_columns = []
-        for col in pragma_columns:
-            col_name = col[1]
-            # Tentar extrair tipo real do DDL
-            real_type = self.extract_column_type_from_ddl(ddl, col_name) if ddl else None
-            
-            # col é uma tupla: (cid, name, type, notnull, dflt_value, pk)
-            # Substituir type (índice 2) pelo tipo real se encontrado
-            if real_type:
-                col_list = list(col)
-                col_list[2] = real_type
-                enhanced_columns.append(tuple(col_list))
-            else:
-                enhanced_columns.append(col)
+        ctl_lines = [
+            f"-- {table_name} → {oracle_table}: gerado por sqlite_oracle_migration.py --export",
+        ]
+        if gzip_files:
+            ctl_lines.append("-- O SQL*Loader não lê .gz: descompacte os arquivos (gunzip) ou crie pipes nomeados")
+            ctl_lines.append("-- (mkfifo ARQ.dat; zcat ARQ.dat.gz > ARQ.dat &) antes de executar o sqlldr")
+        ctl_lines.extend([
+            f"OPTIONS (DIRECT=TRUE, ERRORS={errors})",
+            "LOAD DATA",
+            "CHARACTERSET AL32UTF8",
+        ])
+        ctl_lines.extend(f"INFILE '{name[:-3] if gzip_files else name}' \"str X'1E0A'\"" for name in files)
+        ctl_lines.extend([
+            "APPEND",
+            f"INTO TABLE {oracle_table}",
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"'",
+            "TRAILING NULLCOLS",
+            "PRESERVE BLANKS",
+            "(",
+            ",\n".join(f"  {ctl_spec}" for ctl_spec, _ in specs),
+            ")",
+        ])
         
-        # Contagem de registros
-        cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
-        count = cursor.fetchone()[0]
+        locations = [f"'{name}'" for name in files]
+        col_defs = ",\n".join(f"  {self.normalize_name(col[1])} {oracle_type}"
+                              for col, oracle_type in zip(columns, oracle_types))
+        access = ["    RECORDS DELIMITED BY 0X'1E0A' CHARACTERSET AL32UTF8"]
+        if gzip_files:
+            access.append(f"    PREPROCESSOR {self.export_exec_dir}:'zcat'")
+        access.extend([
+            f"    BADFILE '{external_table}.bad'",
+            f"    LOGFILE '{external_table}.log'",
+            "    FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' NOTRIM",
+            "    MISSING FIELD VALUES ARE NULL",
+            "    (",
+            ",\n".join(f"      {ext_spec}" for _, ext_spec in specs),
+            "    )",
+        ])
+        sql_lines = [
+            f"-- {table_name} → {oracle_table}: gerado por sqlite_oracle_migration.py --export",
+            f"-- Diretórios Oracle: {self.export_oracle_dir} (arquivos de dados)"
+            + (f" e {self.export_exec_dir} (zcat)" if gzip_files else ''),
+            f"{self.create_table_sql(oracle_table, columns, oracle_types)};",
+            "",
+            f"CREATE TABLE {external_table} (",
+            col_defs,
+            ")",
+            "ORGANIZATION EXTERNAL (",
+            "  TYPE ORACLE_LOADER",
+            f"  DEFAULT DIRECTORY {self.export_oracle_dir}",
+            "  ACCESS PARAMETERS (",
+            *access,
+            "  )",
+            f"  LOCATION ({', '.join(locations)})",
+            ")",
+            f"REJECT LIMIT {reject_limit}",
+            "PARALLEL;",
+            "",
+            f"INSERT /*+ APPEND */ INTO {oracle_table} SELECT * FROM {external_table};",
+            "COMMIT;",
+            f"DROP TABLE {external_table};",
+        ]
         
-        return enhanced_columns, count
+        scripts = []
+        for extension, lines in (('ctl', ctl_lines), ('sql', sql_lines)):
+            path = os.path.join(self.export_dir, f"{oracle_table}.{extension}")
+            with open(path, 'w', encoding='utf-8') as script:
+                script.write("\n".join(lines) + "\n")
+            scripts.append(path)
+        return scripts
     
-    def map_sqlite_to_oracle_type(self, sqlite_type: str) -> str:
-        """Mapeia tipos SQLite para Oracle (preservando precisão e escala)"""
-        if not sqlite_type:
-            return 'VARCHAR2(4000)'
+    def export(self) -> bool:
+        """Exportação (--export): arquivos delimitados + .ctl + tabela externa, sem Oracle
         
-        sqlite_type_upper = sqlite_type.upper().strip()
+        Cada tabela é dividida em faixas de rowid (chunk_size, ou EXPORT_CHUNK_ROWS
+        registros) gravadas em arquivos separados pelos workers em paralelo.
+        Os tipos vêm do mesmo mapeamento usado por create_oracle_table.
+        """
+        start_time = time.time()
+        tables = self.get_sqlite_tables()
+        if not tables:
+            print("Nenhuma tabela encontrada no SQLite!")
+            return False
+        table_info = self.analyze_tables(tables)
+        oracle_types = self.build_oracle_types(tables, table_info)
+        os.makedirs(self.export_dir, exist_ok=True)
         
-        # Mapeamento direto para tipos já compatíveis com Oracle
-        direct_map = {
-            'DATE': 'DATE',
-            'TIMESTAMP': 'TIMESTAMP',
-            'BLOB': 'BLOB',
-            'CLOB': 'CLOB',
-            'RAW': 'RAW'
-        }
+        print(f"\n[EXPORTAÇÃO] Gravando arquivos em '{self.export_dir}'...")
+        self.table_results = {table: {'rows': 0, 'elapsed': 0.0, 'ok': None} for table in tables}
+        extension = '.dat.gz' if self.export_compress == 'gzip' else '.dat'
+        chunk_rows = self.chunk_size or EXPORT_CHUNK_ROWS
         
-        # Verificar mapeamento direto
-        for key, value in direct_map.items():
-            if sqlite_type_upper == key:
-                return value
-        
-        # NUMBER com precisão e escala: NUMBER(9), NUMBER(11,2), etc.
-        number_match = re.match(r'NUMBER\s*\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\)', sqlite_type_upper)
-        if number_match:
-            precision = number_match.group(1)
-            scale = number_match.group(2)
-            if scale:
-                return f'NUMBER({precision},{scale})'
-            else:
-                return f'NUMBER({precision})'
-        
-        # NUMBER genérico
-        if sqlite_type_upper == 'NUMBER' or sqlite_type_upper == 'NUMERIC':
-            return 'NUMBER'
-        
-        # INTEGER e variações
-        if sqlite_type_upper in ('INTEGER', 'INT', 'SMALLINT', 'BIGINT', 'TINYINT', 'MEDIUMINT'):
-            return 'NUMBER'
-        
-        # REAL, FLOAT, DOUBLE
-        if sqlite_type_upper in ('REAL', 'FLOAT', 'DOUBLE', 'DOUBLE PRECISION'):
-            return 'NUMBER'
-        
-        # DECIMAL com precisão
-        decimal_match = re.match(r'DECIMAL\s*\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\)', sqlite_type_upper)
-        if decimal_match:
-            precision = decimal_match.group(1)
-            scale = decimal_match.group(2)
-            if scale:
-                return f'NUMBER({precision},{scale})'
-            else:
-                return f'NUMBER({precision})'
-        
-        # VARCHAR2 já definido no SQLite (Oracle syntax em SQLite)
-        varchar2_match = re.match(r'VARCHAR2\s*\(\s*(\d+)\s*\)', sqlite_type_upper)
-        if varchar2_match:
-            size = varchar2_match.group(1)
-            return f'VARCHAR2({size})'
-        
-        # VARCHAR com tamanho
-        varchar_match = re.match(r'VARCHAR\s*\(\s*(\d+)\s*\)', sqlite_type_upper)
-        if varchar_match:
-            size = varchar_match.group(1)
-            return f'VARCHAR2({size})'
-        
-        # CHAR com tamanho
-        char_match = re.match(r'CHAR\s*\(\s*(\d+)\s*\)', sqlite_type_upper)
-        if char_match:
-            size = char_match.group(1)
-            return f'CHAR({size})'
-        
-        # TEXT, VARCHAR genérico, STRING
-        if sqlite_type_upper in ('TEXT', 'VARCHAR', 'STRING', 'NVARCHAR', 'NTEXT'):
-            return 'VARCHAR2(4000)'
-        
-        # CHAR genérico
-        if sqlite_type_upper == 'CHAR':
-            return 'CHAR(1)'
-        
-        # BOOLEAN
-        if sqlite_type_upper in ('BOOLEAN', 'BOOL'):
-            return 'NUMBER(1)'
-        
-        # DATETIME
-        if sqlite_type_upper == 'DATETIME':
-            return 'TIMESTAMP'
-        
-        # Default: VARCHAR2(4000) para tipos não reconhecidos
-        return 'VARCHAR2(4000)'
-    
-    def create_oracle_table(self, table_name: str, columns: List[Tuple]) -> bool:
-        """Cria tabela no Oracle"""
-        oracle_table_name = self.normalize_name(table_name)
-        cursor = self.oracle_conn.cursor()
+        tasks, costs, files = [], {}, {}
+        for table in tables:
+            info = table_info[table]
+            ranges = [None]
+            if info['count'] > chunk_rows:
+                ranges = self.get_rowid_ranges(table, info['count'], chunk_rows)
+            oracle_table = self.normalize_name(table)
+            files[table] = [f"{oracle_table}_{seq:03d}{extension}" for seq in range(1, len(ranges) + 1)]
+            for rowid_range, name in zip(ranges, files[table]):
+                tasks.append((table, rowid_range, name))
+                costs[(table, rowid_range, name)] = self.estimate_load_seconds(
+                    info['count'], info['row_bytes']) / len(ranges)
+        if self.schedule == 'largest':
+            tasks = schedule_largest_first(costs, self.workers)[0]
         
+        pending = {table: len(files[table]) for table in tables}
+        lob_lengths = {table: {} for table in tables}
+        total_bytes = 0
         try:
-            # Se modo truncate, dropar tabela existente
-            if self.mode == 'truncate':
-                try:
-                    cursor.execute(f"DROP TABLE {oracle_table_name} PURGE")
-                    self.oracle_conn.commit()
-                except cx_Oracle.DatabaseError:
-                    pass  # Tabela não existe
-            
-            # Verificar se tabela já existe
-            cursor.execute("""
-                SELECT COUNT(*) FROM user_tables 
-                WHERE table_name = :1
-            """, (oracle_table_name,))
-            
-            exists = cursor.fetchone()[0] > 0
-            
-            if exists and self.mode == 'append':
-                return True  # Tabela já existe, modo append
-            
-            # Criar tabela
-            col_defs = []
-            for col in columns:
-                col_name = self.normalize_name(col[1])
-                sqlite_type = col[2] if col[2] else 'TEXT'
-                oracle_type = self.map_sqlite_to_oracle_type(sqlite_type)
-                col_defs.append(f"{col_name} {oracle_type}")
-                
-                if self.debug_mode:
-                    print(f"      {col_name}: {sqlite_type} → {oracle_type}")
-            
-            create_sql = f"CREATE TABLE {oracle_table_name} ({', '.join(col_defs)})"
-            
-            if self.debug_mode:
-                print(f"      SQL: {create_sql}")
-            
-            cursor.execute(create_sql)
-            self.oracle_conn.commit()
-            
-            return True
-            
-        except Exception as e:
-            print(f"    ERRO ao criar tabela: {str(e)}")
-            if self.debug_mode:
-                import traceback
-                traceback.print_exc()
-            return False
-    
-    def show_progress_bar(self, current: int, total: int, bar_length: int = 50):
-        """Exibe barra de progresso"""
-        percent = current / total if total > 0 else 0
-        filled = int(bar_length * percent)
-        bar = '█' * filled + '░' * (bar_length - filled)
-        print(f"\r    [{bar}] {percent*100:.1f}% ({current:,}/{total:,})", end='', flush=True)
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(self.export_table_chunk, table, oracle_types[table],
+                                    os.path.join(self.export_dir, name), rowid_range): (table, name)
+                    for table, rowid_range, name in tasks
+                }
+                done = 0
+                for future in as_completed(futures):
+                    table, name = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.table_results[table]['ok'] = False
+                        self.log(f"✗ {name}: {e}", table)
+                        pending[table] -= 1
+                        continue
+                    total_bytes += result['bytes']
+                    stats = self.table_results[table]
+                    stats['elapsed'] = max(stats['elapsed'], result['elapsed'])
+                    for idx, length in result['lob_lengths'].items():
+                        lob_lengths[table][idx] = max(lob_lengths[table].get(idx, 0), length)
+                    pending[table] -= 1
+                    if pending[table]:
+                        continue
+                    
+                    done += 1
+                    if stats['ok'] is None:
+                        stats['ok'] = True
+                        self.write_export_scripts(table, table_info[table]['columns'], oracle_types[table],
+                                                  files[table], lob_lengths[table])
+                    with self._print_lock:
+                        print(f"  [{done}/{len(tables)}] {table} → {self.normalize_name(table)}: "
+                              f"{len(files[table])} arquivo(s), {stats['rows']:,} registros"
+                              f"{' ✓' if stats['ok'] else ' ✗'}")
+        finally:
+            for sqlite_conn, _ in self._worker_sessions:
+                sqlite_conn.close()
+            self._worker_sessions = []
+        
+        elapsed = time.time() - start_time
+        total_rows = sum(stats['rows'] for stats in self.table_results.values())
+        failed = [table for table in tables if not self.table_results[table]['ok']]
+        date_failures = sum(sum(stats.get('date_failures', {}).values())
+                            for stats in self.table_results.values())
+        print("\n" + "=" * 80)
+        print("EXPORTAÇÃO CONCLUÍDA COM FALHAS!" if failed else "EXPORTAÇÃO CONCLUÍDA COM SUCESSO!")
+        print("=" * 80)
+        print(f"  • Tabelas exportadas: {len(tables) - len(failed)}/{len(tables)}")
+        if failed:
+            print(f"  • Tabelas com falha: {', '.join(failed)}")
+        print(f"  • Total de registros: {total_rows:,} em {sum(len(names) for names in files.values())} "
+              f"arquivo(s), {total_bytes / 1024 / 1024:,.1f} MB")
+        if date_failures:
+            print(f"  • Datas não reconhecidas: {date_failures:,} (gravadas como texto; rejeitadas na carga)")
+        print(f"  • Tempo decorrido: {elapsed:.2f} segundos")
+        if elapsed > 0:
+            print(f"  • Registros/segundo: {total_rows / elapsed:,.0f}")
+        print(f"  • Carga: sqlldr control=<TABELA>.ctl ou @<TABELA>.sql (tabela externa)")
+        print("=" * 80)
+        return not failed
     
-    def parse_date(self, date_str: str):
-        """Converte string de data para objeto datetime Python"""
-        if not date_str:
-            return None
+    def verify(self, tables: List[str] = None, table_info: Dict[str, Dict[str, Any]] = None,
+               oracle_types: Dict[str, List[str]] = None) -> bool:
+        """Conferência pós-carga (--verify ou verify = true): contagens e hashes por bloco
         
-        # Formatos comuns de data no SQLite
-        date_formats = [
-            '%Y-%m-%d',              # 2024-01-15
-            '%Y-%m-%d %H:%M:%S',     # 2024-01-15 14:30:00
-            '%Y-%m-%d %H:%M:%S.%f',  # 2024-01-15 14:30:00.123
-            '%d/%m/%Y',              # 15/01/2024
-            '%d/%m/%Y %H:%M:%S',     # 15/01/2024 14:30:00
-            '%Y/%m/%d',              # 2024/01/15
-            '%Y/%m/%d %H:%M:%S',     # 2024/01/15 14:30:00
-            '%d-%m-%Y',              # 15-01-2024
-            '%d-%m-%Y %H:%M:%S',     # 15-01-2024 14:30:00
-        ]
+        Cada tabela é dividida em blocos de chunk_size valores da chave INTEGER
+        PRIMARY KEY (o alias do rowid); sem essa chave, a tabela inteira é um bloco.
+        Os blocos são agrupados em faixas conferidas em paralelo pelos workers: o
+        SQLite é lido e hasheado em Python e o Oracle calcula as mesmas somas com
+        STANDARD_HASH num GROUP BY, devolvendo uma linha por bloco. Blocos
+        diferentes são listados pela faixa exata da chave.
+        """
+        start_time = time.time()
+        if tables is None:
+            tables = self.get_sqlite_tables()
+            if not tables:
+                print("Nenhuma tabela encontrada no SQLite!")
+                return False
+            table_info = self.analyze_tables(tables)
+            oracle_types = self.build_oracle_types(tables, table_info)
         
-        for fmt in date_formats:
+        print(f"\n[VERIFICAÇÃO] Conferindo contagens e hashes por bloco (SQLite × Oracle)...")
+        self.check_lob_hash(oracle_types)
+        width = max(1, self.chunk_size or VERIFY_CHUNK_ROWS)
+        # Com source_column, cada arquivo é conferido contra os seus registros no Oracle
+        sources = self.sqlite_sources if self.source_column else [None]
+        paths = self.sqlite_sources if self.fan_in else [None]
+        results, tasks = {}, []
+        cursor = self.oracle_conn.cursor()
+        for table in tables:
+            columns = [col[1] for col in table_info[table]['columns']]
+            key = self.get_sync_key(table, table_info[table]['columns'])
+            result = results[table] = {'columns': columns, 'key': key, 'low': 1, 'chunks': 1,
+                                       'sqlite': 0, 'oracle': 0, 'diffs': [], 'error': None}
+            if not key:
+                # Sem correspondência de rowid no Oracle: só a tabela inteira é comparável
+                print(f"  ⚠ {table}: sem chave INTEGER PRIMARY KEY; conferida como bloco único "
+                      f"(sem faixas nem paralelismo)")
             try:
-                return datetime.strptime(date_str, fmt)
-            except (ValueError, TypeError):
+                if key:
+                    # Faixa da chave cobre os dois lados (detecta registros a mais no Oracle)
+                    bounds = []
+                    for path in paths:
+                        conn = self.sqlite_conn if path is None else self.open_sqlite_source(path)
+                        try:
+                            bounds.extend(conn.execute(
+                                f'SELECT MIN("{key}"), MAX("{key}") FROM "{table}"').fetchone())
+                        finally:
+                            if path is not None:
+                                conn.close()
+                    oracle_key = self.normalize_name(key)
+                    cursor.execute(f"SELECT MIN({oracle_key}), MAX({oracle_key}) "
+                                   f"FROM {self.normalize_name(table)}")
+                    bounds.extend(cursor.fetchone())
+                    bounds = [int(value) for value in bounds if value is not None]
+                    if bounds:
+                        result['low'] = min(bounds)
+                        result['chunks'] = (max(bounds) - result['low']) // width + 1
+            except self.driver.DatabaseError as e:
+                error_obj, = e.args
+                result['error'] = error_obj.message
                 continue
+            
+            # Faixas contíguas de blocos: até uma por worker em cada tabela (e arquivo)
+            segments = min(result['chunks'], self.workers)
+            per_segment = -(-result['chunks'] // segments)
+            for source in sources:
+                for first in range(0, result['chunks'], per_segment):
+                    last = min(first + per_segment, result['chunks']) - 1
+                    tasks.append((table, (first, last), source))
         
-        # Se nenhum formato funcionar, retornar string original
-        # Oracle tentará converter
-        return date_str
-    
-    def migrate_table_data(self, table_name: str, column_types: List[str]) -> bool:
-        """Migra dados de uma tabela"""
-        oracle_table_name = self.normalize_name(table_name)
+        def collect(task, hashes):
+            table, _, source = task
+            result = results[table]
+            sqlite_hashes, oracle_hashes = hashes
+            empty = (0,) * (len(result['columns']) + 1)
+            for chunk in sorted(set(sqlite_hashes) | set(oracle_hashes)):
+                sqlite_sums = sqlite_hashes.get(chunk, empty)
+                oracle_sums = oracle_hashes.get(chunk, empty)
+                result['sqlite'] += sqlite_sums[0]
+                result['oracle'] += oracle_sums[0]
+                if sqlite_sums == oracle_sums:
+                    continue
+                low = result['low'] + chunk * width
+                result['diffs'].append({
+                    'source': source,
+                    'range': (low, low + width - 1) if result['key'] else None,
+                    'sqlite': sqlite_sums[0],
+                    'oracle': oracle_sums[0],
+                    'columns': [column for idx, column in enumerate(result['columns'])
+                                if sqlite_sums[idx + 1] != oracle_sums[idx + 1]],
+                })
         
-        try:
-            # Obter estrutura e dados
-            cursor_sqlite = self.sqlite_conn.cursor()
-            cursor_sqlite.execute(f'SELECT * FROM "{table_name}"')
-            
-            # Obter nomes das colunas
-            columns = [desc[0] for desc in cursor_sqlite.description]
-            oracle_columns = [self.normalize_name(col) for col in columns]
-            
-            # Preparar statement de insert
-            placeholders = ', '.join([f':{i+1}' for i in range(len(columns))])
-            insert_sql = f"INSERT INTO {oracle_table_name} ({', '.join(oracle_columns)}) VALUES ({placeholders})"
-            
-            cursor_oracle = self.oracle_conn.cursor()
-            
-            # Contar registros
-            cursor_count = self.sqlite_conn.cursor()
-            cursor_count.execute(f'SELECT COUNT(*) FROM "{table_name}"')
-            total_rows = cursor_count.fetchone()[0]
-            
-            if total_rows == 0:
-                print(f"    ⚠ Tabela vazia")
-                return True
-            
-            # Migrar em lotes
-            inserted = 0
-            batch = []
-            
-            for row in cursor_sqlite:
-                # Converter tipos especiais
-                converted_row = []
-                for idx, val in enumerate(row):
-                    if val is None:
-                        converted_row.append(None)
-                    elif isinstance(val, bytes):
-                        # BLOB - manter como está
-                        converted_row.append(val)
-                    elif column_types[idx].upper() in ('DATE', 'TIMESTAMP'):
-                        # Converter strings de data para objetos datetime
-                        if isinstance(val, str):
-                            converted_row.append(self.parse_date(val))
-                        else:
-                            converted_row.append(val)
-                    else:
-                        converted_row.append(val)
-                
-                batch.append(converted_row)
-                
-                if len(batch) >= self.batch_size:
-                    cursor_oracle.executemany(insert_sql, batch)
-                    self.oracle_conn.commit()
-                    inserted += len(batch)
-                    self.show_progress_bar(inserted, total_rows)
-                    batch = []
-            
-            # Inserir registros restantes
-            if batch:
-                cursor_oracle.executemany(insert_sql, batch)
-                self.oracle_conn.commit()
-                inserted += len(batch)
-            
-            self.show_progress_bar(total_rows, total_rows)
-            print(f" ✓ Concluído")
-            
-            return True
-            
-        except Exception as e:
-            print(f"\n    ERRO: {str(e)}")
-            if self.debug_mode:
-                import traceback
-                traceback.print_exc()
-            return False
+        def check(task):
+            table, chunks, source = task
+            result = results[table]
+            return self.verify_table_segment(table, result['columns'], oracle_types[table], result['key'],
+                                             result['low'], width, chunks, source)
+        
+        if self.workers > 1:
+            try:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    futures = {executor.submit(check, task): task for task in tasks}
+                    for future in as_completed(futures):
+                        task = futures[future]
+                        try:
+                            collect(task, future.result())
+                        except Exception as e:
+                            results[task[0]]['error'] = str(e)
+            finally:
+                self.release_worker_connections()
+        else:
+            for task in tasks:
+                try:
+                    collect(task, check(task))
+                except Exception as e:
+                    results[task[0]]['error'] = str(e)
+        
+        # Relatório: uma linha por tabela e as faixas diferentes de cada uma
+        report_rows = []
+        for table in tables:
+            result = results[table]
+            if result['error']:
+                print(f"  ✗ {table}: erro na conferência: {result['error']}")
+                continue
+            diffs = sorted(result['diffs'], key=lambda diff: (diff['source'] or '', diff['range'] or (0, 0)))
+            blocks = result['chunks'] * len(sources)
+            if not diffs:
+                print(f"  ✓ {table}: {result['sqlite']:,} registros, {blocks} bloco(s) iguais")
+                continue
+            rejected = self.table_results.get(table, {}).get('rejected')
+            print(f"  ✗ {table}: SQLite {result['sqlite']:,} × Oracle {result['oracle']:,} registros, "
+                  f"{len(diffs)}/{blocks} bloco(s) diferentes"
+                  f"{f' ({rejected:,} rejeitados na carga)' if rejected else ''}")
+            for idx, diff in enumerate(diffs):
+                where = (f"{result['key']} {diff['range'][0]}..{diff['range'][1]}" if diff['range']
+                         else "tabela inteira")
+                if diff['source']:
+                    where += f" de {os.path.basename(diff['source'])}"
+                if diff['sqlite'] != diff['oracle']:
+                    detail = f"{diff['sqlite']:,} × {diff['oracle']:,} registros"
+                else:
+                    detail = f"conteúdo diferente em {', '.join(diff['columns'])}"
+                report_rows.append([table, diff['source'] or '', result['key'] or '',
+                                    *(diff['range'] or ('', '')), diff['sqlite'], diff['oracle'],
+                                    ' '.join(diff['columns'])])
+                if idx < VERIFY_PRINT_LIMIT:
+                    print(f"      {where}: {detail}")
+            if len(diffs) > VERIFY_PRINT_LIMIT:
+                print(f"      ... e mais {len(diffs) - VERIFY_PRINT_LIMIT} bloco(s)"
+                      f"{f' (ver {self.verify_report})' if self.verify_report else ''}")
+        
+        if self.verify_report:
+            with open(self.verify_report, 'w', newline='', encoding='utf-8') as report_fp:
+                writer = csv.writer(report_fp)
+                writer.writerow(['tabela', 'arquivo', 'chave', 'inicio', 'fim', 'registros_sqlite',
+                                 'registros_oracle', 'colunas_diferentes'])
+                writer.writerows(report_rows)
+        
+        elapsed = time.time() - start_time
+        failed = [table for table in tables if results[table]['error'] or results[table]['diffs']]
+        print("\n" + "=" * 80)
+        print("VERIFICAÇÃO CONCLUÍDA COM DIFERENÇAS!" if failed else "VERIFICAÇÃO CONCLUÍDA: DADOS CONFEREM!")
+        print("=" * 80)
+        print(f"  • Tabelas conferidas: {len(tables) - len(failed)}/{len(tables)} iguais")
+        if failed:
+            print(f"  • Tabelas com diferenças: {', '.join(failed)}")
+        print(f"  • Registros: SQLite {sum(result['sqlite'] for result in results.values()):,} × "
+              f"Oracle {sum(result['oracle'] for result in results.values()):,}")
+        if report_rows and self.verify_report:
+            print(f"  • Faixas diferentes: {len(report_rows):,} (em '{self.verify_report}')")
+        print(f"  • Tempo decorrido: {elapsed:.2f} segundos")
+        print("=" * 80)
+        return not failed
     
     def migrate(self) -> bool:
         """Executa migração completa"""
@@ -564,19 +3973,28 @@ class MigrationTool:
             print("Nenhuma tabela encontrada no SQLite!")
             return False
         
-        print(f"\n[5/7] Analisando tabelas...")
-        table_info = {}
-        for table in tables:
-            columns, count = self.get_table_info(table)
-            table_info[table] = {'columns': columns, 'count': count}
-            print(f"  • {table}: {len(columns)} colunas, {count:,} registros")
+        table_info = self.analyze_tables(tables)
+        oracle_types = self.build_oracle_types(tables, table_info)
+        if self.mode == 'sync':
+            self.check_lob_hash(oracle_types)
         
         # Criar estruturas no Oracle
         print(f"\n[6/7] Criando estruturas no Oracle...")
+        if self.mode == 'swap':
+            for table in tables:
+                self.staging_tables[table] = f"{self.normalize_name(table)}{STAGING_SUFFIX}"
+            if not self.check_swap_names(tables):
+                return False
         for table in tables:
             oracle_name = self.normalize_name(table)
+            if self.mode == 'swap':
+                oracle_name = f"{oracle_name} (staging {self.staging_tables[table]})"
             print(f"  • {table} → {oracle_name}...", end='')
-            if self.create_oracle_table(table, table_info[table]['columns']):
+            if self.journal and self.journal.has_table(table):
+                print(" ↷ mantida (retomada via checkpoint)")
+                self.created_tables.append(table)
+                continue
+            if self.create_oracle_table(table, table_info[table]['columns'], oracle_types[table]):
                 print(" ✓")
             else:
                 print(" ✗")
@@ -584,44 +4002,445 @@ class MigrationTool:
         
         # Migrar dados
         print(f"\n[7/7] Migrando dados...")
-        total_migrated = 0
+        self.table_results = {
+            table: {'rows': 0, 'elapsed': 0.0, 'ok': None} for table in tables
+        }
         
-        for idx, table in enumerate(tables, 1):
-            oracle_name = self.normalize_name(table)
-            count = table_info[table]['count']
+        if self.workers > 1:
+            # Tabelas grandes são divididas em faixas de rowid carregadas em paralelo;
+            # com vários arquivos SQLite, cada arquivo de cada tabela é uma tarefa
+            tasks = []
+            for table in tables:
+                if self.is_table_done(table):
+                    continue
+                ranges = [None]
+                if self.journal and self.journal.get_ranges(table):
+                    ranges = self.journal.get_ranges(table)  # Mesmos blocos da execução anterior
+                elif (self.mode != 'sync' and not self.fan_in and self.chunk_size
+                      and table_info[table]['count'] > self.chunk_size):
+                    ranges = self.get_rowid_ranges(table, table_info[table]['count'])
+                if len(ranges) > 1:
+                    print(f"  • {table}: dividida em {len(ranges)} blocos por rowid")
+                units = [(None, db_path) for db_path in self.sqlite_sources] if self.fan_in \
+                    else [(rowid_range, None) for rowid_range in ranges]
+                
+                pending = []
+                for rowid_range, source in units:
+                    if self.journal:
+                        self.journal.register(table, rowid_range, source)
+                        checkpoint = self.journal.get(table, rowid_range, source)
+                        if checkpoint['status'] == 'done':
+                            continue
+                    pending.append((rowid_range, source))
+                
+                if not pending:
+                    self.is_table_done(table, force=True)
+                    continue
+                self.table_results[table]['chunks'] = len(pending)
+                tasks.extend((table, rowid_range, source) for rowid_range, source in pending)
             
-            # Extrair tipos Oracle das colunas para conversão
-            oracle_types = []
-            for col in table_info[table]['columns']:
-                sqlite_type = col[2] if col[2] else 'TEXT'
-                oracle_type = self.map_sqlite_to_oracle_type(sqlite_type)
-                oracle_types.append(oracle_type)
+            # Maior tarefa primeiro: o pool consome as submissões em ordem
+            if self.schedule == 'largest':
+                costs = {}
+                for table, rowid_range, source in tasks:
+                    info = table_info[table]
+                    if source is not None:
+                        costs[(table, rowid_range, source)] = self.estimate_load_seconds(
+                            self.source_counts[(table, source)], info['row_bytes'])
+                    else:
+                        costs[(table, rowid_range, source)] = self.estimate_load_seconds(
+                            info['count'], info['row_bytes']) / self.table_results[table]['chunks']
+                tasks = schedule_largest_first(costs, self.workers)[0]
             
-            print(f"\n  [{idx}/{len(tables)}] {table} → {oracle_name} ({count:,} registros)")
+            print(f"  • Distribuindo {len(set(table for table, _, _ in tasks))} tabelas ({len(tasks)} tarefas) "
+                  f"entre {self.workers} workers")
+            try:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    futures = {
+                        executor.submit(self.migrate_table_task, table, oracle_types[table],
+                                        rowid_range, source): table
+                        for table, rowid_range, source in tasks
+                    }
+                    done = 0
+                    for future in as_completed(futures):
+                        table = futures[future]
+                        if not future.result():
+                            continue  # Ainda há blocos pendentes desta tabela
+                        done += 1
+                        with self._print_lock:
+                            print(f"  [{done}/{len(tables)}] {table} → {self.normalize_name(table)}: "
+                                  f"{self.format_table_result(table)}")
+                if self.commit_policy == 'end':
+                    self.finish_commit_at_end(tables)
+            finally:
+                self.release_worker_connections()
+        else:
+            for idx, table in enumerate(self.order_tables(tables, table_info), 1):
+                oracle_name = self.normalize_name(table)
+                count = table_info[table]['count']
+                
+                approx = '~' if table in self.estimated_counts else ''
+                print(f"\n  [{idx}/{len(tables)}] {table} → {oracle_name} ({approx}{count:,} registros)")
+                
+                if self.is_table_done(table):
+                    continue
+                
+                table_start = time.time()
+                ok = True
+                if self.fan_in:
+                    # Um arquivo por vez, todos pela mesma sessão Oracle
+                    units = [(None, db_path) for db_path in self.sqlite_sources]
+                else:
+                    # Blocos registrados por uma execução paralela anterior são retomados em sequência
+                    ranges = self.journal.get_ranges(table) if self.journal else []
+                    units = [(rowid_range, None) for rowid_range in ranges or [None]]
+                
+                for rowid_range, source in units:
+                    if self.journal:
+                        self.journal.register(table, rowid_range, source)
+                        if self.journal.get(table, rowid_range, source)['status'] == 'done':
+                            continue
+                    if self.mode == 'sync':
+                        ok = self.sync_table(table, oracle_types[table])
+                    elif source is not None:
+                        source_conn = self.open_sqlite_source(source)
+                        try:
+                            ok = self.migrate_table_data(table, oracle_types[table], source_conn,
+                                                         source=source) and ok
+                        finally:
+                            source_conn.close()
+                    else:
+                        ok = self.migrate_table_data(table, oracle_types[table], rowid_range=rowid_range) and ok
+                self.table_results[table]['elapsed'] = time.time() - table_start
+                self.table_results[table]['ok'] = ok
+                print(f" {self.format_table_result(table)}")
             
-            if self.migrate_table_data(table, oracle_types):
-                total_migrated += count
-            else:
-                print(f"    ✗ Falha na migração")
+            if self.commit_policy == 'end':
+                self.finish_commit_at_end(tables)
+        
+        # Contagens obtidas durante a transferência
+        self.catalog.save()
+        
+        loaded = [table for table in self.created_tables if self.table_results[table]['ok']]
+        if self.mode == 'swap':
+            # Tabelas já trocadas numa execução anterior (checkpoint) não têm mais staging
+            loaded = [table for table in loaded if self.oracle_table_exists(self.staging_tables[table])]
+        
+        built = []
+        if self.create_indexes:
+            built = self.create_deferred_indexes(loaded)
+        
+        if self.mode == 'swap':
+            self.swap_staging_tables(loaded, built)
+        
+        # Tabelas criadas NOLOGGING voltam a gerar redo após a carga
+        if self.load_profile == 'bulk' and self.nologging:
+            cursor = self.oracle_conn.cursor()
+            for table in tables:
+                try:
+                    cursor.execute(f"ALTER TABLE {self.normalize_name(table)} LOGGING")
+                except self.driver.DatabaseError:
+                    pass
         
         # Sumário final
         elapsed = time.time() - start_time
+        failed = [table for table in tables if not self.table_results[table]['ok']]
+        # Tabelas com falha ficam fora do total (registros já confirmados aparecem à parte)
+        total_migrated = sum(self.table_results[table]['rows'] for table in tables if table not in failed)
+        partial_rows = sum(self.table_results[table]['rows'] for table in failed)
+        
         print("\n" + "=" * 80)
-        print("MIGRAÇÃO CONCLUÍDA COM SUCESSO!")
+        if failed:
+            print("MIGRAÇÃO CONCLUÍDA COM FALHAS!")
+        else:
+            print("MIGRAÇÃO CONCLUÍDA COM SUCESSO!")
         print("=" * 80)
-        print(f"  • Tabelas migradas: {len(tables)}")
+        print(f"  • Tabelas migradas: {len(tables) - len(failed)}/{len(tables)}")
+        skipped = [table for table in tables if self.table_results[table].get('skipped')]
+        if skipped:
+            print(f"  • Tabelas já migradas (checkpoint): {len(skipped)}")
+        if failed:
+            print(f"  • Tabelas com falha: {', '.join(failed)}")
         print(f"  • Total de registros: {total_migrated:,}")
+        if partial_rows:
+            print(f"  • Registros confirmados em tabelas com falha: {partial_rows:,} (carga incompleta)")
+        date_failures = sum(sum(stats.get('date_failures', {}).values())
+                            for stats in self.table_results.values())
+        if date_failures:
+            print(f"  • Datas não reconhecidas: {date_failures:,} (enviadas como texto)")
+        rejected = sum(stats.get('rejected', 0) for stats in self.table_results.values())
+        if rejected:
+            print(f"  • Registros rejeitados pelo Oracle: {rejected:,} (em '{self.reject_dir}')")
         print(f"  • Tempo decorrido: {elapsed:.2f} segundos")
         if elapsed > 0:
-            print(f"  • Registros/segundo: {total_migrated/elapsed:,.0f}")
+            print(f"  • Registros/segundo: {total_migrated/elapsed:,.0f} [{self.describe_load_profile()}]")
         print("=" * 80)
         
-        return True
+        if self.verify_after_load:
+            return self.verify(tables, table_info, oracle_types) and not failed
+        return not failed
+    
+    def get_index_jobs(self, table_name: str, warn: bool = True) -> List[Dict[str, Any]]:
+        """Chave primária, UNIQUE e índices do SQLite a recriar no Oracle"""
+        info = self.catalog.tables[table_name]
+        oracle_table = self.normalize_name(table_name)
+        jobs, seen = [], set()
+        # Na staging os nomes levam o sufixo (nomes de índice e restrição são únicos no schema)
+        suffix = STAGING_SUFFIX if table_name in self.staging_tables else ''
+        # Com source_column, chaves e índices únicos valem dentro de cada arquivo de origem
+        key_prefix = [self.source_column] if self.source_column else []
+        
+        if info['primary_key']:
+            jobs.append({'table': table_name, 'name': f"{oracle_table}_PK{suffix}",
+                         'columns': key_prefix + info['primary_key'], 'unique': True,
+                         'constraint': 'PRIMARY KEY'})
+            seen.add(tuple(info['primary_key']))
+        
+        unique_seq = 0
+        for index in reversed(info['indexes']):
+            if index['expression'] or index['partial']:
+                if warn:
+                    self.log(f"⚠ Índice '{index['name']}' ignorado (expressão ou parcial)", table_name)
+                continue
+            if tuple(index['columns']) in seen:
+                continue  # Mesma lista de colunas já indexada
+            seen.add(tuple(index['columns']))
+            
+            if index['origin'] == 'u':
+                unique_seq += 1
+                name, constraint = f"{oracle_table}_UK{unique_seq}{suffix}", 'UNIQUE'
+            else:
+                name, constraint = f"{self.normalize_name(index['name'])}{suffix}", None
+            columns = key_prefix + index['columns'] if index['unique'] else index['columns']
+            jobs.append({'table': table_name, 'name': name, 'columns': columns,
+                         'unique': index['unique'], 'constraint': constraint})
+        return jobs
+    
+    def open_oracle_session(self):
+        """Abre uma sessão Oracle dedicada (mesmo DSN da conexão principal)"""
+        return self.driver.connect(self.config['ORACLE']['user'], self.config['ORACLE']['password'],
+                                   self.oracle_dsn)
+    
+    def create_deferred_indexes(self, tables: List[str]) -> List[Dict[str, Any]]:
+        """Cria PK, UNIQUE e índices depois da carga, com várias construções simultâneas
+        
+        Cada índice é construído com PARALLEL n NOLOGGING em sessão própria; em
+        seguida as restrições são adicionadas sobre os índices prontos (USING INDEX)
+        e os índices voltam a LOGGING NOPARALLEL. Retorna os índices construídos.
+        """
+        jobs = [job for table in tables for job in self.get_index_jobs(table)]
+        if not jobs:
+            return []
+        
+        print(f"\n  Criando {len(jobs)} índices/restrições "
+              f"(PARALLEL {self.index_parallel} NOLOGGING, {self.index_workers} simultâneos)...")
+        
+        local = threading.local()
+        sessions = []
+        
+        def build(job: Dict[str, Any]) -> Tuple[bool, float, str]:
+            if self.index_workers > 1:
+                if getattr(local, 'conn', None) is None:
+                    local.conn = self.open_oracle_session()
+                    with self._stats_lock:
+                        sessions.append(local.conn)
+                conn = local.conn
+            else:
+                conn = self.oracle_conn
+            
+            columns = ', '.join(self.normalize_name(col) for col in job['columns'])
+            sql = (f"CREATE {'UNIQUE ' if job['unique'] else ''}INDEX {job['name']} "
+                   f"ON {self.load_target(job['table'])} ({columns}) "
+                   f"PARALLEL {self.index_parallel} NOLOGGING")
+            if self.debug_mode:
+                self.log(f"SQL: {sql}", job['table'])
+            
+            started = time.time()
+            try:
+                conn.cursor().execute(sql)
+            except self.driver.DatabaseError as e:
+                error_obj, = e.args
+                return False, time.time() - started, error_obj.message
+            return True, time.time() - started, None
+        
+        built = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.index_workers) as executor:
+                futures = {executor.submit(build, job): job for job in jobs}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    ok, elapsed, error = future.result()
+                    label = f"{job['name']} ON {self.load_target(job['table'])} ({', '.join(job['columns'])})"
+                    self.metrics.add(job['table'], index=elapsed)
+                    if ok:
+                        built.append(job)
+                        self.log(f"✓ {label}: {elapsed:.2f}s")
+                    else:
+                        self.log(f"✗ {label}: {error}")
+        finally:
+            for conn in sessions:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+        
+        # Restrições sobre os índices já construídos e retorno ao modo normal
+        cursor = self.oracle_conn.cursor()
+        for job in built:
+            oracle_table = self.load_target(job['table'])
+            columns = ', '.join(self.normalize_name(col) for col in job['columns'])
+            try:
+                if job['constraint']:
+                    cursor.execute(f"ALTER TABLE {oracle_table} ADD CONSTRAINT {job['name']} "
+                                   f"{job['constraint']} ({columns}) USING INDEX {job['name']}")
+                    job['constrained'] = True
+                cursor.execute(f"ALTER INDEX {job['name']} LOGGING NOPARALLEL")
+            except self.driver.DatabaseError as e:
+                error_obj, = e.args
+                self.log(f"✗ {job['constraint'] or 'ALTER INDEX'} {job['name']}: {error_obj.message}")
+        return built
+    
+    def get_swap_dependents(self, oracle_table: str) -> Dict[str, List]:
+        """Grants, gatilhos e FKs de outras tabelas presos à tabela em uso
+        
+        Todos acompanham o objeto renomeado para _OLD, não o nome: sem isso a
+        staging assumiria o nome definitivo sem eles.
+        """
+        cursor = self.oracle_conn.cursor()
+        cursor.execute("SELECT grantee, privilege, grantable, NULL FROM user_tab_privs_made "
+                       "WHERE table_name = :t "
+                       "UNION ALL SELECT grantee, privilege, grantable, column_name FROM user_col_privs_made "
+                       "WHERE table_name = :t", {'t': oracle_table})
+        grants = cursor.fetchall()
+        cursor.execute("SELECT trigger_name FROM user_triggers WHERE table_name = :1", (oracle_table,))
+        triggers = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT c.table_name || '.' || c.constraint_name FROM user_constraints c "
+                       "JOIN user_constraints p ON p.owner = c.r_owner AND p.constraint_name = c.r_constraint_name "
+                       "WHERE c.constraint_type = 'R' AND p.table_name = :t AND c.table_name <> :t",
+                       {'t': oracle_table})
+        foreign_keys = [row[0] for row in cursor.fetchall()]
+        return {'grants': grants, 'triggers': triggers, 'foreign_keys': foreign_keys}
+    
+    def restore_swap_dependents(self, oracle_table: str, dependents: Dict[str, List]):
+        """Reaplica os grants na tabela trocada e lista o que não pode ser transferido"""
+        cursor = self.oracle_conn.cursor()
+        for grantee, privilege, grantable, column in dependents['grants']:
+            target = f"{privilege} ({column})" if column else privilege
+            option = " WITH GRANT OPTION" if grantable == 'YES' else ''
+            try:
+                cursor.execute(f"GRANT {target} ON {oracle_table} TO {grantee}{option}")
+            except self.driver.DatabaseError as e:
+                error_obj, = e.args
+                self.log(f"⚠ GRANT {target} ON {oracle_table} TO {grantee}: {error_obj.message}")
+        if dependents['grants']:
+            self.log(f"✓ {oracle_table}: {len(dependents['grants'])} grants reaplicados")
+        
+        if dependents['triggers']:
+            self.log(f"⚠ {oracle_table}: gatilhos não transferidos (recrie-os): "
+                     f"{', '.join(dependents['triggers'])}")
+        if dependents['foreign_keys']:
+            self.log(f"⚠ {oracle_table}: FKs de outras tabelas continuam apontando para a cópia "
+                     f"antiga (recrie-as): {', '.join(dependents['foreign_keys'])}")
+    
+    def swap_staging_tables(self, tables: List[str], indexes: List[Dict[str, Any]]):
+        """Troca cada tabela de staging pela definitiva (mode = swap)
+        
+        A tabela em uso é renomeada para <nome>_OLD e a staging assume o nome
+        definitivo: leitores ficam sem a tabela apenas entre os dois RENAME. Os
+        grants da tabela em uso são reaplicados; gatilhos e FKs de outras tabelas
+        ficam com a cópia antiga e são listados no log. A cópia antiga é
+        descartada (se o DROP falhar, fica como aviso) e os índices/restrições da
+        staging perdem o sufixo _STG. Se a troca falhar, a tabela em uso é
+        restaurada e a staging permanece para inspeção (é descartada na próxima
+        execução).
+        """
+        if not tables:
+            return
+        
+        print(f"\n  Trocando {len(tables)} tabelas de staging pelas definitivas...")
+        cursor = self.oracle_conn.cursor()
+        for table in tables:
+            oracle_table = self.normalize_name(table)
+            staging = self.staging_tables[table]
+            replaced = f"{oracle_table}{REPLACED_SUFFIX}"
+            try:
+                # Sobra de uma troca interrompida
+                if self.oracle_table_exists(replaced):
+                    cursor.execute(f"DROP TABLE {replaced} PURGE")
+                live = self.oracle_table_exists(oracle_table)
+                dependents = self.get_swap_dependents(oracle_table) if live else None
+                
+                started = time.time()
+                if live:
+                    cursor.execute(f"ALTER TABLE {oracle_table} RENAME TO {replaced}")
+                try:
+                    cursor.execute(f"ALTER TABLE {staging} RENAME TO {oracle_table}")
+                except self.driver.DatabaseError:
+                    if live:
+                        cursor.execute(f"ALTER TABLE {replaced} RENAME TO {oracle_table}")
+                    raise
+                window = time.time() - started
+            except self.driver.DatabaseError as e:
+                error_obj, = e.args
+                self.log(f"✗ {staging} → {oracle_table}: {error_obj.message}")
+                self.table_results[table]['ok'] = False
+                continue
+            self.log(f"✓ {staging} → {oracle_table}: indisponível por {window * 1000:.1f} ms")
+            
+            if live:
+                self.restore_swap_dependents(oracle_table, dependents)
+                # A troca já valeu: falhar aqui (ex.: FK de outra tabela) só deixa a cópia antiga
+                try:
+                    cursor.execute(f"DROP TABLE {replaced} PURGE")
+                except self.driver.DatabaseError as e:
+                    error_obj, = e.args
+                    self.log(f"⚠ {replaced} não descartada: {error_obj.message}")
+            
+            # Nomes definitivos liberados pelo DROP da cópia antiga
+            for job in indexes:
+                if job['table'] != table:
+                    continue
+                final_name = job['name'][:-len(STAGING_SUFFIX)]
+                try:
+                    if job.get('constrained'):
+                        cursor.execute(f"ALTER TABLE {oracle_table} RENAME CONSTRAINT {job['name']} "
+                                       f"TO {final_name}")
+                    cursor.execute(f"ALTER INDEX {job['name']} RENAME TO {final_name}")
+                except self.driver.DatabaseError as e:
+                    error_obj, = e.args
+                    self.log(f"✗ RENAME {job['name']}: {error_obj.message}")
+    
+    def finish_commit_at_end(self, tables: List[str]):
+        """Commit único no final: confirma tudo ou, se alguma tabela falhou, desfaz tudo"""
+        if all(self.table_results[table]['ok'] for table in tables):
+            self.finish_transactions(commit=True)
+            if self.journal:
+                for table in tables:
+                    self.journal.save(table, None, 'done', None, self.table_results[table]['rows'])
+            print(f"  ✓ Commit final realizado")
+            return
+        
+        self.finish_transactions(commit=False)
+        for table in tables:
+            self.table_results[table]['rows'] = 0
+            self.table_results[table]['ok'] = False
+        print(f"  ✗ Falha com commit_interval = end: todas as cargas foram desfeitas (rollback)")
     
     def close_connections(self):
         """Fecha conexões"""
+        for reader in self._snapshot_readers:
+            reader.close()
+        self._snapshot_readers = []
         if self.sqlite_conn:
             self.sqlite_conn.close()
+        if self.journal:
+            self.journal.close()
+        for writer in self._reject_writers.values():
+            writer.close()
+        if self.async_writer:
+            self.async_writer.close()
+        if self.oracle_pool:
+            self.oracle_pool.close()
         if self.oracle_conn:
             self.oracle_conn.close()
     
@@ -630,13 +4449,38 @@ class MigrationTool:
         try:
             if not self.load_config():
                 return False
+            self.metrics.start_periodic()
             
             if not self.connect_sqlite():
                 return False
             
+            if self.plan_only:
+                # Oracle só para a sonda de envio (opcional); nada é criado nem gravado
+                if not self.connect_oracle():
+                    print("  ⚠ Plano sem conexão Oracle: estimativa só de leitura e conversão")
+                return self.plan()
+            
+            if self.export_only:
+                return self.export()
+            
+            if self.verify_only:
+                # Só leitura dos dois lados: sem checkpoint nem escrita assíncrona
+                if not self.connect_oracle() or not self.create_oracle_pool():
+                    return False
+                return self.verify()
+            
+            if not self.open_journal():
+                return False
+            
             if not self.connect_oracle():
                 return False
             
+            if not self.create_oracle_pool():
+                return False
+            
+            if not self.create_async_writer():
+                return False
+            
             success = self.migrate()
             
             return success
@@ -651,14 +4495,55 @@ class MigrationTool:
                 traceback.print_exc()
             return False
         finally:
+            self.metrics.stop()
             self.close_connections()
 
 
+def run_profiled(tool: MigrationTool, mode: str) -> bool:
+    """Executa a migração sob cProfile ou tracemalloc e grava o resultado"""
+    if mode == 'tracemalloc':
+        import tracemalloc
+        output = 'migration_tracemalloc.txt'
+        tracemalloc.start(25)
+        try:
+            return tool.run()
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            with open(output, 'w', encoding='utf-8') as profile_fp:
+                profile_fp.write(f"Pico de memória rastreada: {peak / 1024 / 1024:,.1f} MB\n\n")
+                for stat in snapshot.statistics('lineno')[:50]:
+                    profile_fp.write(f"{stat}\n")
+            print(f"\n✓ Perfil de memória (tracemalloc) gravado em {output}")
+    
+    import cProfile
+    import pstats
+    output = 'migration_profile.prof'
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(tool.run)
+    finally:
+        profiler.dump_stats(output)
+        print(f"\n✓ Perfil de CPU (cProfile) gravado em {output} - funções mais custosas:")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+
+
 def create_sample_config():
     """Cria arquivo de configuração de exemplo"""
     config_content = """[SQLITE]
-# Caminho para o arquivo SQLite
+# Caminho para o arquivo SQLite (ou glob/lista de arquivos com o mesmo esquema,
+# ex.: sites/*.db, carregados simultaneamente nas mesmas tabelas)
 database = data.db
+# Coluna com o arquivo de origem de cada registro (vazio = desativada)
+# source_column = ORIGEM
+# Perfil de leitura: mode=ro, immutable=1, PRAGMA mmap_size/cache_size e
+# snapshot único entre tabelas e workers (auto = só em bancos WAL)
+read_only = true
+immutable = false
+mmap_size = 268435456
+cache_size = -65536
+snapshot = auto
 
 [ORACLE]
 # Configurações de conexão Oracle
@@ -679,13 +4564,20 @@ service_name = XEPDB1
 # Exemplos: XE, ORCL
 # sid = XE
 
+# Driver: auto (cx_Oracle; na falta dele, python-oracledb), cx_oracle ou
+# oracledb (modo thin: dispensa o Oracle Instant Client)
+driver = auto
+
 # Como descobrir qual usar:
 # 1. SQL*Plus: SELECT value FROM v$parameter WHERE name = 'service_names';
 # 2. Listener: lsnrctl status
 # 3. tnsnames.ora: Procure SERVICE_NAME ou SID
 
 [MIGRATION]
-# Modo de migração: 'append' (adicionar) ou 'truncate' (recriar)
+# Modo de migração: 'append' (adicionar), 'truncate' (recriar), 'swap'
+# (recarrega em <TABELA>_STG e troca pela tabela em uso ao final, reaplicando
+# os GRANTs; gatilhos e FKs de outras tabelas são listados para recriar) ou
+# 'sync' (reenvia apenas os blocos alterados, comparando hashes)
 mode = truncate
 
 # Normalizar nomes (substituir espaços por underscores)
@@ -694,10 +4586,113 @@ normalize_names = true
 # Tamanho do lote para inserções
 batch_size = 1000
 
+# Lote adaptativo: batch_size passa a ser só o tamanho inicial; o lote de cada
+# tabela é limitado a batch_memory bytes (largura estimada nas primeiras
+# linhas) e ajustado pela vazão medida para levar ~batch_latency segundos
+adaptive_batch = false
+batch_memory = 16777216
+batch_latency = 0.5
+
+# Número de workers paralelos (tabelas migradas simultaneamente)
+# Cada worker usa sua própria conexão SQLite (somente leitura) e
+# sua própria sessão Oracle (SessionPool)
+# 1 = sequencial (padrão)
+workers = 1
+
+# Tabelas com mais registros que chunk_size são divididas em faixas de
+# rowid carregadas em paralelo pelos workers (requer workers > 1)
+# 0 = desativado (padrão)
+chunk_size = 0
+
+# Cache LRU (por coluna) de datas já convertidas; 0 = desativado
+date_cache_size = 4096
+
+# Perfil de colunas: varre cada tabela (max(length) e classes de
+# armazenamento) para gerar VARCHAR2/NUMBER exatos e chamar
+# setinputsizes antes do executemany (permite batch_size bem maior)
+profile_columns = false
+
+# Pipeline: leitura do SQLite, conversão e escrita no Oracle em threads
+# separadas, ligadas por filas limitadas (pipeline_queue_size lotes)
+pipeline = false
+pipeline_queue_size = 4
+
+# Escrita assíncrona (driver = oracledb): até async_depth lotes por tabela em
+# voo ao mesmo tempo, cada um gravado e confirmado na sua conexão; esconde a
+# latência de rede em links distantes. 1 = desativada
+async_depth = 1
+
+# Perfil de carga: 'conventional' ou 'bulk' (bulk exige mode = truncate ou swap)
+# bulk usa /*+ APPEND_VALUES */ (append_hint) e cria tabelas NOLOGGING (nologging)
+load_profile = conventional
+append_hint = true
+nologging = true
+
+# Commit: N (a cada N lotes), 'table' (um por tabela) ou 'end' (um no final)
+# Com APPEND_VALUES o commit é sempre feito a cada lote
+commit_interval = 1
+
+# Checkpoint: grava o progresso em um arquivo SQLite local para permitir
+# retomar com --resume (tabelas concluídas são puladas; parciais continuam
+# a partir do último rowid confirmado)
+checkpoint = false
+checkpoint_file = migration_checkpoint.db
+
+# Cache do catálogo do esquema SQLite (vazio = desativado; ex: migration_schema.json)
+schema_cache =
+# Contagem da análise: exact (COUNT(*)) ou estimate (sqlite_stat1/max(rowid))
+row_count = exact
+
+# Chave primária, UNIQUE e índices do SQLite criados após a carga
+create_indexes = true
+index_parallel = 4
+index_workers = 2
+
+# Métricas por tabela e fase (vazio desativa); formato jsonl ou prometheus
+metrics_file =
+metrics_format = jsonl
+metrics_interval = 0
+
+# Registros rejeitados pelo Oracle (executemany com batcherrors)
+batch_errors = true
+max_errors = 1000
+reject_format = csv
+reject_dir = rejects
+
+# LOBs copiados em blocos (auto, true ou false) e tamanho do bloco em bytes;
+# ativo, também converte em CLOB as colunas TEXT com valores acima de 4000 bytes
+lob_streaming = auto
+lob_chunk_size = 1048576
+# Ordem de carga: largest (maior tabela primeiro) ou catalog (ordem do SQLite)
+schedule = largest
+# Registros por tabela na sonda de vazão do --plan
+plan_sample_rows = 2000
+
+# Exportação (--export): arquivos delimitados + .ctl (SQL*Loader) + .sql
+# (tabela externa) por tabela, sem conexão Oracle; um arquivo por faixa de
+# chunk_size registros (1000000 se chunk_size = 0)
+export_dir = export
+export_compress = gzip
+export_oracle_dir = MIGRATION_DIR
+export_exec_dir = EXEC_DIR
+
+# Conferência SQLite × Oracle por blocos da chave ao final da carga (ou só ela,
+# com --verify) e CSV com as faixas que diferem
+verify = false
+verify_report = migration_verify.csv
+
 # Modo debug (exibe informações detalhadas de tipos e SQL)
 # true = mostra mapeamento de tipos e comandos SQL
 # false = modo normal (recomendado)
 debug_mode = false
+
+# Regras próprias de mapeamento de tipos (opcional), aplicadas antes das padrão
+# <tipo declarado> = <tipo Oracle>  (expressão regular; \\1, \\2 = grupos)
+# <tabela>.<coluna> = <tipo Oracle> (tipo fixo da coluna)
+# [TYPE_MAPPING]
+# bool = CHAR(1)
+# varchar\\((\\d+)\\) = NVARCHAR2(\\1)
+# clientes.observacoes = CLOB
 """
     
     with open('migration.cfg', 'w', encoding='utf-8') as f:
@@ -724,8 +4719,18 @@ if __name__ == "__main__":
         create_sample_config()
         sys.exit(0)
     
-    tool = MigrationTool()
-    success = tool.run()
+    # --profile (cProfile) ou --profile=tracemalloc
+    profile_mode = None
+    for arg in sys.argv[1:]:
+        if arg == '--profile' or arg.startswith('--profile='):
+            profile_mode = arg.partition('=')[2] or 'cprofile'
+    if profile_mode not in (None, 'cprofile', 'tracemalloc'):
+        print(f"ERRO: --profile inválido '{profile_mode}' (use --profile ou --profile=tracemalloc)")
+        sys.exit(1)
+    
+    tool = MigrationTool(resume='--resume' in sys.argv[1:], plan_only='--plan' in sys.argv[1:],
+                         export_only='--export' in sys.argv[1:], verify_only='--verify' in sys.argv[1:])
+    success = run_profiled(tool, profile_mode) if profile_mode else tool.run()
     sys.exit(0 if success else 1)
 
 ## EOP => End Of Program 